@@ -1,22 +1,37 @@
+from rnv3_startup import startup_profile, enabled as startup_profile_enabled  # Paling awal, lihat rnv3_startup
 from PyQt5 import QtWidgets, QtCore, QtGui, sip 
 from PyQt5.QtGui import QFont, QColor, QDesktopServices
 from PyQt5.QtCore import QTimer, QEvent, Qt, QUrl
-from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
 from PyQt5.QtWidgets import QApplication, QWidget, QPushButton, QMessageBox, QFileDialog, QTextEdit, QInputDialog, QDialog, QVBoxLayout, QHBoxLayout, QListWidget
 import sys
 import time
-import asyncio
-import threading
 import re
 import ctypes
 from ctypes import wintypes
-
-# Load DLL untuk API Windows
-dwmapi = ctypes.WinDLL('dwmapi')
+from rnv3_protocol import (StreamWindow, AckTracker, STREAM_WINDOW_DEFAULT, expects_ok, ack_timeout_ms,
+                           classify_line, MSG_OK, MSG_POSITION, MSG_SERVO_SETUP, MSG_HOMING_COMPLETE,
+                           MSG_READY_CALIBRATION, MSG_STOP, MSG_S1_ON, MSG_S1_OFF, MSG_S2_ON, MSG_S2_OFF,
+                           MSG_S3_ON, MSG_S3_OFF, MSG_RAIL_ON, MSG_RAIL_OFF, MSG_PROTOCOL)
+from rnv3_serial import SerialLink, start_io_thread
+from rnv3_baud import BAUD_DEFAULT, BaudNegotiator, requested_baud, format_throughput
+from rnv3_console import ConsoleBuffer, verbose_enabled
+from rnv3_animation import AnimationClock
+from rnv3_ports import PortWatcher
+from rnv3_style import (STYLESHEET_UTAMA, set_gaya, GAYA_TOMBOL_BESAR, GAYA_TOMBOL, GAYA_TOMBOL_SIMPAN,
+                        GAYA_TOMBOL_TOGGLE, GAYA_TOMBOL_SENSOR, GAYA_SLIDER, GAYA_SPINBOX, GAYA_LABEL,
+                        set_warna, WARNA_NORMAL, WARNA_KUNING, WARNA_MERAH, WARNA_UNGU)
+from rnv3_program import (ProgramLine, parse_program_file, format_program_file, compile_plan,
+                          last_acked_step, CycleStats,
+                          UI_SERVO, UI_VACUM, UI_LG1, UI_LG2, UI_LG3)
+
+# Load DLL untuk API Windows, None di sistem lain (benchmark/emulator di Linux)
+dwmapi = ctypes.WinDLL('dwmapi') if sys.platform == "win32" else None
+startup_profile.mark("import modul")
 
 # Definisi konstanta dan struktur
 DWMWA_USE_IMMERSIVE_DARK_MODE = 20
 DWMWA_CAPTION_COLOR = 35
+PERKIRAAN_JEDA_MS = 300  # Jeda setelah program diedit sebelum perkiraan waktu siklus dihitung ulang
 
 
 class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
@@ -29,10 +44,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
 
         # Konten utama
         self.centralwidget = QtWidgets.QWidget(RUSKOMPONEN_BOT)
-        self.centralwidget.setStyleSheet("QWidget#centralwidget {\n"
-                                         "    background-color: #2B2B2B; /* Latar belakang hitam keabu-abuan */\n"
-                                         "}\n"
-                                         "")
+        self.centralwidget.setStyleSheet(STYLESHEET_UTAMA)  # Di-parse sekali untuk semua widget
         self.centralwidget.setObjectName("centralwidget")
         self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
         self.gridLayout.setObjectName("gridLayout")
@@ -63,61 +75,11 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_star.setFont(font)
-        self.pushButton_star.setStyleSheet("QPushButton {\n"
-                                           "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                           "    color: #ECEFF4; /* Warna teks */\n"
-                                           "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                           "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                           "    padding: 5px; /* Padding di dalam tombol */\n"
-                                           "    font-size: 18px; /* Ukuran font */\n"
-                                           "    font-weight: bold; /* Ketebalan font */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:hover {\n"
-                                           "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:pressed {\n"
-                                           "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                           "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:disabled {\n"
-                                           "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                           "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                           "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                           "}")
+        set_gaya(self.pushButton_star, GAYA_TOMBOL_BESAR)
         self.pushButton_star.setObjectName("pushButton_star")
         self.horizontalLayout.addWidget(self.pushButton_star)
         self.pushButton_pause = QtWidgets.QPushButton(self.frame_portUSB)
-        self.pushButton_pause.setStyleSheet("QPushButton {\n"
-                                            "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                            "    color: #ECEFF4; /* Warna teks */\n"
-                                            "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                            "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                            "    padding: 5px; /* Padding di dalam tombol */\n"
-                                            "    font-size: 18px; /* Ukuran font */\n"
-                                            "    font-weight: bold; /* Ketebalan font */\n"
-                                            "}\n"
-                                            "\n"
-                                            "QPushButton:hover {\n"
-                                            "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                            "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                            "}\n"
-                                            "\n"
-                                            "QPushButton:pressed {\n"
-                                            "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                            "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                            "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                            "}\n"
-                                            "\n"
-                                            "QPushButton:disabled {\n"
-                                            "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                            "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                            "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                            "}")
+        set_gaya(self.pushButton_pause, GAYA_TOMBOL_BESAR)
         self.pushButton_pause.setObjectName("pushButton_pause")
         self.horizontalLayout.addWidget(self.pushButton_pause)
         self.pushButton_stop = QtWidgets.QPushButton(self.frame_portUSB)
@@ -128,32 +90,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_stop.setFont(font)
-        self.pushButton_stop.setStyleSheet("QPushButton {\n"
-                                           "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                           "    color: #ECEFF4; /* Warna teks */\n"
-                                           "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                           "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                           "    padding: 5px; /* Padding di dalam tombol */\n"
-                                           "    font-size: 18px; /* Ukuran font */\n"
-                                           "    font-weight: bold; /* Ketebalan font */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:hover {\n"
-                                           "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:pressed {\n"
-                                           "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                           "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:disabled {\n"
-                                           "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                           "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                           "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                           "}")
+        set_gaya(self.pushButton_stop, GAYA_TOMBOL_BESAR)
         self.pushButton_stop.setObjectName("pushButton_stop")
         self.horizontalLayout.addWidget(self.pushButton_stop)
         self.pushButton_save_as = QtWidgets.QPushButton(self.frame_portUSB)
@@ -163,32 +100,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_save_as.setFont(font)
-        self.pushButton_save_as.setStyleSheet("QPushButton {\n"
-                                              "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                              "    color: #ECEFF4; /* Warna teks */\n"
-                                              "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                              "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                              "    padding: 5px; /* Padding di dalam tombol */\n"
-                                              "    font-size: 18px; /* Ukuran font */\n"
-                                              "    font-weight: bold; /* Ketebalan font */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:hover {\n"
-                                              "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                              "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:pressed {\n"
-                                              "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                              "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                              "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:disabled {\n"
-                                              "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                              "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                              "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.pushButton_save_as, GAYA_TOMBOL_BESAR)
         self.pushButton_save_as.setObjectName("pushButton_save_as")
         self.horizontalLayout.addWidget(self.pushButton_save_as)
         self.label_port_usb = QtWidgets.QLabel(self.frame_portUSB)
@@ -213,44 +125,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_sambungkan.setFont(font)
-        self.pushButton_sambungkan.setStyleSheet("QPushButton {\n"
-                                                 "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                 "    color: #ECEFF4; /* Warna teks */\n"
-                                                 "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                 "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                 "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                 "    font-size: 18px; /* Ukuran font */\n"
-                                                 "    font-weight: bold; /* Ketebalan font */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:hover {\n"
-                                                 "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:pressed {\n"
-                                                 "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                 "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:checked {\n"
-                                                 "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                 "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                 "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:checked:hover {\n"
-                                                 "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                 "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:disabled {\n"
-                                                 "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                 "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                 "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                 "}")
+        set_gaya(self.pushButton_sambungkan, GAYA_TOMBOL_BESAR)
         self.pushButton_sambungkan.setObjectName("pushButton_sambungkan")
         self.horizontalLayout.addWidget(self.pushButton_sambungkan)
         self.lineEdit_com = QtWidgets.QLineEdit(self.frame_portUSB)
@@ -295,13 +170,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         font.setBold(True)
         font.setWeight(75)
         self.label_status.setFont(font)
-        self.label_status.setStyleSheet("QLabel#label_status {\n"
-                                        "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                        "}\n"
-                                        "QLabel#label_status:disabled {\n"
-                                        "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                        "}\n"
-                                        "")
+        set_gaya(self.label_status, GAYA_LABEL)
         self.label_status.setAlignment(
             QtCore.Qt.AlignRight | QtCore.Qt.AlignTrailing | QtCore.Qt.AlignVCenter)
         self.label_status.setObjectName("label_status")
@@ -313,32 +182,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_calibration.setFont(font)
-        self.pushButton_calibration.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 18px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_calibration, GAYA_TOMBOL_BESAR)
         self.pushButton_calibration.setObjectName("pushButton_calibration")
         self.horizontalLayout.addWidget(self.pushButton_calibration)
         self.gridLayout.addWidget(self.frame_portUSB, 0, 0, 1, 1)
@@ -349,7 +193,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         self.frame_bawah.setObjectName("frame_bawah")
         self.horizontalLayout_2 = QtWidgets.QHBoxLayout(self.frame_bawah)
         self.horizontalLayout_2.setObjectName("horizontalLayout_2")
-        self.listWidget_save = QtWidgets.QListWidget(self.frame_bawah)
+        self.listWidget_save = QtWidgets.QListView(self.frame_bawah)
         self.listWidget_save.setEnabled(True)
         self.listWidget_save.setMinimumSize(QtCore.QSize(0, 0))
         self.listWidget_save.setMaximumSize(QtCore.QSize(400, 16777215))
@@ -363,7 +207,7 @@ class Ui_RUSKOMPONEN_BOT(QtWidgets.QWidget):
         self.listWidget_save.setAcceptDrops(False)
         self.listWidget_save.setAutoFillBackground(False)
         self.listWidget_save.setStyleSheet("""
-QListWidget {
+QListView {
     background-color: #2E3440; /* Warna latar belakang */
     border: 2px solid #1B5E20; /* Warna border */
     border-radius: 10px; /* Sudut melengkung */
@@ -372,30 +216,30 @@ QListWidget {
     padding: 5px; /* Padding di dalam list */
 }
 
-QListWidget::item {
+QListView::item {
     background-color: #3B4252; /* Warna latar belakang item */
     border-radius: 5px; /* Sudut melengkung untuk item */
     padding: 0px; /* Padding di dalam item */
     margin: 1px; /* Jarak antar item */
 }
 
-QListWidget::item:hover {
+QListView::item:hover {
     background-color: #4C566A; /* Warna latar belakang saat hover */
     color: #8FBCBB; /* Warna teks saat hover */
 }
 
-QListWidget::item:selected {
+QListView::item:selected {
     background-color: #81A1C1; /* Warna latar belakang saat dipilih */
     color: #2E3440; /* Warna teks saat dipilih */
 }
 
-QListWidget:disabled {
+QListView:disabled {
     background-color: #3B4252; /* Warna latar belakang saat dinonaktifkan */
     color: #7F8C9A; /* Warna teks saat dinonaktifkan */
     border: 2px solid #3B4252; /* Warna border saat dinonaktifkan */
 }
 
-QListWidget::item:disabled {
+QListView::item:disabled {
     background-color: #2E3440; /* Warna latar belakang item saat dinonaktifkan */
     color: #5C677D; /* Warna teks item saat dinonaktifkan */
 }
@@ -460,18 +304,13 @@ QScrollBar::sub-page:horizontal {
         self.listWidget_save.setDragDropOverwriteMode(False)
         self.listWidget_save.setAlternatingRowColors(False)
         self.listWidget_save.setProperty("isWrapping", False)
-        self.listWidget_save.setUniformItemSizes(False)
+        self.listWidget_save.setUniformItemSizes(True)  # Program ribuan baris tanpa mengukur tiap baris
         self.listWidget_save.setWordWrap(False)
         self.listWidget_save.setSelectionRectVisible(False)
         self.listWidget_save.setObjectName("listWidget_save")
-        item = QtWidgets.QListWidgetItem()
-        self.listWidget_save.addItem(item)
-        item = QtWidgets.QListWidgetItem()
-        self.listWidget_save.addItem(item)
-        item = QtWidgets.QListWidgetItem()
-        self.listWidget_save.addItem(item)
-        item = QtWidgets.QListWidgetItem()
-        self.listWidget_save.addItem(item)
+        # Program disimpan di model sebagai baris yang sudah diparse, bukan teks item widget
+        self.program_model = ProgramListModel(self.listWidget_save)
+        self.listWidget_save.setModel(self.program_model)
         self.horizontalLayout_2.addWidget(self.listWidget_save)
         self.frame_3 = QtWidgets.QFrame(self.frame_bawah)
         self.frame_3.setEnabled(True)
@@ -488,13 +327,7 @@ QScrollBar::sub-page:horizontal {
         font.setUnderline(False)
         font.setWeight(75)
         self.label_8.setFont(font)
-        self.label_8.setStyleSheet("QLabel#label_8 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_8:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_8, GAYA_LABEL)
         self.label_8.setAlignment(QtCore.Qt.AlignCenter)
         self.label_8.setObjectName("label_8")
         self.verticalLayout_6.addWidget(self.label_8)
@@ -538,32 +371,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_next.setFont(font)
-        self.pushButton_next.setStyleSheet("QPushButton {\n"
-                                           "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                           "    color: #ECEFF4; /* Warna teks */\n"
-                                           "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                           "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                           "    padding: 5px; /* Padding di dalam tombol */\n"
-                                           "    font-size: 14px; /* Ukuran font */\n"
-                                           "    font-weight: bold; /* Ketebalan font */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:hover {\n"
-                                           "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:pressed {\n"
-                                           "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                           "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:disabled {\n"
-                                           "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                           "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                           "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                           "}")
+        set_gaya(self.pushButton_next, GAYA_TOMBOL)
         self.pushButton_next.setObjectName("pushButton_next")
         self.verticalLayout_6.addWidget(self.pushButton_next)
         self.pushButton_new = QtWidgets.QPushButton(self.frame_3)
@@ -572,32 +380,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_new.setFont(font)
-        self.pushButton_new.setStyleSheet("QPushButton {\n"
-                                          "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                          "    color: #ECEFF4; /* Warna teks */\n"
-                                          "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                          "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                          "    padding: 5px; /* Padding di dalam tombol */\n"
-                                          "    font-size: 14px; /* Ukuran font */\n"
-                                          "    font-weight: bold; /* Ketebalan font */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:hover {\n"
-                                          "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:pressed {\n"
-                                          "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                          "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:disabled {\n"
-                                          "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                          "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                          "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                          "}")
+        set_gaya(self.pushButton_new, GAYA_TOMBOL)
         self.pushButton_new.setObjectName("pushButton_new")
         self.verticalLayout_6.addWidget(self.pushButton_new)
         self.pushButton_delete = QtWidgets.QPushButton(self.frame_3)
@@ -606,32 +389,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_delete.setFont(font)
-        self.pushButton_delete.setStyleSheet("QPushButton {\n"
-                                             "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                             "    color: #ECEFF4; /* Warna teks */\n"
-                                             "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                             "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                             "    padding: 5px; /* Padding di dalam tombol */\n"
-                                             "    font-size: 14px; /* Ukuran font */\n"
-                                             "    font-weight: bold; /* Ketebalan font */\n"
-                                             "}\n"
-                                             "\n"
-                                             "QPushButton:hover {\n"
-                                             "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                             "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                             "}\n"
-                                             "\n"
-                                             "QPushButton:pressed {\n"
-                                             "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                             "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                             "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                             "}\n"
-                                             "\n"
-                                             "QPushButton:disabled {\n"
-                                             "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                             "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                             "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                             "}")
+        set_gaya(self.pushButton_delete, GAYA_TOMBOL)
         self.pushButton_delete.setObjectName("pushButton_delete")
         self.verticalLayout_6.addWidget(self.pushButton_delete)
         self.pushButton_clear = QtWidgets.QPushButton(self.frame_3)
@@ -640,66 +398,25 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_clear.setFont(font)
-        self.pushButton_clear.setStyleSheet("QPushButton {\n"
-                                            "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                            "    color: #ECEFF4; /* Warna teks */\n"
-                                            "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                            "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                            "    padding: 5px; /* Padding di dalam tombol */\n"
-                                            "    font-size: 14px; /* Ukuran font */\n"
-                                            "    font-weight: bold; /* Ketebalan font */\n"
-                                            "}\n"
-                                            "\n"
-                                            "QPushButton:hover {\n"
-                                            "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                            "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                            "}\n"
-                                            "\n"
-                                            "QPushButton:pressed {\n"
-                                            "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                            "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                            "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                            "}\n"
-                                            "\n"
-                                            "QPushButton:disabled {\n"
-                                            "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                            "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                            "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                            "}")
+        set_gaya(self.pushButton_clear, GAYA_TOMBOL)
         self.pushButton_clear.setObjectName("pushButton_clear")
         self.verticalLayout_6.addWidget(self.pushButton_clear)
+        self.pushButton_optimasi = QtWidgets.QPushButton(self.frame_3)
+        font = QtGui.QFont()
+        font.setPointSize(-1)
+        font.setBold(True)
+        font.setWeight(75)
+        self.pushButton_optimasi.setFont(font)
+        set_gaya(self.pushButton_optimasi, GAYA_TOMBOL)
+        self.pushButton_optimasi.setObjectName("pushButton_optimasi")
+        self.verticalLayout_6.addWidget(self.pushButton_optimasi)
         self.pushButton_up = QtWidgets.QPushButton(self.frame_3)
         font = QtGui.QFont()
         font.setPointSize(-1)
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_up.setFont(font)
-        self.pushButton_up.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}\n"
-                                         "\n"
-                                         "QPushButton:hover {\n"
-                                         "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                         "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                         "}\n"
-                                         "\n"
-                                         "QPushButton:pressed {\n"
-                                         "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                         "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                         "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                         "}\n"
-                                         "\n"
-                                         "QPushButton:disabled {\n"
-                                         "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                         "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                         "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                         "}")
+        set_gaya(self.pushButton_up, GAYA_TOMBOL)
         self.pushButton_up.setObjectName("pushButton_up")
         self.verticalLayout_6.addWidget(self.pushButton_up)
         self.pushButton_dwon = QtWidgets.QPushButton(self.frame_3)
@@ -708,32 +425,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_dwon.setFont(font)
-        self.pushButton_dwon.setStyleSheet("QPushButton {\n"
-                                           "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                           "    color: #ECEFF4; /* Warna teks */\n"
-                                           "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                           "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                           "    padding: 5px; /* Padding di dalam tombol */\n"
-                                           "    font-size: 14px; /* Ukuran font */\n"
-                                           "    font-weight: bold; /* Ketebalan font */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:hover {\n"
-                                           "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:pressed {\n"
-                                           "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                           "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:disabled {\n"
-                                           "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                           "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                           "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                           "}")
+        set_gaya(self.pushButton_dwon, GAYA_TOMBOL)
         self.pushButton_dwon.setObjectName("pushButton_dwon")
         self.verticalLayout_6.addWidget(self.pushButton_dwon)
         self.label_9 = QtWidgets.QLabel(self.frame_3)
@@ -743,13 +435,7 @@ QScrollBar::sub-page:horizontal {
         font.setUnderline(False)
         font.setWeight(75)
         self.label_9.setFont(font)
-        self.label_9.setStyleSheet("QLabel#label_9 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_9:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_9, GAYA_LABEL)
         self.label_9.setAlignment(QtCore.Qt.AlignCenter)
         self.label_9.setObjectName("label_9")
         self.verticalLayout_6.addWidget(self.label_9)
@@ -759,44 +445,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_gripper_vacum.setFont(font)
-        self.pushButton_gripper_vacum.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_gripper_vacum, GAYA_TOMBOL_TOGGLE)
         self.pushButton_gripper_vacum.setObjectName("pushButton_gripper_vacum")
         self.verticalLayout_6.addWidget(self.pushButton_gripper_vacum)
         self.pushButton_gripper_servo = QtWidgets.QPushButton(self.frame_3)
@@ -805,44 +454,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_gripper_servo.setFont(font)
-        self.pushButton_gripper_servo.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_gripper_servo, GAYA_TOMBOL_TOGGLE)
         self.pushButton_gripper_servo.setObjectName("pushButton_gripper_servo")
         self.verticalLayout_6.addWidget(self.pushButton_gripper_servo)
         self.pushButton_save_servo = QtWidgets.QPushButton(self.frame_3)
@@ -851,32 +463,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_save_servo.setFont(font)
-        self.pushButton_save_servo.setStyleSheet("QPushButton {\n"
-                                                 "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                 "    color: #ECEFF4; /* Warna teks */\n"
-                                                 "    border: 2px solid #FFC107  ; /* Warna border */\n"
-                                                 "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                 "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                 "    font-size: 14px; /* Ukuran font */\n"
-                                                 "    font-weight: bold; /* Ketebalan font */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:hover {\n"
-                                                 "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:pressed {\n"
-                                                 "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                 "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:disabled {\n"
-                                                 "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                 "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                 "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                 "}")
+        set_gaya(self.pushButton_save_servo, GAYA_TOMBOL_SIMPAN)
         self.pushButton_save_servo.setObjectName("pushButton_save_servo")
         self.verticalLayout_6.addWidget(self.pushButton_save_servo)
         self.label_10 = QtWidgets.QLabel(self.frame_3)
@@ -886,13 +473,7 @@ QScrollBar::sub-page:horizontal {
         font.setUnderline(False)
         font.setWeight(75)
         self.label_10.setFont(font)
-        self.label_10.setStyleSheet("QLabel#label_10 {\n"
-                                    "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                    "}\n"
-                                    "QLabel#label_10:disabled {\n"
-                                    "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                    "}\n"
-                                    "")
+        set_gaya(self.label_10, GAYA_LABEL)
         self.label_10.setAlignment(QtCore.Qt.AlignCenter)
         self.label_10.setObjectName("label_10")
         self.verticalLayout_6.addWidget(self.label_10)
@@ -902,44 +483,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_LG1.setFont(font)
-        self.pushButton_LG1.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_LG1, GAYA_TOMBOL_TOGGLE)
         self.pushButton_LG1.setObjectName("pushButton_LG1")
         self.verticalLayout_6.addWidget(self.pushButton_LG1)
         self.pushButton_LG2 = QtWidgets.QPushButton(self.frame_3)
@@ -948,44 +492,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_LG2.setFont(font)
-        self.pushButton_LG2.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_LG2, GAYA_TOMBOL_TOGGLE)
         self.pushButton_LG2.setObjectName("pushButton_LG2")
         self.verticalLayout_6.addWidget(self.pushButton_LG2)
         self.pushButton_LG3 = QtWidgets.QPushButton(self.frame_3)
@@ -994,44 +501,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_LG3.setFont(font)
-        self.pushButton_LG3.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_LG3, GAYA_TOMBOL_TOGGLE)
         self.pushButton_LG3.setObjectName("pushButton_LG3")
         self.verticalLayout_6.addWidget(self.pushButton_LG3)
         self.pushButton_save_LG = QtWidgets.QPushButton(self.frame_3)
@@ -1040,32 +510,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_save_LG.setFont(font)
-        self.pushButton_save_LG.setStyleSheet("QPushButton {\n"
-                                              "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                              "    color: #ECEFF4; /* Warna teks */\n"
-                                              "    border: 2px solid #FFC107; /* Warna border */\n"
-                                              "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                              "    padding: 5px; /* Padding di dalam tombol */\n"
-                                              "    font-size: 14px; /* Ukuran font */\n"
-                                              "    font-weight: bold; /* Ketebalan font */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:hover {\n"
-                                              "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                              "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:pressed {\n"
-                                              "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                              "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                              "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:disabled {\n"
-                                              "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                              "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                              "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.pushButton_save_LG, GAYA_TOMBOL_SIMPAN)
         self.pushButton_save_LG.setObjectName("pushButton_save_LG")
         self.verticalLayout_6.addWidget(self.pushButton_save_LG)
         spacerItem = QtWidgets.QSpacerItem(
@@ -1084,13 +529,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_12.setFont(font)
-        self.label_12.setStyleSheet("QLabel#label_12 {\n"
-                                    "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                    "}\n"
-                                    "QLabel#label_12:disabled {\n"
-                                    "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                    "}\n"
-                                    "")
+        set_gaya(self.label_12, GAYA_LABEL)
         self.label_12.setAlignment(QtCore.Qt.AlignCenter)
         self.label_12.setObjectName("label_12")
         self.verticalLayout.addWidget(self.label_12)
@@ -1100,32 +539,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_cek_posisi.setFont(font)
-        self.pushButton_cek_posisi.setStyleSheet("QPushButton {\n"
-                                                 "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                 "    color: #ECEFF4; /* Warna teks */\n"
-                                                 "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                 "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                 "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                 "    font-size: 14px; /* Ukuran font */\n"
-                                                 "    font-weight: bold; /* Ketebalan font */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:hover {\n"
-                                                 "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:pressed {\n"
-                                                 "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                 "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:disabled {\n"
-                                                 "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                 "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                 "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                 "}")
+        set_gaya(self.pushButton_cek_posisi, GAYA_TOMBOL)
         self.pushButton_cek_posisi.setObjectName("pushButton_cek_posisi")
         self.verticalLayout.addWidget(self.pushButton_cek_posisi)
         self.pushButton_endstop = QtWidgets.QPushButton(self.frame_2)
@@ -1134,32 +548,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_endstop.setFont(font)
-        self.pushButton_endstop.setStyleSheet("QPushButton {\n"
-                                              "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                              "    color: #ECEFF4; /* Warna teks */\n"
-                                              "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                              "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                              "    padding: 5px; /* Padding di dalam tombol */\n"
-                                              "    font-size: 14px; /* Ukuran font */\n"
-                                              "    font-weight: bold; /* Ketebalan font */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:hover {\n"
-                                              "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                              "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:pressed {\n"
-                                              "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                              "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                              "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QPushButton:disabled {\n"
-                                              "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                              "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                              "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.pushButton_endstop, GAYA_TOMBOL)
         self.pushButton_endstop.setObjectName("pushButton_endstop")
         self.verticalLayout.addWidget(self.pushButton_endstop)
         self.pushButton_motor_ONOFF = QtWidgets.QPushButton(self.frame_2)
@@ -1168,44 +557,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_motor_ONOFF.setFont(font)
-        self.pushButton_motor_ONOFF.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_motor_ONOFF, GAYA_TOMBOL_TOGGLE)
         self.pushButton_motor_ONOFF.setObjectName("pushButton_motor_ONOFF")
         self.verticalLayout.addWidget(self.pushButton_motor_ONOFF)
         self.pushButton_fan = QtWidgets.QPushButton(self.frame_2)
@@ -1214,44 +566,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_fan.setFont(font)
-        self.pushButton_fan.setStyleSheet("QPushButton {\n"
-                                          "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                          "    color: #ECEFF4; /* Warna teks */\n"
-                                          "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                          "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                          "    padding: 5px; /* Padding di dalam tombol */\n"
-                                          "    font-size: 14px; /* Ukuran font */\n"
-                                          "    font-weight: bold; /* Ketebalan font */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:hover {\n"
-                                          "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:pressed {\n"
-                                          "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                          "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:checked {\n"
-                                          "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                          "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                          "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:checked:hover {\n"
-                                          "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                          "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:disabled {\n"
-                                          "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                          "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                          "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                          "}")
+        set_gaya(self.pushButton_fan, GAYA_TOMBOL_TOGGLE)
         self.pushButton_fan.setObjectName("pushButton_fan")
         self.verticalLayout.addWidget(self.pushButton_fan)
         self.label_11 = QtWidgets.QLabel(self.frame_2)
@@ -1260,13 +575,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_11.setFont(font)
-        self.label_11.setStyleSheet("QLabel#label_11 {\n"
-                                    "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                    "}\n"
-                                    "QLabel#label_11:disabled {\n"
-                                    "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                    "}\n"
-                                    "")
+        set_gaya(self.label_11, GAYA_LABEL)
         self.label_11.setAlignment(QtCore.Qt.AlignCenter)
         self.label_11.setObjectName("label_11")
         self.verticalLayout.addWidget(self.label_11)
@@ -1276,21 +585,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_S1.setFont(font)
-        self.pushButton_S1.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #9575CD ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}\n"
-                                         "\n"
-                                         "QPushButton:disabled {\n"
-                                         "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                         "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                         "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                         "}")
+        set_gaya(self.pushButton_S1, GAYA_TOMBOL_SENSOR)
         self.pushButton_S1.setObjectName("pushButton_S1")
         self.verticalLayout.addWidget(self.pushButton_S1)
         self.pushButton_S2 = QtWidgets.QPushButton(self.frame_2)
@@ -1299,21 +594,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_S2.setFont(font)
-        self.pushButton_S2.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #9575CD ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}\n"
-                                         "\n"
-                                         "QPushButton:disabled {\n"
-                                         "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                         "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                         "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                         "}")
+        set_gaya(self.pushButton_S2, GAYA_TOMBOL_SENSOR)
         self.pushButton_S2.setObjectName("pushButton_S2")
         self.verticalLayout.addWidget(self.pushButton_S2)
         self.pushButton_S3 = QtWidgets.QPushButton(self.frame_2)
@@ -1322,21 +603,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_S3.setFont(font)
-        self.pushButton_S3.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #9575CD     ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}\n"
-                                         "\n"
-                                         "QPushButton:disabled {\n"
-                                         "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                         "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                         "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                         "}")
+        set_gaya(self.pushButton_S3, GAYA_TOMBOL_SENSOR)
         self.pushButton_S3.setObjectName("pushButton_S3")
         self.verticalLayout.addWidget(self.pushButton_S3)
         self.pushButton_save_sensor = QtWidgets.QPushButton(self.frame_2)
@@ -1345,32 +612,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_save_sensor.setFont(font)
-        self.pushButton_save_sensor.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_save_sensor, GAYA_TOMBOL_SIMPAN)
         self.pushButton_save_sensor.setObjectName("pushButton_save_sensor")
         self.verticalLayout.addWidget(self.pushButton_save_sensor)
         self.label_3 = QtWidgets.QLabel(self.frame_2)
@@ -1379,43 +621,12 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_3.setFont(font)
-        self.label_3.setStyleSheet("QLabel#label_3 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_3:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_3, GAYA_LABEL)
         self.label_3.setAlignment(QtCore.Qt.AlignCenter)
         self.label_3.setObjectName("label_3")
         self.verticalLayout.addWidget(self.label_3)
         self.pushButton_info = QtWidgets.QPushButton(self.frame_2)
-        self.pushButton_info.setStyleSheet("QPushButton {\n"
-                                           "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                           "    color: #ECEFF4; /* Warna teks */\n"
-                                           "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                           "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                           "    padding: 5px; /* Padding di dalam tombol */\n"
-                                           "    font-size: 14px; /* Ukuran font */\n"
-                                           "    font-weight: bold; /* Ketebalan font */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:hover {\n"
-                                           "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:pressed {\n"
-                                           "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                           "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:disabled {\n"
-                                           "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                           "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                           "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                           "}")
+        set_gaya(self.pushButton_info, GAYA_TOMBOL)
         self.pushButton_info.setObjectName("pushButton_info")
         self.verticalLayout.addWidget(self.pushButton_info)
         spacerItem1 = QtWidgets.QSpacerItem(
@@ -1471,13 +682,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label.setFont(font)
-        self.label.setStyleSheet("QLabel#label {\n"
-                                 "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                 "}\n"
-                                 "QLabel#label:disabled {\n"
-                                 "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                 "}\n"
-                                 "")
+        set_gaya(self.label, GAYA_LABEL)
         self.label.setObjectName("label")
         self.horizontalLayout_3.addWidget(self.label)
         self.horizontalSlider_X = QtWidgets.QSlider(self.frame_X)
@@ -1487,60 +692,7 @@ QScrollBar::sub-page:horizontal {
         font.setWeight(50)
         self.horizontalSlider_X.setFont(font)
         self.horizontalSlider_X.setAutoFillBackground(False)
-        self.horizontalSlider_X.setStyleSheet("QSlider#horizontalSlider_X {\n"
-                                              "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                              "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                              "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::groove:horizontal {\n"
-                                              "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                              "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                              "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::handle:horizontal {\n"
-                                              "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                              "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                              "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::sub-page:horizontal {\n"
-                                              "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::add-page:horizontal {\n"
-                                              "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "/* Warna saat dinonaktifkan (disabled) */\n"
-                                              "QSlider#horizontalSlider_X:disabled {\n"
-                                              "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::groove:horizontal:disabled {\n"
-                                              "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                              "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::handle:horizontal:disabled {\n"
-                                              "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                              "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::sub-page:horizontal:disabled {\n"
-                                              "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_X::add-page:horizontal:disabled {\n"
-                                              "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.horizontalSlider_X, GAYA_SLIDER)
         self.horizontalSlider_X.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_X.setInvertedAppearance(False)
         self.horizontalSlider_X.setInvertedControls(False)
@@ -1560,50 +712,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.doubleSpinBox_X.setFont(font)
-        self.doubleSpinBox_X.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_X, GAYA_SPINBOX)
         self.doubleSpinBox_X.setWrapping(False)
         self.doubleSpinBox_X.setAlignment(QtCore.Qt.AlignCenter)
         self.doubleSpinBox_X.setProperty("showGroupSeparator", False)
@@ -1623,73 +732,14 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_2.setFont(font)
-        self.label_2.setStyleSheet("QLabel#label_2 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_2:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_2, GAYA_LABEL)
         self.label_2.setObjectName("label_2")
         self.horizontalLayout_4.addWidget(self.label_2)
         self.horizontalSlider_Y = QtWidgets.QSlider(self.frame_Y)
         font = QtGui.QFont()
         font.setPointSize(15)
         self.horizontalSlider_Y.setFont(font)
-        self.horizontalSlider_Y.setStyleSheet("QSlider#horizontalSlider_Y {\n"
-                                              "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                              "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                              "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::groove:horizontal {\n"
-                                              "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                              "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                              "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::handle:horizontal {\n"
-                                              "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                              "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                              "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::sub-page:horizontal {\n"
-                                              "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::add-page:horizontal {\n"
-                                              "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "/* Warna saat dinonaktifkan (disabled) */\n"
-                                              "QSlider#horizontalSlider_Y:disabled {\n"
-                                              "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::groove:horizontal:disabled {\n"
-                                              "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                              "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::handle:horizontal:disabled {\n"
-                                              "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                              "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::sub-page:horizontal:disabled {\n"
-                                              "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Y::add-page:horizontal:disabled {\n"
-                                              "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.horizontalSlider_Y, GAYA_SLIDER)
         self.horizontalSlider_Y.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_Y.setObjectName("horizontalSlider_Y")
         self.horizontalLayout_4.addWidget(self.horizontalSlider_Y)
@@ -1707,50 +757,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.doubleSpinBox_Y.setFont(font)
-        self.doubleSpinBox_Y.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_Y, GAYA_SPINBOX)
         self.doubleSpinBox_Y.setAlignment(QtCore.Qt.AlignCenter)
         self.doubleSpinBox_Y.setObjectName("doubleSpinBox_Y")
         self.horizontalLayout_4.addWidget(self.doubleSpinBox_Y)
@@ -1767,73 +774,14 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_4.setFont(font)
-        self.label_4.setStyleSheet("QLabel#label_4 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_4:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_4, GAYA_LABEL)
         self.label_4.setObjectName("label_4")
         self.horizontalLayout_5.addWidget(self.label_4)
         self.horizontalSlider_Z = QtWidgets.QSlider(self.frame_Z)
         font = QtGui.QFont()
         font.setPointSize(15)
         self.horizontalSlider_Z.setFont(font)
-        self.horizontalSlider_Z.setStyleSheet("QSlider#horizontalSlider_Z {\n"
-                                              "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                              "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                              "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::groove:horizontal {\n"
-                                              "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                              "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                              "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::handle:horizontal {\n"
-                                              "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                              "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                              "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::sub-page:horizontal {\n"
-                                              "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::add-page:horizontal {\n"
-                                              "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "/* Warna saat dinonaktifkan (disabled) */\n"
-                                              "QSlider#horizontalSlider_Z:disabled {\n"
-                                              "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::groove:horizontal:disabled {\n"
-                                              "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                              "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::handle:horizontal:disabled {\n"
-                                              "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                              "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::sub-page:horizontal:disabled {\n"
-                                              "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_Z::add-page:horizontal:disabled {\n"
-                                              "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.horizontalSlider_Z, GAYA_SLIDER)
         self.horizontalSlider_Z.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_Z.setObjectName("horizontalSlider_Z")
         self.horizontalLayout_5.addWidget(self.horizontalSlider_Z)
@@ -1851,50 +799,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.doubleSpinBox_Z.setFont(font)
-        self.doubleSpinBox_Z.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_Z, GAYA_SPINBOX)
         self.doubleSpinBox_Z.setAlignment(QtCore.Qt.AlignCenter)
         self.doubleSpinBox_Z.setObjectName("doubleSpinBox_Z")
         self.horizontalLayout_5.addWidget(self.doubleSpinBox_Z)
@@ -1914,70 +819,11 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_5.setFont(font)
-        self.label_5.setStyleSheet("QLabel#label_5 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_5:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_5, GAYA_LABEL)
         self.label_5.setObjectName("label_5")
         self.horizontalLayout_6.addWidget(self.label_5)
         self.horizontalSlider_E = QtWidgets.QSlider(self.frame_E)
-        self.horizontalSlider_E.setStyleSheet("QSlider#horizontalSlider_E {\n"
-                                              "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                              "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                              "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::groove:horizontal {\n"
-                                              "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                              "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                              "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::handle:horizontal {\n"
-                                              "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                              "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                              "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::sub-page:horizontal {\n"
-                                              "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::add-page:horizontal {\n"
-                                              "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                              "    border-radius: 8px; /* Sudut melengkung */\n"
-                                              "}\n"
-                                              "\n"
-                                              "/* Warna saat dinonaktifkan (disabled) */\n"
-                                              "QSlider#horizontalSlider_E:disabled {\n"
-                                              "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::groove:horizontal:disabled {\n"
-                                              "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                              "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::handle:horizontal:disabled {\n"
-                                              "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                              "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::sub-page:horizontal:disabled {\n"
-                                              "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                              "}\n"
-                                              "\n"
-                                              "QSlider#horizontalSlider_E::add-page:horizontal:disabled {\n"
-                                              "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                              "}")
+        set_gaya(self.horizontalSlider_E, GAYA_SLIDER)
         self.horizontalSlider_E.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_E.setObjectName("horizontalSlider_E")
         self.horizontalLayout_6.addWidget(self.horizontalSlider_E)
@@ -1995,50 +841,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.doubleSpinBox_E.setFont(font)
-        self.doubleSpinBox_E.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_E, GAYA_SPINBOX)
         self.doubleSpinBox_E.setAlignment(QtCore.Qt.AlignCenter)
         self.doubleSpinBox_E.setObjectName("doubleSpinBox_E")
         self.horizontalLayout_6.addWidget(self.doubleSpinBox_E)
@@ -2055,73 +858,14 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_6.setFont(font)
-        self.label_6.setStyleSheet("QLabel#label_6 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_6:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_6, GAYA_LABEL)
         self.label_6.setObjectName("label_6")
         self.horizontalLayout_8.addWidget(self.label_6)
         self.horizontalSlider_speed = QtWidgets.QSlider(self.frame_speed)
         font = QtGui.QFont()
         font.setPointSize(15)
         self.horizontalSlider_speed.setFont(font)
-        self.horizontalSlider_speed.setStyleSheet("QSlider#horizontalSlider_speed {\n"
-                                                "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                                "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                                "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::groove:horizontal {\n"
-                                                "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                                "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                                "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                                "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::handle:horizontal {\n"
-                                                "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                                "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                                "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::sub-page:horizontal {\n"
-                                                "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                                "    border-radius: 8px; /* Sudut melengkung */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::add-page:horizontal {\n"
-                                                "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                                "    border-radius: 8px; /* Sudut melengkung */\n"
-                                                "}\n"
-                                                "\n"
-                                                "/* Warna saat dinonaktifkan (disabled) */\n"
-                                                "QSlider#horizontalSlider_speed:disabled {\n"
-                                                "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::groove:horizontal:disabled {\n"
-                                                "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                                "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::handle:horizontal:disabled {\n"
-                                                "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                                "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::sub-page:horizontal:disabled {\n"
-                                                "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QSlider#horizontalSlider_speed::add-page:horizontal:disabled {\n"
-                                                "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                                "}")
+        set_gaya(self.horizontalSlider_speed, GAYA_SLIDER)
         self.horizontalSlider_speed.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_speed.setObjectName("horizontalSlider_speed")
         self.horizontalLayout_8.addWidget(self.horizontalSlider_speed)
@@ -2139,50 +883,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.doubleSpinBox_speed.setFont(font)
-        self.doubleSpinBox_speed.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_speed, GAYA_SPINBOX)
         self.doubleSpinBox_speed.setAlignment(QtCore.Qt.AlignCenter)
         self.doubleSpinBox_speed.setObjectName("doubleSpinBox_speed")
         self.horizontalLayout_8.addWidget(self.doubleSpinBox_speed)
@@ -2199,13 +900,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_7.setFont(font)
-        self.label_7.setStyleSheet("QLabel#label_7 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_7:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_7, GAYA_LABEL)
         self.label_7.setObjectName("label_7")
         self.horizontalLayout_9.addWidget(self.label_7)
         self.horizontalSlider_gripper_servo = QtWidgets.QSlider(
@@ -2213,60 +908,7 @@ QScrollBar::sub-page:horizontal {
         font = QtGui.QFont()
         font.setPointSize(15)
         self.horizontalSlider_gripper_servo.setFont(font)
-        self.horizontalSlider_gripper_servo.setStyleSheet("QSlider#horizontalSlider_gripper_servo {\n"
-                                                          "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                                          "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                                          "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::groove:horizontal {\n"
-                                                          "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                                          "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                                          "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                                          "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::handle:horizontal {\n"
-                                                          "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                                          "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                                          "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                          "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                          "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                          "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::sub-page:horizontal {\n"
-                                                          "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                                          "    border-radius: 8px; /* Sudut melengkung */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::add-page:horizontal {\n"
-                                                          "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                                          "    border-radius: 8px; /* Sudut melengkung */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "/* Warna saat dinonaktifkan (disabled) */\n"
-                                                          "QSlider#horizontalSlider_gripper_servo:disabled {\n"
-                                                          "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::groove:horizontal:disabled {\n"
-                                                          "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                                          "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::handle:horizontal:disabled {\n"
-                                                          "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                                          "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::sub-page:horizontal:disabled {\n"
-                                                          "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servo::add-page:horizontal:disabled {\n"
-                                                          "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                                          "}")
+        set_gaya(self.horizontalSlider_gripper_servo, GAYA_SLIDER)
         self.horizontalSlider_gripper_servo.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_gripper_servo.setObjectName("horizontalSlider_gripper_servo")
         self.horizontalLayout_9.addWidget(self.horizontalSlider_gripper_servo)
@@ -2282,50 +924,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.doubleSpinBox_gripper_servo.setFont(font)
-        self.doubleSpinBox_gripper_servo.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_gripper_servo, GAYA_SPINBOX)
         self.doubleSpinBox_gripper_servo.setAlignment(QtCore.Qt.AlignCenter)
         self.doubleSpinBox_gripper_servo.setObjectName("doubleSpinBox_gripper_servo")
         self.horizontalLayout_9.addWidget(self.doubleSpinBox_gripper_servo)
@@ -2337,148 +936,21 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_13.setFont(font)
-        self.label_13.setStyleSheet("QLabel#label_13 {\n"
-                                   "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                   "}\n"
-                                   "QLabel#label_13:disabled {\n"
-                                   "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                   "}\n"
-                                   "")
+        set_gaya(self.label_13, GAYA_LABEL)
         self.label_13.setObjectName("label_13")
         self.horizontalLayout_9.addWidget(self.label_13)
         self.horizontalSlider_gripper_servoB = QtWidgets.QSlider(self.frame_gripper)
         self.horizontalSlider_gripper_servoB.setMaximumSize(QtCore.QSize(250, 16777215))
-        self.horizontalSlider_gripper_servoB.setStyleSheet("QSlider#horizontalSlider_gripper_servoB {\n"
-                                                          "    background-color: #2E2E2E; /* Latar belakang slider */\n"
-                                                          "    border-radius: 12px; /* Membuat sudut melengkung pada slider */\n"
-                                                          "    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::groove:horizontal {\n"
-                                                          "    border: 1px solid #666; /* Border untuk jalur slider */\n"
-                                                          "    background: #3A3A3A; /* Latar belakang jalur slider */\n"
-                                                          "    height: 15px; /* Membuat jalur slider lebih tebal */\n"
-                                                          "    border-radius: 8px; /* Sudut melengkung pada jalur */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::handle:horizontal {\n"
-                                                          "    background: #4CAF50; /* Warna handle (knob) */\n"
-                                                          "    border: 2px solid #388E3C; /* Border di sekitar handle */\n"
-                                                          "    width: 25px; /* Lebar handle lebih besar */\n"
-                                                          "    height: 15px; /* Tinggi handle lebih besar */\n"
-                                                          "    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */\n"
-                                                          "    margin: -6px 0; /* Membuat handle lebih besar dari jalur */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::sub-page:horizontal {\n"
-                                                          "    background: #1B5E20; /* Warna bagian yang sudah terisi */\n"
-                                                          "    border-radius: 8px; /* Sudut melengkung */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::add-page:horizontal {\n"
-                                                          "    background: #757575; /* Warna bagian yang belum terisi */\n"
-                                                          "    border-radius: 8px; /* Sudut melengkung */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "/* Warna saat dinonaktifkan (disabled) */\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB:disabled {\n"
-                                                          "    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::groove:horizontal:disabled {\n"
-                                                          "    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */\n"
-                                                          "    border: 1px solid #808080; /* Border groove lebih cerah */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::handle:horizontal:disabled {\n"
-                                                          "    background: #A0A0A0; /* Warna handle abu-abu */\n"
-                                                          "    border: 2px solid #888888; /* Border handle abu-abu */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::sub-page:horizontal:disabled {\n"
-                                                          "    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */\n"
-                                                          "}\n"
-                                                          "\n"
-                                                          "QSlider#horizontalSlider_gripper_servoB::add-page:horizontal:disabled {\n"
-                                                          "    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */\n"
-                                                          "}")
+        set_gaya(self.horizontalSlider_gripper_servoB, GAYA_SLIDER)
         self.horizontalSlider_gripper_servoB.setOrientation(QtCore.Qt.Horizontal)
         self.horizontalSlider_gripper_servoB.setObjectName("horizontalSlider_gripper_servoB")
         self.horizontalLayout_9.addWidget(self.horizontalSlider_gripper_servoB)
         self.doubleSpinBox_gripper_servoB = QtWidgets.QDoubleSpinBox(self.frame_gripper)
-        self.doubleSpinBox_gripper_servoB.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox_gripper_servoB, GAYA_SPINBOX)
         self.doubleSpinBox_gripper_servoB.setObjectName("doubleSpinBox_gripper_servoB")
         self.horizontalLayout_9.addWidget(self.doubleSpinBox_gripper_servoB)
         self.pushButton_save_servo_seld = QtWidgets.QPushButton(self.frame_gripper)
-        self.pushButton_save_servo_seld.setStyleSheet("QPushButton {\n"
-                                                        "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                        "    color: #ECEFF4; /* Warna teks */\n"
-                                                        "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                        "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                        "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                        "    font-size: 18px; /* Ukuran font */\n"
-                                                        "    font-weight: bold; /* Ketebalan font */\n"
-                                                        "}\n"
-                                                        "\n"
-                                                        "QPushButton:hover {\n"
-                                                        "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                        "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                        "}\n"
-                                                        "\n"
-                                                        "QPushButton:pressed {\n"
-                                                        "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                        "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                        "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                        "}\n"
-                                                        "\n"
-                                                        "QPushButton:disabled {\n"
-                                                        "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                        "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                        "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                        "}")
+        set_gaya(self.pushButton_save_servo_seld, GAYA_TOMBOL_BESAR)
         self.pushButton_save_servo_seld.setObjectName("pushButton_save_servo_seld")
         self.horizontalLayout_9.addWidget(self.pushButton_save_servo_seld)
 
@@ -2496,32 +968,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_save_move.setFont(font)
-        self.pushButton_save_move.setStyleSheet("QPushButton {\n"
-                                                "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                "    color: #ECEFF4; /* Warna teks */\n"
-                                                "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                "    font-size: 18px; /* Ukuran font */\n"
-                                                "    font-weight: bold; /* Ketebalan font */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:pressed {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:disabled {\n"
-                                                "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                "}")
+        set_gaya(self.pushButton_save_move, GAYA_TOMBOL_BESAR)
         self.pushButton_save_move.setObjectName("pushButton_save_move")
         self.horizontalLayout_10.addWidget(self.pushButton_save_move)
         self.pushButton_LG4 = QtWidgets.QPushButton(self.frame_button)
@@ -2530,81 +977,13 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_LG4.setFont(font)
-        self.pushButton_LG4.setStyleSheet("QPushButton {\n"
-                                          "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                          "    color: #ECEFF4; /* Warna teks */\n"
-                                          "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                          "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                          "    padding: 5px; /* Padding di dalam tombol */\n"
-                                          "    font-size: 18px; /* Ukuran font */\n"
-                                          "    font-weight: bold; /* Ketebalan font */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:hover {\n"
-                                          "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:pressed {\n"
-                                          "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                          "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                          "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                          "}\n"
-                                          "\n"
-                                          "QPushButton:disabled {\n"
-                                          "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                          "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                          "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                          "}")
+        set_gaya(self.pushButton_LG4, GAYA_TOMBOL_BESAR)
         self.pushButton_LG4.setObjectName("pushButton_LG4")
         self.horizontalLayout_10.addWidget(self.pushButton_LG4)
         
         self.doubleSpinBox = QtWidgets.QDoubleSpinBox(self.frame_button)
 
-        self.doubleSpinBox.setStyleSheet("""
-                                        QDoubleSpinBox {
-                                            background-color: #3B4252; /* Warna latar belakang */
-                                            color: #D8DEE9; /* Warna teks */
-                                            border: 2px solid #1B5E20; /* Warna border */
-                                            border-radius: 4px; /* Sudut melengkung dikurangi */
-                                            font-size: 18px; /* Ukuran font lebih kecil */
-                                            font-weight: bold;
-                                            padding: 2px 4px; /* Padding dalam dikurangi */
-                                            selection-background-color: #81A1C1;
-                                            selection-color: #2E3440;
-                                            min-height: 25px; /* Tinggi minimal */
-                                            min-width: 60px;  /* Lebar minimal */
-                                        }
-
-                                        /* Efek hover */
-                                        QDoubleSpinBox:hover {
-                                            border: 2px solid #81A1C1;
-                                        }
-
-                                        /* Efek saat aktif (focus) */
-                                        QDoubleSpinBox:focus {
-                                            border: 2px solid #88C0D0;
-                                            background-color: #434C5E;
-                                        }
-
-                                        /* Saat dinonaktifkan */
-                                        QDoubleSpinBox:disabled {
-                                            background-color: #3B4252;
-                                            color: #7F8C9A;
-                                            border: 2px solid #3B4252;
-                                        }
-
-                                        /* Gaya tombol panah saat ditekan */
-                                        QDoubleSpinBox::up-button:pressed, QDoubleSpinBox::down-button:pressed {
-                                            background-color: #4C566A;
-                                        }
-                                    
-                                        /* Menyesuaikan ukuran tombol panah */
-                                        QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                                            width: 30px;  /* Lebar tombol panah */
-                                            height: 14px; /* Tinggi tombol panah */  
-                                        }
-                                    """)
+        set_gaya(self.doubleSpinBox, GAYA_SPINBOX)
 
         self.doubleSpinBox.setObjectName("doubleSpinBox")
         self.horizontalLayout_10.addWidget(self.doubleSpinBox)
@@ -2620,32 +999,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.pushButton_home.setFont(font)
-        self.pushButton_home.setStyleSheet("QPushButton {\n"
-                                           "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                           "    color: #ECEFF4; /* Warna teks */\n"
-                                           "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                           "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                           "    padding: 5px; /* Padding di dalam tombol */\n"
-                                           "    font-size: 18px; /* Ukuran font */\n"
-                                           "    font-weight: bold; /* Ketebalan font */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:hover {\n"
-                                           "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:pressed {\n"
-                                           "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                           "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                           "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                           "}\n"
-                                           "\n"
-                                           "QPushButton:disabled {\n"
-                                           "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                           "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                           "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                           "}")
+        set_gaya(self.pushButton_home, GAYA_TOMBOL_BESAR)
         self.pushButton_home.setObjectName("pushButton_home")
         self.horizontalLayout_10.addWidget(self.pushButton_home)
         self.verticalLayout_4.addWidget(self.frame_button)
@@ -2669,12 +1023,12 @@ QScrollBar::sub-page:horizontal {
         self.frame_6.setObjectName("frame_6")
         self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.frame_6)
         self.verticalLayout_5.setObjectName("verticalLayout_5")
-        self.textEdit_vew = QtWidgets.QTextEdit(self.frame_6)
+        self.textEdit_vew = QtWidgets.QPlainTextEdit(self.frame_6)
         self.textEdit_vew.setMinimumSize(QtCore.QSize(0, 0))
         font = QtGui.QFont()
         font.setPointSize(-1)
         self.textEdit_vew.setFont(font)
-        self.textEdit_vew.setStyleSheet("QTextEdit {\n"
+        self.textEdit_vew.setStyleSheet("QPlainTextEdit {\n"
                                         "    background-color: #2E3440; /* Warna latar belakang utama */\n"
                                         "    color: #00FF00; /* Warna teks */\n"
                                         "    border: 2px solid #1B5E20; /* Border dengan warna gelap */\n"
@@ -2742,18 +1096,18 @@ QScrollBar::sub-page:horizontal {
                                         "    background: none;\n"
                                         "}\n"
                                         "\n"
-                                        "QTextEdit:disabled {\n"
+                                        "QPlainTextEdit:disabled {\n"
                                         "    background-color: #3B4252; /* Warna latar belakang saat dinonaktifkan */\n"
                                         "    color: #7F8C9A; /* Warna teks saat dinonaktifkan */\n"
                                         "    border: 2px solid #3B4252; /* Warna border saat dinonaktifkan */\n"
                                         "}\n"
                                         "\n"
-                                        "QTextEdit::item:disabled {\n"
+                                        "QPlainTextEdit::item:disabled {\n"
                                         "    background-color: #2E3440; /* Warna latar belakang item saat dinonaktifkan */\n"
                                         "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
                                         "}\n"
                                         "")
-        self.textEdit_vew.setLineWrapColumnOrWidth(0)
+        self.textEdit_vew.setLineWrapMode(QtWidgets.QPlainTextEdit.WidgetWidth)
         self.textEdit_vew.setReadOnly(True)
         self.textEdit_vew.setPlaceholderText("")
         self.textEdit_vew.setObjectName("textEdit_vew")
@@ -2773,13 +1127,7 @@ QScrollBar::sub-page:horizontal {
         font.setBold(True)
         font.setWeight(75)
         self.label_24.setFont(font)
-        self.label_24.setStyleSheet("QLabel#label_24 {\n"
-                                    "    color: #00FF00; /* Mengubah warna teks menjadi putih */\n"
-                                    "}\n"
-                                    "QLabel#label_24:disabled {\n"
-                                    "    color: #5C677D; /* Warna teks item saat dinonaktifkan */\n"
-                                    "}\n"
-                                    "")
+        set_gaya(self.label_24, GAYA_LABEL)
         self.label_24.setObjectName("label_24")
         self.horizontalLayout_20.addWidget(self.label_24)
         self.lineEdit = QtWidgets.QLineEdit(self.frame_7)
@@ -2840,32 +1188,7 @@ QScrollBar::sub-page:horizontal {
         self.pushButton_save_manual.setMinimumSize(QtCore.QSize(200, 33))
         self.pushButton_save_manual.setMaximumSize(QtCore.QSize(16777215, 16777215))
         self.pushButton_save_manual.setSizeIncrement(QtCore.QSize(0, 0))
-        self.pushButton_save_manual.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 14px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_gaya(self.pushButton_save_manual, GAYA_TOMBOL_SIMPAN)
         self.pushButton_save_manual.setObjectName("pushButton_save_manual")
         self.horizontalLayout_20.addWidget(self.pushButton_save_manual)
         self.verticalLayout_5.addWidget(self.frame_7)
@@ -2874,9 +1197,11 @@ QScrollBar::sub-page:horizontal {
         self.horizontalLayout_2.addWidget(self.frame_4)
         self.gridLayout.addWidget(self.frame_bawah, 1, 0, 1, 1)
         RUSKOMPONEN_BOT.setCentralWidget(self.centralwidget)
+        startup_profile.mark("setupUi (widget)")
 
         self.retranslateUi(RUSKOMPONEN_BOT)
         QtCore.QMetaObject.connectSlotsByName(RUSKOMPONEN_BOT)
+        startup_profile.mark("retranslateUi (teks, variabel, sinyal)")
 
     def retranslateUi(self, RUSKOMPONEN_BOT):
         _translate = QtCore.QCoreApplication.translate
@@ -2894,23 +1219,13 @@ QScrollBar::sub-page:horizontal {
         self.label_status.setText(_translate("RUSKOMPONEN_BOT", "STATUS"))
         self.pushButton_calibration.setText(
             _translate("RUSKOMPONEN_BOT", "Calibration"))
-        __sortingEnabled = self.listWidget_save.isSortingEnabled()
-        self.listWidget_save.setSortingEnabled(False)
-        item = self.listWidget_save.item(0)
-        item.setText(_translate("RUSKOMPONEN_BOT", "G0 X0 Y100 Z2 F200"))
-        item = self.listWidget_save.item(1)
-        item.setText(_translate("RUSKOMPONEN_BOT", "G0 X0 Y100 Z222 F200"))
-        item = self.listWidget_save.item(2)
-        item.setText(_translate("RUSKOMPONEN_BOT", "G0 X0 Y100 Z2 F200"))
-        item = self.listWidget_save.item(3)
-        item.setText(_translate("RUSKOMPONEN_BOT", "G0 X0 Y100 Z2 F200"))
-        self.listWidget_save.setSortingEnabled(__sortingEnabled)
         self.label_8.setText(_translate("RUSKOMPONEN_BOT", "PROGRAM"))
         self.pushButton_edit.setText(_translate("RUSKOMPONEN_BOT", "Open program"))
         self.pushButton_next.setText(_translate("RUSKOMPONEN_BOT", "    "))
         self.pushButton_new.setText(_translate("RUSKOMPONEN_BOT", "New"))
         self.pushButton_delete.setText(_translate("RUSKOMPONEN_BOT", "Delete"))
         self.pushButton_clear.setText(_translate("RUSKOMPONEN_BOT", "Clear"))
+        self.pushButton_optimasi.setText(_translate("RUSKOMPONEN_BOT", "Optimize"))
         self.pushButton_up.setText(_translate("RUSKOMPONEN_BOT", "UP"))
         self.pushButton_dwon.setText(_translate("RUSKOMPONEN_BOT", "Dwon"))
         self.label_9.setText(_translate("RUSKOMPONEN_BOT", "GRIPPER"))
@@ -2945,11 +1260,7 @@ QScrollBar::sub-page:horizontal {
         self.pushButton_save_move.setText(_translate("RUSKOMPONEN_BOT", "Save Move"))
         self.pushButton_LG4.setText(_translate("RUSKOMPONEN_BOT", "Save delay"))
         self.pushButton_home.setText(_translate("RUSKOMPONEN_BOT", "Go Home"))
-        self.textEdit_vew.setHtml(_translate("RUSKOMPONEN_BOT", "<!DOCTYPE HTML PUBLIC \"-//W3C//DTD HTML 4.0//EN\" \"http://www.w3.org/TR/REC-html40/strict.dtd\">\n"
-                                             "<html><head><meta name=\"qrichtext\" content=\"1\" /><style type=\"text/css\">\n"
-                                             "p, li { white-space: pre-wrap; }\n"
-                                             "</style></head><body style=\" font-family:\'MS Shell Dlg 2\'; font-size:14px; font-weight:400; font-style:normal;\">\n"
-                                             "<p style=\" margin-top:0px; margin-bottom:0px; margin-left:0px; margin-right:0px; -qt-block-indent:0; text-indent:0px;\"><span style=\" font-size:14px;\">Ruskomponen</span></p></body></html>"))
+        self.textEdit_vew.setPlainText(_translate("RUSKOMPONEN_BOT", "Ruskomponen"))
         self.label_24.setText(_translate("RUSKOMPONEN_BOT", "INPUT"))
         self.lineEdit.setPlaceholderText(_translate(
             "RUSKOMPONEN_BOT", "Kirim Perintah Manual Contoh G28"))
@@ -2965,44 +1276,85 @@ QScrollBar::sub-page:horizontal {
 # ----------------------------------------------------------------------------------------------
         self.sensor_status = {'S1': False, 'S2': False, 'S3': False}
 # ----------------------------------------------------------------------------------------------
-        self.listWidget_save.itemSelectionChanged.connect(self.update_spinboxes_from_selected_item)
+        self.listWidget_save.selectionModel().selectionChanged.connect(self.update_spinboxes_from_selected_item)
 # ----------------------------------------------------------------------------------------------       
-        self.listWidget_save.itemDoubleClicked.connect(self.edit_item2)  # Event double-click
+        self.listWidget_save.doubleClicked.connect(self.edit_item2)  # Event double-click
 # ----------------------------------------------------------------------------------------------
         # Pasang event filter
         self.listWidget_save.viewport().installEventFilter(self)
 # ----------------------------------------------------------------------------------------------
-        self.listWidget_save.clear()
-# ----------------------------------------------------------------------------------------------
-        self.blink_timer = QTimer()  # Timer untuk kedipan border
-        self.blink_timer.timeout.connect(self.toggle_border_color)
+        # Perkiraan waktu siklus dihitung ulang setelah program berhenti diedit sebentar
+        self.timer_perkiraan = QTimer(self)
+        self.timer_perkiraan.setSingleShot(True)
+        self.timer_perkiraan.setInterval(PERKIRAAN_JEDA_MS)
+        self.timer_perkiraan.timeout.connect(self.perkirakan_waktu_siklus)
+        for sinyal in (self.program_model.rowsInserted, self.program_model.rowsRemoved,
+                       self.program_model.rowsMoved, self.program_model.modelReset):
+            sinyal.connect(lambda *_: self.timer_perkiraan.start())
+        self.program_model.dataChanged.connect(self.program_diubah)
+# ----------------------------------------------------------------------------------------------
+        self.program_model.clear()
+# ----------------------------------------------------------------------------------------------
+        # Semua kedipan memakai satu jam animasi, blink_timer_* adalah efek di jam ini
+        # (start/stop sama seperti QTimer)
+        self.animasi = AnimationClock(RUSKOMPONEN_BOT, parent=self)
+        self.blink_timer = self.animasi.effect(self.toggle_border_color)  # Kedipan border Sambungkan
         self.blink_state = False  # Status kedipan (ON/OFF)
 # ----------------------------------------------------------------------------------------------
-        self.blink_timer_calibrasi = QTimer()
-        self.blink_timer_calibrasi.timeout.connect(self.toggle_border_color_calibrasi)
+        self.blink_timer_calibrasi = self.animasi.effect(self.toggle_border_color_calibrasi)
         self.blink_state_kalibrasi = False
 # ----------------------------------------------------------------------------------------------
-        self.blink_timer_move = QTimer()
-        self.blink_timer_move.timeout.connect(self.toggle_border_color_move)
+        self.blink_timer_move = self.animasi.effect(self.toggle_border_color_move)
         self.blink_state_move = False
 # ----------------------------------------------------------------------------------------------
-        self.blink_timer_move_servo = QTimer()
-        self.blink_timer_move_servo.timeout.connect(self.toggle_border_color_move_servo)
+        self.blink_timer_move_servo = self.animasi.effect(self.toggle_border_color_move_servo)
         self.blink_state_move_servo = False
 # ----------------------------------deteksi_port_com--------------------------------------------
         self.last_detected_ports = []  # Simpan status terakhir
         self.first_run = True  # Flag untuk deteksi pertama kali
-        self.timer_deteksi_port_com = QTimer()
-        self.timer_deteksi_port_com.timeout.connect(self.deteksi_port_com)
-        self.timer_deteksi_port_com.start(1000)  # Cek setiap 1.5 detik
+        # Port dicolok/dicabut dilaporkan PortWatcher, bukan enumerasi setiap detik
+        self.port_watcher = PortWatcher(parent=self)
+        self.port_watcher.attached.connect(lambda port: self.deteksi_port_com())
+        self.port_watcher.detached.connect(lambda port: self.deteksi_port_com())
+        QTimer.singleShot(0, self.mulai_deteksi_port_com)  # Setelah jendela tampil
 # ----------------------------------variabel----------------------------------------------------
         self.tanda_kalibrasi = False  # Inisialisasi status kalibrasi di constructor
         self.status_rail_on_off = False
         self.tanda_motor = False
-        self.serial_buffer = ""  # Buffer untuk menyimpan data sementara
-        self.baris = []  # List untuk menyimpan baris G-code dari listWidget_save
+        self.console = ConsoleBuffer(self.textEdit_vew, parent=self)  # Semua log ke textEdit_vew lewat sini
+        self.serial_io_thread = None  # Thread I/O serial, dibuat saat pertama kali menyambung
+        self.serial_message_handlers = self.build_serial_message_handlers()  # Dipakai read_serial
+        self.baris = ()  # Rencana eksekusi (tuple PlanStep) program yang sedang dijalankan
+        self.langkah_akhir_siklus = None  # Posisi langkah yang 'ok'-nya menandai satu siklus selesai
+        self.cycle_stats = CycleStats()  # Jumlah siklus dan waktu siklus program yang berjalan
+        # Dialog pilihan dibuat saat pertama dipakai lalu disimpan, tidak dibangun ulang setiap klik
+        self.dialog_pilih_LG = None
+        self.dialog_pilih_gripper = None
+        # Spinbox sesuai urutan nilai PlanStep.values (X, Y, Z, E, F, A, B)
+        self.spinbox_sumbu = (self.doubleSpinBox_X, self.doubleSpinBox_Y, self.doubleSpinBox_Z,
+                              self.doubleSpinBox_E, self.doubleSpinBox_speed,
+                              self.doubleSpinBox_gripper_servo, self.doubleSpinBox_gripper_servoB)
+        self.tombol_efek_ui = {
+            UI_SERVO: (self.pushButton_gripper_servo, "Servo"),
+            UI_VACUM: (self.pushButton_gripper_vacum, "Vacum"),
+            UI_LG1: (self.pushButton_LG1, "LG1"),
+            UI_LG2: (self.pushButton_LG2, "LG2"),
+            UI_LG3: (self.pushButton_LG3, "LG3"),
+        }
         self.current_line_index = 0  # Posisi baris saat ini dalam pengiriman
-        self.ok_received = False  # Flag untuk menerima balasan 'ok'
+        self.stream_window = StreamWindow(STREAM_WINDOW_DEFAULT)  # Baris program terkirim yang menunggu 'ok'
+        self.ack_tracker = AckTracker()  # Semua perintah terkirim yang menunggu 'ok', urut sesuai kirim
+        self.timer_ack_timeout = QTimer(self)  # Satu timer untuk batas waktu perintah terdepan
+        self.timer_ack_timeout.setSingleShot(True)
+        self.timer_ack_timeout.timeout.connect(self.check_ack_timeout)
+        self.calibration_timer = QTimer(self)  # Batas waktu menunggu "READY CALIBRATION"
+        self.calibration_timer.setSingleShot(True)
+        self.calibration_timer.timeout.connect(self.check_ready_calibration)
+        self.ready_calibration_detected = False
+        self.versi_protokol = None  # Versi frame biner dari balasan M260, None = program dikirim ASCII
+        self.baud_negotiator = None  # Negosiasi M261 (--baud atau RNV3_BAUD), None = tetap BAUD_DEFAULT
+        self.waktu_tersambung = None
+        self.verbose = verbose_enabled()  # Cetak baris serial masuk/keluar ke stdout (--verbose atau RNV3_VERBOSE=1)
         self.stop_sending = False  # Flag untuk menghentikan pengiriman
         self.pause_sending = False  # Flag untuk mode pause
 # ---------------------------------------Output-------------------------------------------------
@@ -3067,6 +1419,9 @@ QScrollBar::sub-page:horizontal {
 # ----------------------------------------------------------------------------------------------
         self.pushButton_clear.setCheckable(False)
         self.pushButton_clear.clicked.connect(self.fungsi_pushButton_clear)
+# ----------------------------------------------------------------------------------------------
+        self.pushButton_optimasi.setCheckable(False)
+        self.pushButton_optimasi.clicked.connect(self.fungsi_pushButton_optimasi)
 # ----------------------------------------------------------------------------------------------
         self.pushButton_star.setCheckable(False)
         self.pushButton_star.clicked.connect(self.fungsi_pushButton_star)
@@ -3186,6 +1541,10 @@ QScrollBar::sub-page:horizontal {
         self.horizontalSlider_E.sliderReleased.connect(update_doubleSpinBox_and_send_gcode)
         # Kirim G-code saat editing pada doubleSpinBox_Z selesai (setelah pengguna mengetik dan selesai)
         self.doubleSpinBox_E.editingFinished.connect(self.send_gcode_command)
+# ----------------------------------------------------------------------------------------------
+        # Jangkauan dicek setiap X, Y, Z atau E berubah, termasuk selama slider digeser
+        for spinbox in (self.doubleSpinBox_X, self.doubleSpinBox_Y, self.doubleSpinBox_Z, self.doubleSpinBox_E):
+            spinbox.valueChanged.connect(self.cek_jangkauan_manual)
 # ----------------------------------------------------------------------------------------------
         self.doubleSpinBox_speed.setDecimals(2)
         self.doubleSpinBox_speed.setMinimum(0)
@@ -3251,6 +1610,8 @@ QScrollBar::sub-page:horizontal {
         self.doubleSpinBox_gripper_servoB.editingFinished.connect(self.send_gcode_command_servo)
 # ----------------------------------------------------------------------------------------------
     def set_title_bar_color(self, window):
+        if dwmapi is None:
+            return
         # Ambil handle window
         hwnd = window.winId().__int__()
 
@@ -3269,16 +1630,20 @@ QScrollBar::sub-page:horizontal {
 
         if self.pushButton_sambungkan.isChecked():
             try:
-                # Membuka koneksi serial jika tombol ditekan
-                self.serial = QSerialPort(self.port)
+                # Membuka koneksi serial jika tombol ditekan, port dimiliki thread I/O
+                if self.serial_io_thread is None:
+                    self.serial_io_thread = start_io_thread(self)
                 # Sesuaikan baud rate Arduino
-                self.serial.setBaudRate(QSerialPort.Baud115200)
-                # Connect the readyRead signal
-                self.serial.readyRead.connect(self.read_serial)
+                self.serial = SerialLink(self.port, self.serial_io_thread, BAUD_DEFAULT, self)
+                # Baris yang sudah lengkap diserahkan per batch oleh thread I/O
+                self.serial.lines_ready.connect(self.read_serial)
+                self.serial.port_lost.connect(self.port_serial_hilang)
                 if not self.serial.open(QtCore.QIODevice.ReadWrite):
                     raise Exception("Gagal membuka port serial")
+                self.port_watcher.suspend()  # Tidak perlu enumerasi port selama tersambung
                 # Menampilkan pesan sambungan berhasil
                 self.update_view(f"Tersambung ke: {self.port}")
+                self.waktu_tersambung = time.monotonic()
                 self.pushButton_sambungkan.setText("Putuskan")
                 self.frame_bawah.setEnabled(True)
                 self.listWidget_save.clearSelection()
@@ -3287,6 +1652,9 @@ QScrollBar::sub-page:horizontal {
                 self.warna_defult_lineEdit_com()
 
                 self.tanda_kalibrasi = False
+                self.stream_window.reset()  # Firmware di-reset, buffer RX-nya kosong
+                self.ack_tracker.clear()
+                self.timer_ack_timeout.stop()
 
                 # Nonaktifkan DTR untuk mereset Arduino
                 self.serial.setDataTerminalReady(False)
@@ -3303,7 +1671,10 @@ QScrollBar::sub-page:horizontal {
                 self.update_view(
                     f"Error opening serial port: {e} Pastikan serial tidak terbuka di aplikasi lain")
                 self.pushButton_sambungkan.setChecked(False)  # Reset kondisi tombol jika gagal
+                if getattr(self, 'serial', None) is not None:
+                    self.serial.close()
                 self.serial = None  # Reset objek serial jika gagal
+                self.port_watcher.resume()
 
         else:
             self.stop_sending = True
@@ -3319,6 +1690,7 @@ QScrollBar::sub-page:horizontal {
             self.pushButton_new.setEnabled(True)
             self.pushButton_delete.setEnabled(True)
             self.pushButton_clear.setEnabled(True)
+            self.pushButton_optimasi.setEnabled(True)
             self.pushButton_up.setEnabled(True)
             self.pushButton_dwon.setEnabled(True)
             self.pushButton_home.setEnabled(True)
@@ -3326,19 +1698,18 @@ QScrollBar::sub-page:horizontal {
             
             if self.tanda_kalibrasi and self.tanda_motor:
                 gcode_command = 'G0 X0,00 Y156,00 Z44,00 F0,00\r\n'
-                self.serial.write(gcode_command.encode())
+                # Tutup koneksi setelah robot sampai di posisi parkir (atau batas waktu habis)
+                self.write_command(gcode_command, on_ok=self.tutup_koneksi_serial,
+                                   on_timeout=self.tutup_koneksi_serial)
                 self.serial.flush()
-                print(gcode_command)
-                self.textEdit_vew.append(gcode_command)
-
-                self.ok_received = False
-                self.timer_kaliber = QTimer(self)
-                self.timer_kaliber.timeout.connect(self.check_ok_received_kalibrasi)
-                self.timer_kaliber.start(100)  # Cek setiap 100ms
+                if self.verbose:
+                    print(gcode_command)
+                self.console.append(gcode_command)
 
             else:
                 if hasattr(self, 'serial') and self.serial is not None and self.serial.isOpen():
                     # Menampilkan pesan penutupan port
+                    self.laporan_throughput_serial()
                     self.update_view(f"Port {self.port} ditutup.")
                     self.pushButton_sambungkan.setText("Sambungkan")
                     self.label_status.setText(":(")
@@ -3375,21 +1746,19 @@ QScrollBar::sub-page:horizontal {
                 # Menutup koneksi serial secara langsung
                 self.serial.close()
                 self.serial = None  # Hapus referensi agar tidak ada masalah saat koneksi ulang
+                self.port_watcher.resume()
+                self.ack_tracker.clear()
+                self.timer_ack_timeout.stop()
 # ----------------------------------------------------------------------------------------------
 
-    def check_ok_received_kalibrasi(self):
-        """ Memeriksa apakah balasan OK sudah diterima. """
-        if self.ok_received:
-            self.timer_kaliber.stop()  # Hentikan timer setelah berhasil
-            self.tutup_koneksi_serial()
-
     def tutup_koneksi_serial(self):
         self.update_view("Kipas Off dalam 30 detik")
         gcode_command = 'M18\r'
-        self.serial.write(gcode_command.encode())
+        self.write_command(gcode_command)
         self.serial.flush()  # Pastikan data dikirim sebelum ditutup
-        print(gcode_command)
-        self.textEdit_vew.append(gcode_command)
+        if self.verbose:
+            print(gcode_command)
+        self.console.append(gcode_command)
         self.pushButton_fan.setChecked(False)
         self.pushButton_fan.setText("Fan OFF")
 
@@ -3406,6 +1775,7 @@ QScrollBar::sub-page:horizontal {
 
         if hasattr(self, 'serial') and self.serial is not None and self.serial.isOpen():
             # Menampilkan pesan penutupan port
+            self.laporan_throughput_serial()
             self.update_view(f"Port {self.port} ditutup.")
             self.pushButton_sambungkan.setText("Sambungkan")
             self.label_status.setText(":(")
@@ -3435,115 +1805,175 @@ QScrollBar::sub-page:horizontal {
         # Menutup koneksi serial secara langsung
         self.serial.close()
         self.serial = None  # Hapus referensi agar tidak ada masalah saat koneksi ulang
+        self.port_watcher.resume()
+        self.ack_tracker.clear()
+        self.timer_ack_timeout.stop()
 # ----------------------------------------------------------------------------------------------
     def update_view(self, text):
         # Update QTextEdit with new text
-        self.textEdit_vew.append(text)
+        self.console.append(text)
+# ----------------------------------------------------------------------------------------------
+    def write_command(self, gcode_command, on_ok=None, on_timeout=None):
+        """
+        Menulis satu perintah ke serial. Jika firmware akan membalas 'ok', perintah
+        dicatat di ack_tracker agar 'ok' yang datang dicocokkan dengan perintah ini.
+        """
+        self.serial.write(gcode_command.encode())
+        if expects_ok(gcode_command):
+            self.expect_ok(gcode_command.strip(), ack_timeout_ms(gcode_command), on_ok, on_timeout)
+
+    def expect_ok(self, command, timeout_ms, on_ok=None, on_timeout=None, on_late=None):
+        """ Catat perintah yang sudah ditulis dan akan dibalas 'ok' (on_late: 'ok' setelah timeout). """
+        self.ack_tracker.expect(command, timeout_ms, on_ok=on_ok, on_timeout=on_timeout, on_late=on_late)
+        if not self.timer_ack_timeout.isActive():
+            self.arm_ack_timeout()
+
+    def arm_ack_timeout(self):
+        """ Pasang ulang timer batas waktu untuk perintah terdepan yang menunggu 'ok'. """
+        sisa = self.ack_tracker.next_deadline_ms()
+        if sisa is None:
+            self.timer_ack_timeout.stop()
+        else:
+            self.timer_ack_timeout.start(sisa)
+
+    def handle_ok(self):
+        """ Dipanggil langsung dari read_serial setiap kali 'ok' diterima. """
+        entry = self.ack_tracker.ack()
+        self.arm_ack_timeout()
+        if entry is not None and entry.on_ok is not None:
+            entry.on_ok()
+
+    def check_ack_timeout(self):
+        """ Dipanggil timer_ack_timeout jika perintah terdepan tidak dibalas 'ok' tepat waktu. """
+        for entry in self.ack_tracker.expire():
+            print(f"Timeout: tidak ada balasan 'ok' untuk {entry.command}")
+            self.update_view(f"Tidak ada balasan 'ok' untuk {entry.command}")
+            if entry.on_timeout is not None:
+                entry.on_timeout()
+        self.arm_ack_timeout()
 # ----------------------------------------------------------------------------------------------
     def read_serial(self):
-        if self.serial.bytesAvailable():
+        if self.serial is None:
+            return
+        # Ambil semua baris lengkap yang sudah dipotong oleh thread I/O
+        batch = self.serial.take_lines()
+        if batch:
             try:
-                # Baca semua data yang tersedia di buffer
-                data = self.serial.readAll().data().decode('utf-8', errors='ignore')
-
-                # Tambahkan data ke buffer sementara
-                self.serial_buffer += data
-
-                # Cek jika ada newline (akhir dari satu pesan lengkap)
-                if "\n" in self.serial_buffer:
-                    # Pisahkan data berdasarkan newline
-                    lines = self.serial_buffer.split("\n")
-                    # Simpan sisa data yang belum lengkap
-                    self.serial_buffer = lines[-1]
-
-                    for line in lines[:-1]:  # Proses semua baris yang sudah lengkap
-                        line = line.strip()
+                handlers = self.serial_message_handlers
+                for stamp, line in batch:  # Proses semua baris yang sudah lengkap
+                    if self.verbose:
                         print("Data lengkap dari serial:", line)
-                        self.textEdit_vew.append(line)  # Tampilkan di UI
-
-                        # ✅ Cek jika data mengandung "CURRENT POSITION:"
-                        if "CURRENT POSITION:" in line:
-                            self.parse_current_position(line)  # Panggil fungsi parsing
-
-                        elif "SETUP GRIPPER SERVO" in line:
-                            self.parse_current_position_servo(line)
-
-                        # ✅ Cek kondisi "homing complete"
-                        elif "HOMING COMPLETE" in line:
-
-                            # Pastikan tanda_kalibrasi dan tanda_motor diatur dengan benar
-                            self.tanda_kalibrasi = True
-                            self.tanda_motor = True
-
-                            self.pushButton_star.setEnabled(True)
-                            self.pushButton_pause.setEnabled(True)
-                            self.pushButton_stop.setEnabled(True)
-
-                            self.pushButton_motor_ONOFF.setChecked(True)
-                            self.pushButton_fan.setChecked(True)
-                            self.pushButton_motor_ONOFF.setText("Motor ON")
-                            self.pushButton_fan.setText("Fan ON")
-
-                            self.label_status.setText("Done")
-                            self.buka_tombol_slide_dan_spinbox()
-                            self.fungsi_pushButton_cek_posisi()
-                            self.homing_timer.stop()
-                            self.blink_timer_calibrasi.stop()
-                            self.pushButton_calibration.setEnabled(True)
-                            self.update_pushButton_calibration()
-
-
-                        elif "ok" in line.lower():
-                            self.ok_received = True
-
-                        elif "stop" in line.lower():
-                            self.stop_sending = True
+                    self.console.append(line)  # Tampilkan di UI
+                    if self.baud_negotiator is not None:
+                        self.baud_negotiator.handle_line(line)
 
-                        elif "S1 ON" in line:
-                            self.S1_ON()
-                            self.pushButton_S1.setText("S1 ON")
+                    # Jenis pesan dari tabel MESSAGE_EXACT/MESSAGE_PREFIX, lalu panggil handler-nya
+                    handler = handlers.get(classify_line(line))
+                    if handler is not None:
+                        handler(line)
 
-                        elif "S1 OFF" in line:
-                            self.S1_OFF()  
-                            self.pushButton_S1.setText("S1 OFF")
-
-                        elif "S2 ON" in line:
-                            self.S2_ON()
-                            self.pushButton_S2.setText("S2 ON")
+            except Exception as e:
+                print(f"Error reading serial data: {e}")
 
-                        elif "S2 OFF" in line:
-                            self.S2_OFF()  
-                            self.pushButton_S2.setText("S2 OFF") 
+    def build_serial_message_handlers(self):
+        """ Tabel jenis pesan firmware -> fungsi yang menanganinya. """
+        return {
+            MSG_OK: lambda line: self.handle_ok(),
+            MSG_POSITION: self.parse_current_position,
+            MSG_SERVO_SETUP: self.parse_current_position_servo,
+            MSG_HOMING_COMPLETE: self.handle_homing_complete,
+            MSG_READY_CALIBRATION: self.handle_ready_calibration,
+            MSG_STOP: self.handle_stop_message,
+            MSG_S1_ON: lambda line: (self.S1_ON(), self.pushButton_S1.setText("S1 ON")),
+            MSG_S1_OFF: lambda line: (self.S1_OFF(), self.pushButton_S1.setText("S1 OFF")),
+            MSG_S2_ON: lambda line: (self.S2_ON(), self.pushButton_S2.setText("S2 ON")),
+            MSG_S2_OFF: lambda line: (self.S2_OFF(), self.pushButton_S2.setText("S2 OFF")),
+            MSG_S3_ON: lambda line: (self.S3_ON(), self.pushButton_S3.setText("S3 ON")),
+            MSG_S3_OFF: lambda line: (self.S3_OFF(), self.pushButton_S3.setText("S3 OFF")),
+            MSG_RAIL_ON: lambda line: setattr(self, 'status_rail_on_off', True),
+            MSG_RAIL_OFF: lambda line: setattr(self, 'status_rail_on_off', False),
+            MSG_PROTOCOL: self.handle_protocol,
+        }
+
+    def handle_homing_complete(self, line):
+        # Pastikan tanda_kalibrasi dan tanda_motor diatur dengan benar
+        self.tanda_kalibrasi = True
+        self.tanda_motor = True
 
-                        elif "S3 ON" in line:
-                            self.S3_ON()
-                            self.pushButton_S3.setText("S3 ON")
+        self.pushButton_star.setEnabled(True)
+        self.pushButton_pause.setEnabled(True)
+        self.pushButton_stop.setEnabled(True)
 
-                        elif "S3 OFF" in line:
-                            self.S3_OFF()  
-                            self.pushButton_S3.setText("S3 OFF")             
+        self.pushButton_motor_ONOFF.setChecked(True)
+        self.pushButton_fan.setChecked(True)
+        self.pushButton_motor_ONOFF.setText("Motor ON")
+        self.pushButton_fan.setText("Fan ON")
 
-                        elif "RAIL OFF" in line:
-                            self.status_rail_on_off = False
+        self.label_status.setText("Done")
+        self.buka_tombol_slide_dan_spinbox()
+        self.fungsi_pushButton_cek_posisi()
+        self.homing_timer.stop()
+        self.blink_timer_calibrasi.stop()
+        self.pushButton_calibration.setEnabled(True)
+        self.update_pushButton_calibration()
+
+    def handle_ready_calibration(self, line):
+        self.ready_calibration_detected = True  # Set flag jika ditemukan    
+        self.calibration_timer.stop()  # Hentikan batas waktu
+        print("READY CALIBRATION ditemukan, lanjutkan proses.")
+        self.label_status.setText("Robot ready")
+        # Protokol biner (--binary atau RNV3_BINARY=1): tanya firmware versi frame yang dikenalnya
+        from rnv3_binary import enabled as binary_enabled, PROTOCOL_QUERY
+        if binary_enabled():
+            self.write_command(f"{PROTOCOL_QUERY}\r\n")
+        # Baud lebih tinggi (--baud <maks> atau RNV3_BAUD=<maks>): kalibrasi setelah negosiasi selesai
+        max_baud = requested_baud()
+        if max_baud:
+            self.baud_negotiator = BaudNegotiator(self.serial, self.kirim_perintah_baud, max_baud, self,
+                                                  resync=self.ack_tracker.drop_expired)
+            self.baud_negotiator.finished.connect(self.handle_baud_negotiated)
+            self.baud_negotiator.start()
+            return
+        self.pushButton_calibration.setEnabled(True)  # Aktifkan tombol kalibrasi
+        self.blink_timer_calibrasi.start(500)
 
-                        elif "RAIL ON" in line:
-                            self.status_rail_on_off = True
+    def kirim_perintah_baud(self, command, timeout_ms, on_ok=None, on_timeout=None):
+        # Perintah M261 memakai batas waktu sendiri, bukan ack_timeout_ms
+        if self.serial is None:
+            return
+        self.serial.write(f"{command}\r\n".encode())
+        self.expect_ok(command, timeout_ms, on_ok, on_timeout)
+
+    def handle_baud_negotiated(self, baud):
+        print("Baud serial:", baud)
+        self.update_view(self.baud_negotiator.report)
+        self.pushButton_calibration.setEnabled(True)  # Aktifkan tombol kalibrasi
+        self.blink_timer_calibrasi.start(500)
+
+    def laporan_throughput_serial(self):
+        # Throughput efektif sejak tersambung, hanya jika baud dinaikkan
+        if self.baud_negotiator is None or self.serial is None:
+            return
+        self.baud_negotiator.stop()
+        self.update_view(format_throughput(self.serial, time.monotonic() - self.waktu_tersambung))
+        self.baud_negotiator = None
 
-                        # ✅ Tambahkan pengecekan untuk "READY CALIBRATION"
-                        elif "READY CALIBRATION" in line:
-                            self.ready_calibration_detected = True  # Set flag jika ditemukan    
-                            self.calibration_timer.stop()  # Hentikan pengecekan
-                            self.label_status.setText("Robot ready")
-                            self.pushButton_calibration.setEnabled(True)  # Aktifkan tombol kalibrasi
-                            self.blink_timer_calibrasi.start(500)
+    def handle_protocol(self, line):
+        # Balasan M260, dipakai saat Start untuk memilih frame biner atau ASCII
+        from rnv3_binary import protocol_version
+        self.versi_protokol = protocol_version(line)
 
-            except Exception as e:
-                print(f"Error reading serial data: {e}")
+    def handle_stop_message(self, line):
+        self.stop_sending = True
+# ----------------------------------------------------------------------------------------------
+    def mulai_deteksi_port_com(self):
+        self.port_watcher.start()
+        self.deteksi_port_com()  # Pesan "tidak terdeteksi" jika belum ada port sama sekali
 # ----------------------------------------------------------------------------------------------
     def deteksi_port_com(self):
-        ports = QSerialPortInfo.availablePorts()
-        ch340_ports = [port.portName()
-                       for port in ports if "CH340" in port.description()]
+        # Deskripsi port dari cache PortWatcher, tanpa enumerasi ulang
+        ch340_ports = sorted(port.name for port in self.port_watcher.ports.values()
+                             if "CH340" in port.description)
 
         # Hanya update jika ada perubahan
         if ch340_ports != self.last_detected_ports:
@@ -3602,6 +2032,7 @@ QScrollBar::sub-page:horizontal {
                 self.pushButton_new.setEnabled(True)
                 self.pushButton_delete.setEnabled(True)
                 self.pushButton_clear.setEnabled(True)
+                self.pushButton_optimasi.setEnabled(True)
                 self.pushButton_up.setEnabled(True)
                 self.pushButton_dwon.setEnabled(True)
                 self.pushButton_home.setEnabled(True)
@@ -3612,573 +2043,85 @@ QScrollBar::sub-page:horizontal {
             self.update_view(
                 "Robot tidak terdeteksi, silahkan hubungkan robot ke perangkat ini")
             self.first_run = False  # Setelah menampilkan pesan, ubah flag agar tidak muncul lagi
+# ----------------------------------------------------------------------------------------------
+    def port_serial_hilang(self):
+        """ Kabel dicabut saat tersambung, sebelumnya terlihat dari enumerasi setiap detik. """
+        if self.serial is None:
+            return
+        self.update_view(f"Port {self.port} terputus")
+        self.stop_sending = True
+        self.serial.close()
+        self.serial = None
+        self.ack_tracker.clear()
+        self.timer_ack_timeout.stop()
+        self.port_watcher.resume()  # Tampilan direset oleh deteksi_port_com saat port hilang
 
 # ----------------------------------------------------------------------------------------------
     def toggle_border_color(self):
-        if self.blink_state:
-            self.pushButton_sambungkan.setStyleSheet("QPushButton {\n"
-                                                     "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                     "    color: #ECEFF4; /* Warna teks */\n"
-                                                     "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                     "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                     "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                     "    font-size: 18px; /* Ukuran font */\n"
-                                                     "    font-weight: bold; /* Ketebalan font */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:pressed {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                     "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                     "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:disabled {\n"
-                                                     "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                     "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                     "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                     "}")
-        else:
-            self.pushButton_sambungkan.setStyleSheet("QPushButton {\n"
-                                                     "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                     "    color: #ECEFF4; /* Warna teks */\n"
-                                                     "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                     "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                     "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                     "    font-size: 18px; /* Ukuran font */\n"
-                                                     "    font-weight: bold; /* Ketebalan font */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:pressed {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                     "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                     "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:disabled {\n"
-                                                     "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                     "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                     "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                     "}")
+        # Properti warna diganti, bukan stylesheet baru setiap kedipan
+        set_warna(self.pushButton_sambungkan, WARNA_NORMAL if self.blink_state else WARNA_KUNING)
         self.blink_state = not self.blink_state  # Toggle state
 # ----------------------------------------------------------------------------------------------
     def toggle_border_color_calibrasi(self):
-        if self.blink_state_kalibrasi:
-            self.pushButton_calibration.setStyleSheet("QPushButton {\n"
-                                                      "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                      "    color: #ECEFF4; /* Warna teks */\n"
-                                                      "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                      "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                      "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                      "    font-size: 18px; /* Ukuran font */\n"
-                                                      "    font-weight: bold; /* Ketebalan font */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:hover {\n"
-                                                      "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                      "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:pressed {\n"
-                                                      "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                      "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                      "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:checked {\n"
-                                                      "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                      "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                      "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:checked:hover {\n"
-                                                      "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                      "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                      "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:disabled {\n"
-                                                      "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                      "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                      "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                      "}")
-        else:
-            self.pushButton_calibration.setStyleSheet("QPushButton {\n"
-                                                      "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                      "    color: #ECEFF4; /* Warna teks */\n"
-                                                      "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                      "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                      "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                      "    font-size: 18px; /* Ukuran font */\n"
-                                                      "    font-weight: bold; /* Ketebalan font */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:hover {\n"
-                                                      "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                      "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:pressed {\n"
-                                                      "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                      "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                      "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:checked {\n"
-                                                      "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                      "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                      "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:checked:hover {\n"
-                                                      "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                      "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                      "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                      "}\n"
-                                                      "\n"
-                                                      "QPushButton:disabled {\n"
-                                                      "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                      "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                      "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                      "}")
+        set_warna(self.pushButton_calibration, WARNA_NORMAL if self.blink_state_kalibrasi else WARNA_KUNING)
         self.blink_state_kalibrasi = not self.blink_state_kalibrasi  # Toggle state
 # ----------------------------------------------------------------------------------------------
     def warna_defult_lineEdit_com(self):
-        self.pushButton_sambungkan.setStyleSheet("QPushButton {\n"
-                                                 "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                 "    color: #ECEFF4; /* Warna teks */\n"
-                                                 "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                 "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                 "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                 "    font-size: 18px; /* Ukuran font */\n"
-                                                 "    font-weight: bold; /* Ketebalan font */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:hover {\n"
-                                                 "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:pressed {\n"
-                                                 "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                 "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:checked {\n"
-                                                 "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                 "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                 "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:checked:hover {\n"
-                                                 "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                 "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                 "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                 "}\n"
-                                                 "\n"
-                                                 "QPushButton:disabled {\n"
-                                                 "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                 "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                 "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                 "}")
+        set_warna(self.pushButton_sambungkan, WARNA_NORMAL)
 # ----------------------------------------------------------------------------------------------
     def update_button_save_move(self):
-        self.pushButton_save_move.setStyleSheet("QPushButton {\n"
-                                                "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                "    color: #ECEFF4; /* Warna teks */\n"
-                                                "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                "    font-size: 18px; /* Ukuran font */\n"
-                                                "    font-weight: bold; /* Ketebalan font */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:pressed {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:disabled {\n"
-                                                "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                "}")
+        set_warna(self.pushButton_save_move, WARNA_KUNING)
 # ----------------------------------------------------------------------------------------------
     def toggle_border_color_move(self):
-        if self.blink_state_move:
-            self.pushButton_save_move.setStyleSheet("QPushButton {\n"
-                                                     "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                     "    color: #ECEFF4; /* Warna teks */\n"
-                                                     "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                     "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                     "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                     "    font-size: 18px; /* Ukuran font */\n"
-                                                     "    font-weight: bold; /* Ketebalan font */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:pressed {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                     "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                     "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:disabled {\n"
-                                                     "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                     "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                     "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                     "}")
-        else:
-            self.pushButton_save_move.setStyleSheet("QPushButton {\n"
-                                                     "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                     "    color: #ECEFF4; /* Warna teks */\n"
-                                                     "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                     "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                     "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                     "    font-size: 18px; /* Ukuran font */\n"
-                                                     "    font-weight: bold; /* Ketebalan font */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:pressed {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                     "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                     "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:disabled {\n"
-                                                     "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                     "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                     "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                     "}")
-        self.blink_state_move = not self.blink_state_move  # Toggle state    
+        set_warna(self.pushButton_save_move, WARNA_NORMAL if self.blink_state_move else WARNA_KUNING)
+        self.blink_state_move = not self.blink_state_move  # Toggle state
 # ----------------------------------------------------------------------------------------------
     def toggle_border_color_move_servo(self):
-        if self.blink_state_move_servo:
-            self.pushButton_save_servo_seld.setStyleSheet("QPushButton {\n"
-                                                     "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                     "    color: #ECEFF4; /* Warna teks */\n"
-                                                     "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                     "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                     "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                     "    font-size: 18px; /* Ukuran font */\n"
-                                                     "    font-weight: bold; /* Ketebalan font */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:pressed {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                     "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                     "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:disabled {\n"
-                                                     "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                     "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                     "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                     "}")
-        else:
-            self.pushButton_save_servo_seld.setStyleSheet("QPushButton {\n"
-                                                     "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                     "    color: #ECEFF4; /* Warna teks */\n"
-                                                     "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                     "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                     "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                     "    font-size: 18px; /* Ukuran font */\n"
-                                                     "    font-weight: bold; /* Ketebalan font */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:pressed {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                     "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked {\n"
-                                                     "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                     "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:checked:hover {\n"
-                                                     "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                     "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                     "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                     "}\n"
-                                                     "\n"
-                                                     "QPushButton:disabled {\n"
-                                                     "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                     "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                     "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                     "}")
-        self.blink_state_move_servo = not self.blink_state_move_servo  # Toggle state    
+        set_warna(self.pushButton_save_servo_seld, WARNA_NORMAL if self.blink_state_move_servo else WARNA_KUNING)
+        self.blink_state_move_servo = not self.blink_state_move_servo  # Toggle state
 # ----------------------------------------------------------------------------------------------
     def update_button_save_move_servo(self):
-        self.pushButton_save_servo_seld.setStyleSheet("QPushButton {\n"
-                                                "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                "    color: #ECEFF4; /* Warna teks */\n"
-                                                "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                "    font-size: 18px; /* Ukuran font */\n"
-                                                "    font-weight: bold; /* Ketebalan font */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:pressed {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:disabled {\n"
-                                                "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                "}")
+        set_warna(self.pushButton_save_servo_seld, WARNA_KUNING)
 # ----------------------------------------------------------------------------------------------
     def update_pushButton_calibration(self):
-        self.pushButton_calibration.setStyleSheet("QPushButton {\n"
-                                                  "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                  "    color: #ECEFF4; /* Warna teks */\n"
-                                                  "    border: 2px solid #FFC107; /* Warna border */\n"
-                                                  "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                  "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                  "    font-size: 18px; /* Ukuran font */\n"
-                                                  "    font-weight: bold; /* Ketebalan font */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:pressed {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                  "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked {\n"
-                                                  "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                  "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:checked:hover {\n"
-                                                  "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                  "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                  "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                  "}\n"
-                                                  "\n"
-                                                  "QPushButton:disabled {\n"
-                                                  "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                  "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                  "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                  "}")
+        set_warna(self.pushButton_calibration, WARNA_KUNING)
 # ----------------------------------------------------------------------------------------------
     def update_pushButton_pause_merah(self):
-        self.pushButton_pause.setStyleSheet("QPushButton {\n"
-                                                "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                "    color: #ECEFF4; /* Warna teks */\n"
-                                                "    border: 2px solid #BF616A; /* Warna border */\n"
-                                                "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                "    font-size: 18px; /* Ukuran font */\n"
-                                                "    font-weight: bold; /* Ketebalan font */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:pressed {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:disabled {\n"
-                                                "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                "}")
+        set_warna(self.pushButton_pause, WARNA_MERAH)
 # ----------------------------------------------------------------------------------------------
     def update_pushButton_pause_defult(self):
-        self.pushButton_pause.setStyleSheet("QPushButton {\n"
-                                                "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                                "    color: #ECEFF4; /* Warna teks */\n"
-                                                "    border: 2px solid #1B5E20; /* Warna border */\n"
-                                                "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                                "    padding: 5px; /* Padding di dalam tombol */\n"
-                                                "    font-size: 18px; /* Ukuran font */\n"
-                                                "    font-weight: bold; /* Ketebalan font */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:pressed {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat ditekan */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat ditekan */\n"
-                                                "    color: #2E3440; /* Warna teks saat ditekan */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked {\n"
-                                                "    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */\n"
-                                                "    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:checked:hover {\n"
-                                                "    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */\n"
-                                                "    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */\n"
-                                                "    color: #2E3440; /* Warna teks saat tombol checked dan hover */\n"
-                                                "}\n"
-                                                "\n"
-                                                "QPushButton:disabled {\n"
-                                                "    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */\n"
-                                                "    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */\n"
-                                                "    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */\n"
-                                                "}")
+        set_warna(self.pushButton_pause, WARNA_NORMAL)
+# ----------------------------------------------------------------------------------------------
+    def cek_jangkauan_manual(self):
+        """
+        Cek posisi X, Y, Z, E di spinbox dengan kinematika firmware (rnv3_kinematics).
+        Spinbox yang membuat posisi tidak bisa dicapai diberi border merah dan
+        keterangan di tooltip. Mengembalikan bit MASALAH_*, 0 jika bisa dicapai.
+        """
+        # NumPy dimuat saat pertama dipakai, tidak memperlambat pembukaan aplikasi
+        from rnv3_kinematics import check_points, describe, MASALAH_Z, MASALAH_REL
+        mask = int(check_points(self.doubleSpinBox_X.value(), self.doubleSpinBox_Y.value(),
+                                self.doubleSpinBox_Z.value(), self.doubleSpinBox_E.value()))
+        lengan = mask & ~(MASALAH_Z | MASALAH_REL)
+        for spinbox, bermasalah in ((self.doubleSpinBox_X, lengan), (self.doubleSpinBox_Y, lengan),
+                                    (self.doubleSpinBox_Z, lengan | mask & MASALAH_Z),
+                                    (self.doubleSpinBox_E, mask & MASALAH_REL)):
+            set_warna(spinbox, WARNA_MERAH if bermasalah else WARNA_NORMAL)
+            spinbox.setToolTip(describe(bermasalah))
+        return mask
+
+    def posisi_manual_terjangkau(self):
+        """ False (dan pesan di view) jika posisi di spinbox tidak bisa dicapai robot. """
+        mask = self.cek_jangkauan_manual()
+        if mask:
+            from rnv3_kinematics import describe
+            print(f"Posisi tidak dikirim: {describe(mask)}")
+            self.update_view(f"Posisi tidak dikirim: {describe(mask)}")
+        return not mask
 # ----------------------------------------------------------------------------------------------
     def send_gcode_command(self):
+        if not self.posisi_manual_terjangkau():
+            return
         # Mendapatkan nilai dari elemen GUI seperti doubleSpinBox_X, doubleSpinBox_Y, dll.
         x_value = self.doubleSpinBox_X.text()
         y_value = self.doubleSpinBox_Y.text()
@@ -4188,7 +2131,7 @@ QScrollBar::sub-page:horizontal {
         # Membuat gcode_command
         gcode_command = f'G0 X{x_value} Y{y_value} Z{z_value} E{e_value} F{f_value}\r'
 
-        self.serial.write(gcode_command.encode())
+        self.write_command(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def send_gcode_command_servo(self):
         a_value = self.doubleSpinBox_gripper_servo.text()
@@ -4196,9 +2139,11 @@ QScrollBar::sub-page:horizontal {
         # Membuat gcode_command
         gcode_command = f'G100 A{a_value} B{b_value}\r'
 
-        self.serial.write(gcode_command.encode())
+        self.write_command(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def send_gcode_command_pilih(self):
+        if not self.posisi_manual_terjangkau():
+            return
         # Mendapatkan nilai dari elemen GUI seperti doubleSpinBox_X, doubleSpinBox_Y, dll.
         x_value = self.doubleSpinBox_X.text()
         y_value = self.doubleSpinBox_Y.text()
@@ -4207,7 +2152,7 @@ QScrollBar::sub-page:horizontal {
         # Membuat gcode_command
         gcode_command = f'G0 X{x_value} Y{y_value} Z{z_value} E{e_value}\r'
 
-        self.serial.write(gcode_command.encode())
+        self.write_command(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_info(self):
         url = QUrl("https://youtube.com/playlist?list=PLgfRgHrtNqxmLqEvJMmYrRyu_SMBWNVZw&si=51YZqHpPIwxOFpvF")  # Ganti dengan link yang diinginkan
@@ -4216,9 +2161,10 @@ QScrollBar::sub-page:horizontal {
     def fungsi_pushButton_calibration(self):
         self.pushButton_calibration.setEnabled(False)
         gcode_command = 'G28\r\n'
-        self.serial.write(gcode_command.encode())
-        print(gcode_command)
-        self.textEdit_vew.append(gcode_command)
+        self.write_command(gcode_command)
+        if self.verbose:
+            print(gcode_command)
+        self.console.append(gcode_command)
         self.label_status.setText("Robot sedang kalibrasi")
 
         # Set tanda_kalibrasi menjadi True saat kalibrasi ditekan
@@ -4245,9 +2191,10 @@ QScrollBar::sub-page:horizontal {
             self.update_view("Motor ON")
             self.pushButton_motor_ONOFF.setText("Motor ON")
             gcode_command = 'M17\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
             self.pushButton_fan.setChecked(True)
             self.fungsi_pushButton_fan()
             self.tanda_motor = True
@@ -4256,9 +2203,10 @@ QScrollBar::sub-page:horizontal {
             self.pushButton_motor_ONOFF.setText("Motor OFF")
             self.update_view("Fan OFF dalam 30 detik")
             gcode_command = 'M18\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
             self.pushButton_fan.setChecked(False)
             self.fungsi_pushButton_fan()
             self.tanda_motor = False
@@ -4268,23 +2216,26 @@ QScrollBar::sub-page:horizontal {
             self.update_view("Fan ON")
             self.pushButton_fan.setText("Fan ON")
             gcode_command = 'M106\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
         else:
             self.update_view("Fan OFF dalam 30 detik")
             self.pushButton_fan.setText("Fan OFF")
             gcode_command = 'M107\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_cek_posisi(self):
         gcode_command = 'M114\r\n'
-        self.serial.write(gcode_command.encode())
-        print(gcode_command)
-        self.textEdit_vew.append(gcode_command)
+        self.write_command(gcode_command)
+        if self.verbose:
+            print(gcode_command)
+        self.console.append(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def homing_timeout(self):
         """Dipanggil jika homing tidak selesai dalam 40 detik"""
@@ -4368,24 +2319,15 @@ QScrollBar::sub-page:horizontal {
 
         self.doubleSpinBox_gripper_servo.setProperty("value", 90)
 
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
 # ----------------------------------------------------------------------------------------------
 
     def check_ready_calibration(self):
         """
-        Fungsi yang dijalankan oleh QTimer untuk mengecek apakah "READY CALIBRATION" sudah muncul.
-        Jika belum muncul dalam batas waktu tertentu, tampilkan pesan ke pengguna.
+        Dipanggil calibration_timer jika "READY CALIBRATION" tidak muncul dalam batas waktu.
+        Pesan "READY CALIBRATION" sendiri langsung ditangani di read_serial.
         """
-        elapsed_time = self.calibration_start_time.msecsTo(
-            QtCore.QTime.currentTime())
-
-        if self.ready_calibration_detected:
-            self.calibration_timer.stop()  # Hentikan pengecekan jika sudah ditemukan
-            print("READY CALIBRATION ditemukan, lanjutkan proses.")
-            return
-
-        if elapsed_time > self.calibration_timeout:
-            self.calibration_timer.stop()
+        if not self.ready_calibration_detected:
             print("Timeout: READY CALIBRATION tidak ditemukan!")
             self.update_view(
                 "Silahkan cabut USB ke robot lalu matikan robot, nyalakan ulang robot dan pasang kembali USB.")
@@ -4421,6 +2363,7 @@ QScrollBar::sub-page:horizontal {
 
                 self.serial.close()
                 self.serial = None  # Reset objek serial
+                self.port_watcher.resume()
 
                 self.pushButton_sambungkan.setChecked(False)
 # ----------------------------------------------------------------------------------------------
@@ -4431,13 +2374,11 @@ QScrollBar::sub-page:horizontal {
         Jika tidak terdeteksi dalam waktu tersebut, tampilkan pesan kepada pengguna.
         """
         self.ready_calibration_detected = False  # Reset status
-        self.calibration_timer = QtCore.QTimer(self)
-        self.calibration_timer.setInterval(100)  # Periksa setiap 500 ms
-        self.calibration_timer.timeout.connect(self.check_ready_calibration)
-
-        self.calibration_start_time = QtCore.QTime.currentTime()
-        self.calibration_timeout = timeout
-        self.calibration_timer.start()  # Mulai pengecekan asinkron
+        self.versi_protokol = None  # Firmware bisa saja diganti, tanya lagi setelah READY CALIBRATION
+        if self.baud_negotiator is not None:
+            self.baud_negotiator.stop()  # Firmware di-reset, kembali ke BAUD_DEFAULT
+            self.baud_negotiator = None
+        self.calibration_timer.start(timeout)  # Hanya sekali, dihentikan oleh read_serial
 # ----------------------------------------------------------------------------------------------
 
     def fungsi_pushButton_save_move(self):
@@ -4457,13 +2398,13 @@ QScrollBar::sub-page:horizontal {
             gcode_command = f'G0 X{x_value} Y{y_value} Z{z_value} E{e_value} F{f_value}'
 
         # Cek apakah ada item yang dipilih di listWidget_save
-        selected_items = self.listWidget_save.selectedItems()
-        if selected_items:
+        selected_rows = self.selected_rows()
+        if selected_rows:
             # Ganti teks item yang dipilih dengan G-code yang baru
-            selected_items[0].setText(gcode_command)
+            self.program_model.set_text(selected_rows[0], gcode_command)
         else:
             # Jika tidak ada item yang dipilih, tambahkan item baru
-            self.listWidget_save.addItem(gcode_command)
+            self.program_model.append_line(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_save_move_servo(self):
         self.update_button_save_move_servo()
@@ -4475,36 +2416,64 @@ QScrollBar::sub-page:horizontal {
         gcode_command = f'G100 A{a_value} B{b_value}'
 
         # Cek apakah ada item yang dipilih di listWidget_save
-        selected_items = self.listWidget_save.selectedItems()
-        if selected_items:
+        selected_rows = self.selected_rows()
+        if selected_rows:
             # Ganti teks item yang dipilih dengan G-code yang baru
-            selected_items[0].setText(gcode_command)
+            self.program_model.set_text(selected_rows[0], gcode_command)
         else:
             # Jika tidak ada item yang dipilih, tambahkan item baru
-            self.listWidget_save.addItem(gcode_command)
+            self.program_model.append_line(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_clear(self):
         # Membuat popup konfirmasi
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
         reply = QMessageBox.question(self, 'Konfirmasi', 'Apakah Anda yakin ingin menghapus semua item?',
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
             print("Item dihapus")
-            self.textEdit_vew.append("Item dihapus")
-            self.listWidget_save.clear()
+            self.console.append("Item dihapus")
+            self.program_model.clear()
         else:
             print("Penghapusan dibatalkan")
-            self.textEdit_vew.append("Penghapusan dibatalkan")
+            self.console.append("Penghapusan dibatalkan")
+# ----------------------------------------------------------------------------------------------
+    def fungsi_pushButton_optimasi(self):
+        """ Buang perintah yang tidak mengubah apa pun (rnv3_optimizer), diterapkan setelah diff disetujui. """
+        from rnv3_optimizer import optimize_program, format_changes, format_diff
+        from rnv3_estimator import estimate_plan
+        lama = self.program_model.lines
+        baru, perubahan = optimize_program(lama)
+        if not perubahan:
+            print("Tidak ada perintah yang bisa dibuang.")
+            self.console.append("Optimasi: tidak ada perintah yang bisa dibuang.")
+            return
+
+        plan_lama, plan_baru = compile_plan(lama), compile_plan(baru)
+        perintah_lama = sum(step.expects_ok for step in plan_lama)
+        perintah_baru = sum(step.expects_ok for step in plan_baru)
+        ringkasan = (f"{len(perubahan)} baris dibuang, perintah per siklus {perintah_lama} -> {perintah_baru}, "
+                     f"perkiraan waktu siklus {estimate_plan(plan_lama).total:.2f} s -> "
+                     f"{estimate_plan(plan_baru).total:.2f} s")
+        teks = "\n".join([ringkasan, ""] + format_changes(perubahan) + [""]
+                         + format_diff([line.text for line in lama], [line.text for line in baru]))
+        dialog = OptimizeDialog(teks, self)
+        if dialog.exec_() != QDialog.Accepted:
+            print("Optimasi dibatalkan")
+            self.console.append("Optimasi dibatalkan")
+            return
+        self.program_model.set_lines(baru)
+        print(f"Optimasi diterapkan: {ringkasan}")
+        self.console.append(f"Optimasi diterapkan: {ringkasan}")
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_star(self):
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
         """Memulai atau melanjutkan pengiriman G-code"""
         if hasattr(self, 'paused') and self.paused:  
             # Jika sebelumnya di-pause, lanjutkan dari posisi terakhir
             self.paused = False
             self.stop_sending = False
             print(f"Melanjutkan pengiriman dari baris {self.current_line_index + 1}.")
-            self.send_next_line()
+            self.fill_stream_window()
             return
 
         # Jika sebelumnya di-stop, mulai dari awal
@@ -4519,13 +2488,14 @@ QScrollBar::sub-page:horizontal {
         self.pushButton_new.setEnabled(False)
         self.pushButton_delete.setEnabled(False)
         self.pushButton_clear.setEnabled(False)
+        self.pushButton_optimasi.setEnabled(False)
         self.pushButton_up.setEnabled(False)
         self.pushButton_dwon.setEnabled(False)
         self.pushButton_home.setEnabled(False)
         self.pushButton_save_servo_seld.setEnabled(False)
 
         # Tambahkan ini untuk mematikan double click
-        self.listWidget_save.itemDoubleClicked.disconnect()
+        self.listWidget_save.doubleClicked.disconnect()
 
         # Tambahkan ini untuk nonaktifkan seleksi
         self.listWidget_save.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
@@ -4537,136 +2507,176 @@ QScrollBar::sub-page:horizontal {
         self.stop_sending = False
         self.paused = False  
 
-        # Ambil ulang semua item dari listWidget_save
-        self.baris = [self.listWidget_save.item(i).text() for i in range(self.listWidget_save.count())]
+        # Kompilasi program sekali, setiap putaran cukup memutar ulang rencana ini
+        self.baris = compile_plan(self.program_model.lines)
+        self.langkah_akhir_siklus = last_acked_step(self.baris)
 
         if not self.baris:
+            # Program kosong atau hanya berisi baris kosong
             print("Program tidak ada.")
-            self.pushButton_star.setEnabled(True)
+            self.update_view("Program tidak ada.")
+            self.fungsi_pushButton_stop()
             return
 
-        self.current_line_index = 0  # Reset index jika benar-benar start baru
-        self.ok_received = False  
-        self.send_next_line()  # Kirim baris pertama
-
-    def send_next_line(self):
-        """ Mengirim satu baris dari listWidget_save dan menunggu balasan 'ok'. """
-        if self.stop_sending:
-            print("Pengiriman dihentikan oleh pengguna.")
+        if self.langkah_akhir_siklus is None:
+            # Tanpa balasan 'ok' jendela tidak pernah penuh dan program akan terkirim tanpa henti
+            print("Program tidak berisi perintah G/M yang dibalas 'ok'.")
+            self.update_view("Program tidak berisi perintah G/M yang dibalas 'ok', tidak bisa dijalankan.")
+            self.fungsi_pushButton_stop()
             return
 
-        # Pastikan masih ada baris yang harus dikirim
-        if self.current_line_index < len(self.baris):
-            baris_terpilih = self.baris[self.current_line_index].strip()
-            #/////////////////////////////////////////////////////////////////////////////////
-            if baris_terpilih:
-                # Ekstrak nilai X, Y, Z, E, F, A, dan B dari G-code yang dikirim    
-                match = re.search(r'X(-?\d+\.?\d*)|Y(-?\d+\.?\d*)|Z(-?\d+\.?\d*)|E(-?\d+\.?\d*)|F(-?\d+\.?\d*)|A(-?\d+\.?\d*)|B(-?\d+\.?\d*)', baris_terpilih)
-                if match:
-                    # Ekstrak nilai untuk X, Y, Z, E, F
-                    x = self.extract_gcode_value(baris_terpilih, 'X', self.doubleSpinBox_X.value())
-                    y = self.extract_gcode_value(baris_terpilih, 'Y', self.doubleSpinBox_Y.value())
-                    z = self.extract_gcode_value(baris_terpilih, 'Z', self.doubleSpinBox_Z.value())
-                    e = self.extract_gcode_value(baris_terpilih, 'E', self.doubleSpinBox_E.value())
-                    f = self.extract_gcode_value(baris_terpilih, 'F', self.doubleSpinBox_speed.value())
-
-                    # Ekstrak nilai untuk A dan B
-                    a = self.extract_gcode_value(baris_terpilih, 'A', self.doubleSpinBox_gripper_servo.value())
-                    b = self.extract_gcode_value(baris_terpilih, 'B', self.doubleSpinBox_gripper_servoB.value())
-
-                    # Update nilai spin box
-                    self.doubleSpinBox_X.setValue(x)
-                    self.doubleSpinBox_Y.setValue(y)
-                    self.doubleSpinBox_Z.setValue(z)
-                    self.doubleSpinBox_E.setValue(e)
-                    self.doubleSpinBox_speed.setValue(f)
-
-                    self.doubleSpinBox_gripper_servo.setValue(a)
-                    self.doubleSpinBox_gripper_servoB.setValue(b)
-
-                # Cek apakah perintah M3 atau M5 ada dalam baris
-                if "SERVO ON" in baris_terpilih:
-                    self.pushButton_gripper_servo.setChecked(True)
-                    self.pushButton_gripper_servo.setText("Servo ON")
-                    self.fungsi_pushButton_gripper_servo()
-
-                if "SERVO OFF" in baris_terpilih:
-                    self.pushButton_gripper_servo.setChecked(False)
-                    self.pushButton_gripper_servo.setText("Servo OFF")
-                    self.fungsi_pushButton_gripper_servo()
-
-                if "VACUM ON" in baris_terpilih:
-                    self.pushButton_gripper_vacum.setChecked(True)
-                    self.pushButton_gripper_vacum.setText("Vacum ON")
-                    
-                    self.pushButton_LG3.setChecked(True)
-                    self.pushButton_LG3.setText("LG3 ON")
-
-                    self.pushButton_LG2.setChecked(False)
-                    self.pushButton_LG2.setText("LG2 OFF")
-
-                if "VACUM OFF" in baris_terpilih:
-                    self.pushButton_gripper_vacum.setChecked(False)
-                    self.pushButton_gripper_vacum.setText("Vacum OFF")
-
-                    self.pushButton_LG3.setChecked(False)
-                    self.pushButton_LG3.setText("LG3 OFF")
-
-                if "LG1 ON" in baris_terpilih:
-                    self.pushButton_LG1.setChecked(True)
-                    self.pushButton_LG1.setText("LG1 ON")
-                    
-                if "LG1 OFF" in baris_terpilih:
-                    self.pushButton_LG1.setChecked(False)
-                    self.pushButton_LG1.setText("LG1 OFF") 
-
-                if "LG2 ON" in baris_terpilih:
-                    self.pushButton_LG2.setChecked(True)
-                    self.pushButton_LG2.setText("LG2 ON") 
-
-                if "LG2 OFF" in baris_terpilih:
-                    self.pushButton_LG2.setChecked(False)
-                    self.pushButton_LG2.setText("LG2 OFF")
-
-                if "LG3 ON" in baris_terpilih:
-                    self.pushButton_LG3.setChecked(True)
-                    self.pushButton_LG3.setText("LG3 ON") 
+        # Semua gerakan program dicek sekaligus sebelum dikirim, termasuk lintasan di antara
+        # titik dan gerakan kembali ke baris pertama di putaran berikutnya
+        from rnv3_kinematics import check_plan, format_issue
+        masalah = check_plan(self.baris)
+        if masalah:
+            print("Program berisi posisi yang tidak bisa dicapai robot.")
+            for issue in masalah:
+                self.update_view(format_issue(issue))
+            self.update_view("Program tidak dijalankan, perbaiki baris di atas.")
+            self.fungsi_pushButton_stop()
+            self.highlight_current_line(masalah[0].row)
+            return
 
-                if "LG3 OFF" in baris_terpilih:
-                    self.pushButton_LG3.setChecked(False)
-                    self.pushButton_LG3.setText("LG3 OFF")
+        # Planner (--planner atau RNV3_PLANNER=1): gerakan panjang dipecah menjadi sub-gerakan
+        from rnv3_planner import enabled as planner_enabled, plan_trajectory, format_report
+        if planner_enabled():
+            self.baris, laporan = plan_trajectory(self.baris)
+            self.langkah_akhir_siklus = last_acked_step(self.baris)
+            print(format_report(laporan))
+            self.update_view(format_report(laporan))
+        from rnv3_estimator import estimate_plan, format_estimate
+        self.update_view(format_estimate(estimate_plan(self.baris)))
+        # Firmware yang membalas M260 dengan versi yang sama menerima program sebagai frame biner
+        from rnv3_binary import PROTOCOL_VERSION, encode_plan, format_summary
+        if self.versi_protokol == PROTOCOL_VERSION:
+            biner = encode_plan(self.baris)
+            print(format_summary(self.baris, biner))
+            self.update_view(format_summary(self.baris, biner))
+            self.baris = biner
 
-            #/////////////////////////////////////////////////////////////////////////////////
-                # Fungsi untuk mengirim perintah ke serial
-                gcode_line = f"{baris_terpilih}\r\n"
-                print(f"Mengirim: {gcode_line.strip()} (Baris {self.current_line_index + 1})")
-                self.serial.write(gcode_line.encode())
-                self.serial.flush()
+        self.current_line_index = 0  # Reset index jika benar-benar start baru
+        # Jendela tidak dikosongkan: baris dari program yang di-Stop mungkin masih di buffer firmware
+        self.cycle_stats.start()
+        self.fill_stream_window()  # Kirim baris pertama dan isi jendela streaming
 
-                self.highlight_current_line()
+    def fill_stream_window(self):
+        """
+        Penjadwal pengiriman: mengirim langkah berikutnya selama jendela streaming
+        firmware masih punya ruang. Berulang tanpa rekursi, dan selalu berhenti karena
+        rencana punya minimal satu langkah yang menempati jendela sampai dibalas 'ok'.
+        """
+        while self.send_next_line():
+            pass
 
-                # Reset flag OK sebelum menunggu respons
-                self.ok_received = False
+    def send_next_line(self):
+        """
+        Mengirim satu langkah rencana eksekusi tanpa menunggu balasan 'ok' langkah sebelumnya.
+        Mengembalikan True jika baris terkirim, False jika jendela penuh atau pengiriman dihentikan.
+        """
+        if self.stop_sending:
+            print("Pengiriman dihentikan oleh pengguna.")
+            return False
 
-                # Set up timer untuk memeriksa balasan OK
-                self.timer_ok_received = QTimer(self)
-                self.timer_ok_received.timeout.connect(self.check_ok_received)
-                self.timer_ok_received.start(100)  # Cek setiap 100ms
+        if not self.baris:
+            return False
 
-            else:
-                self.current_line_index += 1
-                self.send_next_line()  # Lewati baris kosong
-        else:
+        # Setelah langkah terakhir, putaran berikutnya mulai lagi dari langkah pertama
+        if self.current_line_index >= len(self.baris):
             print("Semua baris telah dikirim.")
             self.current_line_index = 0  # Reset index setelah selesai
-            self.send_next_line()  # Kirim ulang dari baris pertama
 
-    def check_ok_received(self):
-        """ Memeriksa apakah balasan OK sudah diterima. """
-        if self.ok_received:
-            self.current_line_index += 1  # Pindah ke baris berikutnya
-            self.timer_ok_received.stop()  # Hentikan timer setelah berhasil
-            self.send_next_line()  # Kirim baris berikutnya
+        step = self.baris[self.current_line_index]
+        if step.sync is not None:
+            # Hanya satu robot di aplikasi ini: SYNC cukup menunggu semua perintah
+            # sebelumnya selesai (sinkron antar robot ada di rnv3_cell)
+            if self.stream_window.in_flight:
+                return False
+            self.apply_line_to_ui(self.current_line_index)
+            self.current_line_index += 1
+            return True
+        if not self.stream_window.can_send(len(step.data)):
+            return False  # Tunggu 'ok' sampai buffer firmware cukup
+
+        # Byte, kebijakan ack, dan batas waktu sudah disiapkan oleh compile_plan
+        if self.verbose:
+            print(f"Mengirim: {step.command} (Baris {step.row + 1})")
+        self.serial.write(step.data)
+        if step.expects_ok:
+            self.expect_ok(step.command, step.timeout_ms, on_ok=self.program_line_done,
+                           on_timeout=self.program_line_timeout, on_late=self.stale_line_done)
+        self.serial.flush()
+
+        # Baris pertama di jendela langsung dieksekusi firmware, tampilkan di UI
+        if not self.stream_window.in_flight:
+            self.apply_line_to_ui(self.current_line_index)
+        # Baris yang tidak akan dibalas 'ok' tidak menempati jendela
+        if step.expects_ok:
+            self.stream_window.push(self.current_line_index, len(step.data))
+        self.current_line_index += 1
+        return True
+
+    def apply_line_to_ui(self, index):
+        """ Menyesuaikan spinbox dan tombol dengan langkah yang sedang dieksekusi firmware. """
+        step = self.baris[index]
+        #/////////////////////////////////////////////////////////////////////////////////
+        # Nilai X, Y, Z, E, F, A, dan B sudah diparse saat baris diedit
+        if step.values is not None:
+            for spinbox, value in zip(self.spinbox_sumbu, step.values):
+                if value is not None:
+                    spinbox.setValue(value)
+
+        # Status tombol servo, vacum, dan LG yang ditentukan saat kompilasi
+        for efek, nyala in step.ui:
+            tombol, nama = self.tombol_efek_ui[efek]
+            teks = f"{nama} {'ON' if nyala else 'OFF'}"
+            tombol.setChecked(nyala)
+            tombol.setText(teks)
+            if efek == UI_SERVO:
+                self.update_view(teks)
+
+        #/////////////////////////////////////////////////////////////////////////////////
+        self.highlight_current_line(step.row)
+
+    def program_line_done(self):
+        """ Dipanggil handle_ok saat baris program tertua dibalas 'ok'. """
+        selesai = self.stream_window.ack()  # Baris tertua di jendela selesai dieksekusi
+        if selesai == self.langkah_akhir_siklus:
+            self.cycle_done()
+
+        # Tampilkan baris yang sekarang dieksekusi firmware
+        head = self.stream_window.head()
+        if head is not None:
+            self.apply_line_to_ui(head)
+        self.fill_stream_window()  # Kirim baris berikutnya
+
+    def cycle_done(self):
+        """ Satu putaran program selesai dieksekusi robot. """
+        durasi = self.cycle_stats.complete()
+        uph = self.cycle_stats.units_per_hour()
+        pesan = f"Siklus {self.cycle_stats.cycles} selesai dalam {durasi:.2f} s"
+        if uph:
+            pesan += f" ({uph:.0f} unit/jam)"
+        print(pesan)
+        self.update_view(pesan)
+
+    def stale_line_done(self):
+        """ Baris yang sudah di-Stop atau sudah timeout akhirnya dibalas 'ok', ruangnya bebas lagi. """
+        self.stream_window.ack()
+        head = self.stream_window.head()
+        if head is not None:
+            self.apply_line_to_ui(head)
+        if self.baris:
+            self.fill_stream_window()  # Program baru mungkin sedang menunggu ruang di buffer
+
+    def program_line_timeout(self):
+        """
+        Baris program tidak dibalas 'ok' dalam batas waktu, jeda program. Barisnya tetap
+        di jendela sampai 'ok' terlambatnya datang (stale_line_done), agar 'ok' berikutnya
+        tidak tergeser ke baris yang salah.
+        """
+        if not self.paused:
+            self.fungsi_pushButton_pause()
 
     def fungsi_pushButton_stop(self):
         self.blink_timer_move.stop()
@@ -4686,13 +2696,14 @@ QScrollBar::sub-page:horizontal {
         self.pushButton_new.setEnabled(True)
         self.pushButton_delete.setEnabled(True)
         self.pushButton_clear.setEnabled(True)
+        self.pushButton_optimasi.setEnabled(True)
         self.pushButton_up.setEnabled(True)
         self.pushButton_dwon.setEnabled(True)
         self.pushButton_home.setEnabled(True)
         self.pushButton_save_servo_seld.setEnabled(True)
 
         # Kembalikan fungsi double click saat stop
-        self.listWidget_save.itemDoubleClicked.connect(self.edit_item2)
+        self.listWidget_save.doubleClicked.connect(self.edit_item2)
 
         # Kembalikan mode seleksi ke normal
         self.listWidget_save.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
@@ -4704,15 +2715,19 @@ QScrollBar::sub-page:horizontal {
         self.stop_sending = True
         self.paused = False  # Reset pause agar tidak resume setelah stop
         print("Pengiriman dihentikan.")
+        if self.baris and self.cycle_stats.cycles:
+            self.update_view(self.cycle_stats.summary())
 
         # Reset semua variabel ke awal hanya saat stop ditekan
-        self.baris = []  
+        self.baris = ()  
         self.current_line_index = 0  
+        # Baris yang sudah ada di buffer firmware tetap dieksekusi: byte-nya tetap dihitung
+        # di jendela sampai 'ok'-nya datang, tapi 'ok' itu bukan milik program berikutnya
+        self.stream_window.discard_pending()
+        self.ack_tracker.detach_callbacks(owner=self.program_line_done, on_drained=self.stale_line_done)
 
         # Reset warna teks di listWidget_save
-        for i in range(self.listWidget_save.count()):
-            item = self.listWidget_save.item(i)
-            item.setForeground(QColor("#00FF00"))
+        self.clear_highlight()
 
     def fungsi_pushButton_pause(self):
         """Menghentikan atau melanjutkan pengiriman G-code"""
@@ -4725,10 +2740,10 @@ QScrollBar::sub-page:horizontal {
             self.paused = False
             self.stop_sending = False
             print(f"Melanjutkan pengiriman dari baris {self.current_line_index + 1}.")
-            self.send_next_line()
+            self.fill_stream_window()
             self.listWidget_save.clearSelection() 
             # Tambahkan ini untuk mematikan double click
-            self.listWidget_save.itemDoubleClicked.disconnect()
+            self.listWidget_save.doubleClicked.disconnect()
 
             # Tambahkan ini untuk nonaktifkan seleksi
             self.listWidget_save.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
@@ -4741,35 +2756,41 @@ QScrollBar::sub-page:horizontal {
             self.paused = True
             self.stop_sending = True
             print(f"Pengiriman dijeda di baris {self.current_line_index + 1}.")
-            if hasattr(self, 'timer_ok_received'):
-                self.timer_ok_received.stop()  # Hentikan timer agar tidak melanjutkan
+            # Baris yang sudah di buffer firmware tetap dieksekusi dan balasan 'ok'-nya
+            # tetap diproses handle_ok agar jendela tetap benar
 
             # Kembalikan fungsi double click saat pause
-            self.listWidget_save.itemDoubleClicked.connect(self.edit_item2)
+            self.listWidget_save.doubleClicked.connect(self.edit_item2)
 
             # Kembalikan mode seleksi saat pause
             self.listWidget_save.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)   
 
             self.listWidget_save.clearSelection() 
 
-    def extract_gcode_value(self, gcode_line, key, default_value):
-        """
-        Mengekstrak nilai X, Y, Z, atau F dari perintah G-code.
-        Jika tidak ditemukan, gunakan nilai default sebelumnya.
-        """
-        match = re.search(rf'{key}(-?\d+\.?\d*)', gcode_line)
-        return float(match.group(1)) if match else default_value   
-    
 # ----------------------------------------------------------------------------------------------
-    def highlight_current_line(self):
-        # Reset semua warna ke default
-        for i in range(self.listWidget_save.count()):
-            item = self.listWidget_save.item(i)
-            item.setForeground(QColor("#00FF00"))
-
-        # Tandai item yang sedang dikirim dengan warna kuning
-        current_item = self.listWidget_save.item(self.current_line_index)
-        current_item.setForeground(QColor("#FFD700"))  # Warna teks hitam
+    def program_diubah(self, awal, akhir, roles=()):
+        """ dataChanged dari program_model: hanya perubahan teks yang menghitung ulang perkiraan. """
+        if not roles or Qt.DisplayRole in roles:
+            self.timer_perkiraan.start()
+
+    def perkirakan_waktu_siklus(self):
+        """ Perkiraan waktu per baris dan satu siklus tanpa robot, baris terlama ditandai di listWidget_save. """
+        plan = compile_plan(self.program_model.lines)
+        if not plan:
+            self.program_model.set_estimates({}, ())
+            self.listWidget_save.setToolTip("")
+            return
+        from rnv3_estimator import estimate_plan, slowest, format_estimate
+        perkiraan = estimate_plan(plan)
+        self.program_model.set_estimates(perkiraan.rows, slowest(perkiraan))
+        self.listWidget_save.setToolTip(format_estimate(perkiraan))
+
+    def highlight_current_line(self, index):
+        # Warna baris diatur model, hanya baris lama dan baris baru yang digambar ulang
+        self.program_model.set_current_row(index)
+
+    def clear_highlight(self):
+        self.program_model.set_current_row(-1)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_save_as(self):
         # Menampilkan jendela dialog untuk memilih lokasi dan nama file
@@ -4778,36 +2799,26 @@ QScrollBar::sub-page:horizontal {
         # Jika pengguna tidak memilih file (membatalkan), keluar dari fungsi
         if not file_name:
             print("Penyimpanan dibatalkan.")
-            self.textEdit_vew.append("Penyimpanan dibatalkan.")
+            self.console.append("Penyimpanan dibatalkan.")
             return
 
         # Jika pengguna memilih nama file, simpan file tersebut
         self.write_to_file(file_name)
     
     def write_to_file(self, file_name):
-        # Periksa apakah listWidget_save kosong (untuk keperluan contoh)
-        if self.listWidget_save.count() == 0:
+        # Periksa apakah program kosong (untuk keperluan contoh)
+        if self.program_model.rowCount() == 0:
             print("Program kosong, tidak ada yang disimpan.")
-            self.textEdit_vew.append("Program kosong, tidak ada yang disimpan.")
+            self.console.append("Program kosong, tidak ada yang disimpan.")
             return  # Keluar dari fungsi jika kosong
 
         # Membuka file dengan mode tulis
         with open(file_name, "w") as file:
-            # Menulis header dari file
-            file.write("// File ini dihasilkan secara otomatis\n")
-            file.write("// Ruskomponen\n")
-
-
-            # Loop melalui item di listWidget_save dan tulis ke file
-            for i in range(self.listWidget_save.count()):
-                item_text = self.listWidget_save.item(i).text()
-                if i == self.listWidget_save.count() - 1:  # Jika ini adalah elemen terakhir
-                    file.write(f'    "{item_text}"\n')  # Tidak ada koma
-                else:
-                    file.write(f'    "{item_text}",\n')  # Tambahkan koma
+            # Header dan semua baris program ditulis sekaligus
+            file.write(format_program_file(self.program_model.texts()))
         
         print(f"Item telah disimpan ke file {file_name}")
-        self.textEdit_vew.append(f"Item telah disimpan ke file {file_name}")
+        self.console.append(f"Item telah disimpan ke file {file_name}")
 # ----------------------------------------------------------------------------------------------
     def load_h_file_to_list(self):
         # Membuka dialog untuk memilih file
@@ -4817,31 +2828,19 @@ QScrollBar::sub-page:horizontal {
             print("Tidak ada file yang dipilih.")
             return  # Keluar jika tidak ada file yang dipilih
         
-        self.listWidget_save.clear()  # Bersihkan list sebelum memuat data baru
+        self.program_model.clear()  # Bersihkan list sebelum memuat data baru
 
         try:
             with open(file_name, "r") as file:
-                lines = file.readlines()
-
-            for line in lines:
-                line = line.strip()  # Hapus spasi di awal/akhir
-                
-                # Abaikan baris kosong dan komentar
-                if not line or line.startswith("//"):
-                    continue  
-                
-                # Hapus tanda kutip dan koma dari setiap baris
-                cleaned_line = line.strip('" ,')
-
-                if cleaned_line:  # Pastikan hanya menambahkan baris yang valid
-                    self.listWidget_save.addItem(cleaned_line)
+                # Semua baris diparse lalu dimasukkan ke model dengan satu kali reset
+                self.program_model.set_lines(parse_program_file(file))
 
             print(f"Item telah dimuat dari file {file_name}")
-            self.textEdit_vew.append(f"Item telah dimuat dari file {file_name}")
+            self.console.append(f"Item telah dimuat dari file {file_name}")
 
         except FileNotFoundError:
             print(f"File {file_name} tidak ditemukan.")
-            self.textEdit_vew.append(f"File {file_name} tidak ditemukan.")
+            self.console.append(f"File {file_name} tidak ditemukan.")
 
 # ----------------------------------------------------------------------------------------------
     def eventFilter(self, source, event):
@@ -4852,35 +2851,45 @@ QScrollBar::sub-page:horizontal {
                 source == self.listWidget_save.viewport()
                 and event.type() == event.MouseButtonPress
             ):
-                item = self.listWidget_save.itemAt(event.pos())
-                if item is None:
+                if not self.listWidget_save.indexAt(event.pos()).isValid():
                     self.listWidget_save.clearSelection()
         return super().eventFilter(source, event)
+# ----------------------------------------------------------------------------------------------
+    def selected_rows(self):
+        """ Nomor baris listWidget_save yang dipilih, urut dari atas. """
+        return sorted(index.row() for index in self.listWidget_save.selectionModel().selectedRows())
+
+    def set_current_row(self, row):
+        """ Pilih satu baris listWidget_save (pengganti QListWidget.setCurrentRow). """
+        self.listWidget_save.setCurrentIndex(self.program_model.index(row))
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_gripper_servo(self):
         if self.pushButton_gripper_servo.isChecked():
             self.update_view("Servo ON")
             self.pushButton_gripper_servo.setText("Servo ON")
             gcode_command = 'M5\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
         else:
             self.update_view("Servo OFF")
             self.pushButton_gripper_servo.setText("Servo OFF")
             gcode_command = 'M3\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_gripper_vacum(self):
         if self.pushButton_gripper_vacum.isChecked():
             self.update_view("Vacum ON")
             self.pushButton_gripper_vacum.setText("Vacum ON")
             gcode_command = 'M209\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 
             self.pushButton_LG3.setChecked(True)
             self.pushButton_LG3.setText("LG3 ON")
@@ -4892,9 +2901,10 @@ QScrollBar::sub-page:horizontal {
             self.update_view("Vacum OFF")
             self.pushButton_gripper_vacum.setText("Vacum OFF")
             gcode_command = 'M230\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 
             self.pushButton_LG3.setChecked(False)
             self.pushButton_LG3.setText("LG3 OFF")
@@ -4904,47 +2914,56 @@ QScrollBar::sub-page:horizontal {
         if self.pushButton_LG1.isChecked():
             self.pushButton_LG1.setText("LG1 ON")
             gcode_command = 'LG1 ON\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
         else:
             self.pushButton_LG1.setText("LG1 OFF")
             gcode_command = 'LG1 OFF\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_LG2(self):
         if self.pushButton_LG2.isChecked():
             self.pushButton_LG2.setText("LG2 ON")
             gcode_command = 'LG2 ON\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
         else:
             self.pushButton_LG2.setText("LG2 OFF")
             gcode_command = 'LG2 OFF\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_LG3(self):
         if self.pushButton_LG3.isChecked():
             self.pushButton_LG3.setText("LG3 ON")
             gcode_command = 'LG3 ON\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
         else:
             self.pushButton_LG3.setText("LG3 OFF")
             gcode_command = 'LG3 OFF\r\n'
-            self.serial.write(gcode_command.encode())
-            print(gcode_command)
-            self.textEdit_vew.append(gcode_command)
+            self.write_command(gcode_command)
+            if self.verbose:
+                print(gcode_command)
+            self.console.append(gcode_command)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_save_LG(self):
         # Tampilkan dialog pilihan gripper
-        dialog = GripperChoiceDialog_LG(self)
+        if self.dialog_pilih_LG is None:
+            self.dialog_pilih_LG = GripperChoiceDialog_LG(self)
+        dialog = self.dialog_pilih_LG
+        dialog.selected = None
         if dialog.exec_() == QDialog.Accepted:
             pilihan = dialog.selected
         else:
@@ -4970,27 +2989,30 @@ QScrollBar::sub-page:horizontal {
                 command_list = ["LG3 OFF"]  # Simpan dua command dalam urutan berbeda        
 
         # Cek apakah ada item yang dipilih di listWidget_save
-        selected_items = self.listWidget_save.selectedItems()
+        selected_rows = self.selected_rows()
 
-        if selected_items:
+        if selected_rows:
             # Jika ada item yang dipilih, timpa item tersebut dengan yang baru
             for i, cmd in enumerate(command_list):
-                if i < len(selected_items):
-                    selected_items[i].setText(cmd)
+                if i < len(selected_rows):
+                    self.program_model.set_text(selected_rows[i], cmd)
                 else:
-                    # Jika command_list lebih panjang dari selected_items, tambahkan item baru
-                    self.listWidget_save.addItem(cmd)
+                    # Jika command_list lebih panjang dari selected_rows, tambahkan item baru
+                    self.program_model.append_line(cmd)
         else:
             # Jika tidak ada item yang dipilih, tambahkan semua item dari command_list sebagai item baru
             for cmd in command_list:
-                self.listWidget_save.addItem(cmd)
+                self.program_model.append_line(cmd)
 
         # Tampilkan pesan notifikasi
         self.update_view(f"Command {', '.join(command_list)} disimpan.")
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_save_servo(self):
         # Tampilkan dialog pilihan gripper
-        dialog = GripperChoiceDialog(self)
+        if self.dialog_pilih_gripper is None:
+            self.dialog_pilih_gripper = GripperChoiceDialog(self)
+        dialog = self.dialog_pilih_gripper
+        dialog.selected = None
         if dialog.exec_() == QDialog.Accepted:
             pilihan = dialog.selected
         else:
@@ -5011,27 +3033,28 @@ QScrollBar::sub-page:horizontal {
                 command_list = ["VACUM OFF"]  # Simpan dua command dalam urutan berbeda
 
         # Cek apakah ada item yang dipilih di listWidget_save
-        selected_items = self.listWidget_save.selectedItems()
+        selected_rows = self.selected_rows()
 
-        if selected_items:
+        if selected_rows:
             # Jika ada item yang dipilih, timpa item tersebut dengan yang baru
             for i, cmd in enumerate(command_list):
-                if i < len(selected_items):
-                    selected_items[i].setText(cmd)
+                if i < len(selected_rows):
+                    self.program_model.set_text(selected_rows[i], cmd)
                 else:
-                    # Jika command_list lebih panjang dari selected_items, tambahkan item baru
-                    self.listWidget_save.addItem(cmd)
+                    # Jika command_list lebih panjang dari selected_rows, tambahkan item baru
+                    self.program_model.append_line(cmd)
         else:
             # Jika tidak ada item yang dipilih, tambahkan semua item dari command_list sebagai item baru
             for cmd in command_list:
-                self.listWidget_save.addItem(cmd)
+                self.program_model.append_line(cmd)
 
         # Tampilkan pesan notifikasi
         self.update_view(f"Command {', '.join(command_list)} disimpan.")
 # ----------------------------------------------------------------------------------------------
-    def edit_item2(self, item):
+    def edit_item2(self, index):
         # Ambil teks lama
-        old_text = item.text()
+        row = index.row()
+        old_text = self.program_model.text(row)
 
         # Buat dialog input secara manual agar bisa diatur lebarnya
         dialog = QInputDialog(self)
@@ -5097,109 +3120,59 @@ QScrollBar::sub-page:horizontal {
         if dialog.exec_() == QDialog.Accepted:
             new_text = dialog.textValue().strip().upper()  # Ambil teks baru
             if new_text:  # Pastikan tidak kosong
-                item.setText(new_text)  # Simpan perubahan
+                self.program_model.set_text(row, new_text)  # Simpan perubahan
 # ----------------------------------------------------------------------------------------------
     def S1_ON(self):
-        self.pushButton_S1.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #BF616A ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}")
+        set_warna(self.pushButton_S1, WARNA_MERAH)
     def S1_OFF(self):
-        self.pushButton_S1.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #9575CD ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}")    
+        set_warna(self.pushButton_S1, WARNA_UNGU)
 # ----------------------------------------------------------------------------------------------
     def S2_ON(self):
-        self.pushButton_S2.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #BF616A ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}")
+        set_warna(self.pushButton_S2, WARNA_MERAH)
     def S2_OFF(self):
-        self.pushButton_S2.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #9575CD ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}")
+        set_warna(self.pushButton_S2, WARNA_UNGU)
 # ----------------------------------------------------------------------------------------------
     def S3_ON(self):
-        self.pushButton_S3.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #BF616A ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}")
+        set_warna(self.pushButton_S3, WARNA_MERAH)
     def S3_OFF(self):
-        self.pushButton_S3.setStyleSheet("QPushButton {\n"
-                                         "    background-color: #2E3440; /* Warna latar belakang tombol */\n"
-                                         "    color: #ECEFF4; /* Warna teks */\n"
-                                         "    border: 2px solid #9575CD ; /* Warna border */\n"
-                                         "    border-radius: 5px; /* Sudut tombol yang melengkung */\n"
-                                         "    padding: 5px; /* Padding di dalam tombol */\n"
-                                         "    font-size: 14px; /* Ukuran font */\n"
-                                         "    font-weight: bold; /* Ketebalan font */\n"
-                                         "}")
+        set_warna(self.pushButton_S3, WARNA_UNGU)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_tunggu(self):
         tunggu_value = self.doubleSpinBox.value() 
         new_item = f'G4 S{tunggu_value}'
         
         # Cek apakah ada item yang dipilih di listWidget
-        selected_items = self.listWidget_save.selectedItems()
-        if selected_items:
+        selected_rows = self.selected_rows()
+        if selected_rows:
             # Ganti teks item yang dipilih dengan G-code yang baru
-            selected_items[0].setText(new_item)
+            self.program_model.set_text(selected_rows[0], new_item)
         else:
             # Jika tidak ada item yang dipilih, tambahkan item baru di baris terakhir
-            self.listWidget_save.addItem(new_item)
+            self.program_model.append_line(new_item)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_new(self):
-        selected_items = self.listWidget_save.selectedItems()
+        selected_rows = self.selected_rows()
 
-        if not selected_items:  # Jika tidak ada item yang dipilih
-            self.listWidget_save.addItem("")  # Tambahkan item baru di akhir
+        if not selected_rows:  # Jika tidak ada item yang dipilih
+            self.program_model.append_line("")  # Tambahkan item baru di akhir
         else:  # Jika ada item yang dipilih
-            indeks_terpilih = self.listWidget_save.row(selected_items[0])  # Dapatkan index item yang dipilih
-            self.listWidget_save.insertItem(indeks_terpilih + 1, "")  # Tambahkan item kosong di bawahnya
-            self.listWidget_save.setCurrentRow(indeks_terpilih + 1)  # Pilih item baru yang ditambahkan
+            indeks_terpilih = selected_rows[0]  # Dapatkan index item yang dipilih
+            self.program_model.insert_line(indeks_terpilih + 1, "")  # Tambahkan item kosong di bawahnya
+            self.set_current_row(indeks_terpilih + 1)  # Pilih item baru yang ditambahkan
 
 # ----------------------------------------------------------------------------------------------
     def update_spinboxes_from_selected_item(self):
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
         # Ambil item yang dipilih
-        selected_items = self.listWidget_save.selectedItems()
+        selected_rows = self.selected_rows()
         
-        if not selected_items:
+        if not selected_rows:
             return  # Tidak ada item yang dipilih
             
-        current_item_text = selected_items[0].text()
+        program_line = self.program_model.lines[selected_rows[0]]
         
-        # Fungsi untuk ekstrak nilai dari G-code
-        def extract_value(key, default):
-            match = re.search(rf'{key}(-?\d+\.?\d*)', current_item_text)
-            return float(match.group(1)) if match else default
+        # Nilai dari G-code sudah diparse di model
+        extract_value = program_line.value
         
         try:
             # Update nilai spin box
@@ -5215,9 +3188,9 @@ QScrollBar::sub-page:horizontal {
         
         if self.tanda_kalibrasi:  # Hanya kirim jika kalibrasi selesai
             # Kirim perintah berdasarkan item yang dipilih
-            selected_items = self.listWidget_save.selectedItems()
-            if selected_items:
-                current_item = selected_items[0].text()
+            selected_rows = self.selected_rows()
+            if selected_rows:
+                current_item = self.program_model.text(selected_rows[0])
                 if current_item.startswith('G0'):
                     self.send_gcode_command_pilih()
 
@@ -5301,107 +3274,103 @@ QScrollBar::sub-page:horizontal {
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_delete(self):
         # Blokir sinyal selectionChanged sementara
-        self.listWidget_save.blockSignals(True)
+        self.listWidget_save.selectionModel().blockSignals(True)
 
-        selected_items = self.listWidget_save.selectedItems()
-        if not selected_items:
-            self.textEdit_vew.append("Pilih item yang akan dihapus")
+        selected_rows = self.selected_rows()
+        if not selected_rows:
+            self.console.append("Pilih item yang akan dihapus")
             return  # Tidak ada item yang dipilih
         
-        # Ambil item pertama yang dipilih
-        item = selected_items[0]
-        # Dapatkan indeks baris dari item yang dipilih
-        indeks = self.listWidget_save.row(item)
+        # Dapatkan indeks baris dari item pertama yang dipilih
+        indeks = selected_rows[0]
         # Hapus item berdasarkan indeks
-        self.listWidget_save.takeItem(indeks)
-        self.textEdit_vew.append("Item dihapus")
+        self.program_model.remove_line(indeks)
+        self.console.append("Item dihapus")
         self.listWidget_save.clearSelection()  # Membersihkan seleksi setelah penghapusan
 
         # Aktifkan kembali sinyal
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_up(self):
         # Blokir sinyal selectionChanged sementara
-        self.listWidget_save.blockSignals(True)
+        self.listWidget_save.selectionModel().blockSignals(True)
         
         # Simpan posisi scroll vertikal
         scroll_position = self.listWidget_save.verticalScrollBar().value()
         
         # Dapatkan indeks item yang dipilih
-        selected_items = self.listWidget_save.selectedItems()
-        if not selected_items:
-            self.textEdit_vew.append("Pilih item yang akan dipindahkan")
+        selected_rows = self.selected_rows()
+        if not selected_rows:
+            self.console.append("Pilih item yang akan dipindahkan")
             return
-        indeks_terpilih = self.listWidget_save.row(selected_items[0])
+        indeks_terpilih = selected_rows[0]
             
         if indeks_terpilih > 0:
-            item = self.listWidget_save.takeItem(indeks_terpilih)
-            self.listWidget_save.insertItem(indeks_terpilih - 1, item)
-            self.listWidget_save.setCurrentRow(indeks_terpilih - 1)
+            self.program_model.move_line(indeks_terpilih, indeks_terpilih - 1)
+            self.set_current_row(indeks_terpilih - 1)
 
         # Kembalikan posisi scroll
         self.listWidget_save.verticalScrollBar().setValue(scroll_position)
         
         # Aktifkan kembali sinyal
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
 
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_dwon(self):
         # Blokir sinyal selectionChanged sementara
-        self.listWidget_save.blockSignals(True)
+        self.listWidget_save.selectionModel().blockSignals(True)
         
         # Simpan posisi scroll vertikal
         scroll_position = self.listWidget_save.verticalScrollBar().value()
         
         # Dapatkan indeks item yang dipilih
-        selected_items = self.listWidget_save.selectedItems()
-        if not selected_items:
-            self.textEdit_vew.append("Pilih item yang akan dipindahkan")
+        selected_rows = self.selected_rows()
+        if not selected_rows:
+            self.console.append("Pilih item yang akan dipindahkan")
             return
-        indeks_terpilih = self.listWidget_save.row(selected_items[0])
+        indeks_terpilih = selected_rows[0]
             
-        if indeks_terpilih < self.listWidget_save.count() - 1:
-            item = self.listWidget_save.takeItem(indeks_terpilih)
-            self.listWidget_save.insertItem(indeks_terpilih + 1, item)
-            self.listWidget_save.setCurrentRow(indeks_terpilih + 1)
+        if indeks_terpilih < self.program_model.rowCount() - 1:
+            self.program_model.move_line(indeks_terpilih, indeks_terpilih + 1)
+            self.set_current_row(indeks_terpilih + 1)
 
         # Kembalikan posisi scroll
         self.listWidget_save.verticalScrollBar().setValue(scroll_position)
         
         # Aktifkan kembali sinyal
-        self.listWidget_save.blockSignals(False)
+        self.listWidget_save.selectionModel().blockSignals(False)
 # ----------------------------------------------------------------------------------------------
     def fungsi_pushButton_save_manual(self):
         # Ambil teks dari lineEdit
         input_text = self.lineEdit.text().upper()  # Simpan dalam teks besar
 
         # Cek apakah ada item yang dipilih di listWidget_save
-        selected_item = self.listWidget_save.selectedItems()
+        selected_rows = self.selected_rows()
 
-        if selected_item:
+        if selected_rows:
             if input_text:  # Pastikan lineEdit tidak kosong
                 # Jika ada item yang dipilih, ganti teks item yang dipilih dengan teks dari lineEdit
-                selected_item[0].setText(input_text)
+                self.program_model.set_text(selected_rows[0], input_text)
                 self.lineEdit.clear()  # Bersihkan lineEdit setelah mengganti item
             else:
                 print("Teks kosong, tidak ada yang diubah!")
-                self.textEdit_vew.append("Teks kosong, tidak ada yang diubah!")
+                self.console.append("Teks kosong, tidak ada yang diubah!")
         else:
             # Jika tidak ada item yang dipilih, tambahkan teks ke listWidget_save
             if input_text:  # Pastikan input tidak kosong
-                self.listWidget_save.addItem(input_text)
+                self.program_model.append_line(input_text)
                 self.lineEdit.clear()  # Bersihkan lineEdit setelah menambahkan ke listWidget_save
             else:
                 print("Teks kosong, tidak ada yang ditambahkan!")
-                self.textEdit_vew.append("Teks kosong, tidak ada yang ditambahkan!")
+                self.console.append("Teks kosong, tidak ada yang ditambahkan!")
 # ----------------------------------------------------------------------------------------------
     def send_serial_data_input_manual(self):
         data = self.lineEdit.text()
         data_with_cr = f"{data}\r"  # Menambahkan '\r' ke data yang dikirim
         print(f"Kirim: {data_with_cr}")
         message = f"Kirim: {data_with_cr}"
-        self.textEdit_vew.append(message)
-        self.serial.write(data_with_cr.encode())  # Kirim data ke serial
+        self.console.append(message)
+        self.write_command(data_with_cr)  # Kirim data ke serial
         self.lineEdit.clear()
 # ----------------------------------------------------------------------------------------------
 # ----------------------------------------------------------------------------------------------
@@ -5541,6 +3510,8 @@ class GripperChoiceDialog_LG(QDialog):
         self.setStyleSheet(dark_stylesheet)
 
     def set_title_bar_color(self):
+        if dwmapi is None:
+            return
         hwnd = self.winId().__int__()
         value = ctypes.c_int(1)  # Enable dark mode title bar
         dwmapi.DwmSetWindowAttribute(
@@ -5679,6 +3650,8 @@ class GripperChoiceDialog(QDialog):
         self.setStyleSheet(dark_stylesheet)
 
     def set_title_bar_color(self):
+        if dwmapi is None:
+            return
         hwnd = self.winId().__int__()
         value = ctypes.c_int(1)  # Enable dark mode title bar
         dwmapi.DwmSetWindowAttribute(
@@ -5687,16 +3660,168 @@ class GripperChoiceDialog(QDialog):
             ctypes.byref(value),
             ctypes.sizeof(value)
         )    
+#%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+class OptimizeDialog(QDialog):
+    """ Pratinjau hasil optimasi program (ringkasan, alasan, diff) sebelum diterapkan. """
+
+    def __init__(self, teks, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Optimasi Program")
+        self.resize(640, 480)
+
+        layout = QVBoxLayout(self)
+        self.text_diff = QTextEdit(self)
+        self.text_diff.setReadOnly(True)
+        self.text_diff.setLineWrapMode(QTextEdit.NoWrap)
+        self.text_diff.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        self.text_diff.setPlainText(teks)
+        layout.addWidget(self.text_diff)
+
+        tombol = QHBoxLayout()
+        self.apply_button = QPushButton("Terapkan")
+        self.apply_button.clicked.connect(self.accept)
+        tombol.addWidget(self.apply_button)
+        self.cancel_button = QPushButton("Batal")
+        self.cancel_button.clicked.connect(self.reject)  # Program tidak diubah
+        tombol.addWidget(self.cancel_button)
+        layout.addLayout(tombol)
+
+        self.setStyleSheet("""
+            QWidget { background-color: #181818; color: #E0E0E0; font-size: 14px; }
+            QTextEdit { background-color: #252525; border: 2px solid #333; border-radius: 10px; padding: 5px; }
+            QPushButton { background-color: #252525; border: 2px solid #1B5E20; padding: 10px; border-radius: 10px; }
+            QPushButton:hover { background-color: #333333; }
+        """)
+        if dwmapi is not None:
+            value = ctypes.c_int(1)  # Enable dark mode title bar
+            dwmapi.DwmSetWindowAttribute(self.winId().__int__(), DWMWA_USE_IMMERSIVE_DARK_MODE,
+                                         ctypes.byref(value), ctypes.sizeof(value))
 #%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+class ProgramListModel(QtCore.QAbstractListModel):
+    """
+    Model untuk listWidget_save. Program disimpan sebagai list ProgramLine yang
+    diparse sekali saat baris ditambah atau diubah, lalu dipakai ulang setiap kali
+    program dijalankan. Baris yang sedang dieksekusi diwarnai lewat ForegroundRole,
+    baris terlama menurut rnv3_estimator diberi warna lain dan perkiraan waktu
+    setiap baris muncul sebagai tooltip.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.lines = []  # List ProgramLine, satu per baris program
+        self.current_row = -1  # Baris yang sedang dieksekusi (warna kuning)
+        self.warna_baris_aktif = QtGui.QBrush(QColor("#FFD700"))
+        self.perkiraan = {}  # Baris -> perkiraan detik
+        self.baris_lambat = frozenset()  # Baris terlama (warna oranye)
+        self.warna_baris_lambat = QtGui.QBrush(QColor("#FF8C00"))
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self.lines[row].text
+        if role == Qt.ForegroundRole:
+            if row == self.current_row:
+                return self.warna_baris_aktif
+            if row in self.baris_lambat:
+                return self.warna_baris_lambat
+        if role == Qt.ToolTipRole and row in self.perkiraan:
+            return f"Perkiraan {self.perkiraan[row]:.2f} s"
+        return None
+
+    def text(self, row):
+        return self.lines[row].text
+
+    def texts(self):
+        return [line.text for line in self.lines]
+
+    def set_text(self, row, text):
+        self.lines[row] = ProgramLine(text)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def append_line(self, text):
+        self.insert_line(len(self.lines), text)
+
+    def insert_line(self, row, text):
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.lines.insert(row, ProgramLine(text))
+        if self.current_row >= row:
+            self.current_row += 1
+        self.endInsertRows()
+
+    def remove_line(self, row):
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.lines[row]
+        if self.current_row == row:
+            self.current_row = -1
+        elif self.current_row > row:
+            self.current_row -= 1
+        self.endRemoveRows()
+
+    def move_line(self, row, new_row):
+        """ Tukar baris `row` dengan baris tetangganya `new_row`. """
+        tujuan = new_row + 1 if new_row > row else new_row
+        if not self.beginMoveRows(QtCore.QModelIndex(), row, row, QtCore.QModelIndex(), tujuan):
+            return
+        self.lines[row], self.lines[new_row] = self.lines[new_row], self.lines[row]
+        if self.current_row == row:
+            self.current_row = new_row
+        elif self.current_row == new_row:
+            self.current_row = row
+        self.endMoveRows()
+
+    def set_lines(self, lines):
+        """ Ganti seluruh program sekaligus (memuat file), satu kali reset model. """
+        self.beginResetModel()
+        self.lines = list(lines)
+        self.current_row = -1
+        self.endResetModel()
+
+    def clear(self):
+        self.set_lines([])
+
+    def set_estimates(self, perkiraan, lambat):
+        """ Perkiraan waktu per baris dan baris terlama dari rnv3_estimator. """
+        self.perkiraan = dict(perkiraan)
+        self.baris_lambat = frozenset(lambat)
+        if self.lines:
+            self.dataChanged.emit(self.index(0), self.index(len(self.lines) - 1),
+                                  [Qt.ForegroundRole, Qt.ToolTipRole])
+
+    def set_current_row(self, row):
+        """ Pindahkan tanda baris aktif, hanya baris lama dan baris baru yang diperbarui. """
+        lama = self.current_row
+        if lama == row:
+            return
+        self.current_row = row
+        for r in (lama, row):
+            if 0 <= r < len(self.lines):
+                index = self.index(r)
+                self.dataChanged.emit(index, index, [Qt.ForegroundRole])
               
    
 #===============================================================================================
+def startup_paint_selesai():
+    startup_profile.mark("paint pertama")
+    print(startup_profile.report())
+
+
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
+    startup_profile.mark("QApplication")
     RUSKOMPONEN_BOT = QtWidgets.QMainWindow()
     ui = Ui_RUSKOMPONEN_BOT()
     ui.setupUi(RUSKOMPONEN_BOT)
     RUSKOMPONEN_BOT.show()
+    startup_profile.mark("show (polish + stylesheet)")
+    if startup_profile_enabled():
+        # Dijalankan setelah event pertama diproses, yaitu setelah jendela tergambar
+        QTimer.singleShot(0, startup_paint_selesai)
     sys.exit(app.exec_())
     
 
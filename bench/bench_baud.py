@@ -0,0 +1,102 @@
+"""
+Uji negosiasi baud (rnv3_baud, M261) end-to-end: rnv3_runner dengan --baud terhadap
+emulator firmware di pty (rnv3_emulator.py) dalam beberapa skenario firmware. Hanya
+berjalan di Linux. Emulator membaca baud yang dipasang runner di pty, sehingga byte
+dengan baud berbeda dari firmware benar-benar rusak.
+
+Skenario:
+  - tetap      : tanpa --baud, tetap di 115200
+  - naik       : firmware menerima sampai 1000000
+  - maks-500k  : firmware menolak 1000000 (ERROR: BAUD NOT SUPPORTED), turun ke 500000
+  - rusak-1M   : firmware menerima 1000000 tapi jalur rusak di baud itu, konfirmasi
+                 gagal, keduanya kembali ke 115200 lalu mencoba 500000
+  - firmware-lama : M261 tidak dikenal, tetap di 115200
+
+Per skenario dicetak hasil negosiasi, waktu siklus rata-rata dan throughput serial
+efektif dari runner. Program robot di emulator didominasi waktu gerakan, jadi waktu
+siklus hampir sama; yang dilihat di sini adalah fallback-nya berjalan dan tidak
+menambah kegagalan.
+
+Pemakaian:
+    python bench/bench_baud.py [program.h] [--baud 1000000] [--loops 3] [--speed 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+sys.path.insert(0, ROOT)
+
+from rnv3_baud import BAUD_CANDIDATES  # noqa: E402
+
+SKENARIO = (
+    ("tetap", [], False),
+    ("naik", [], True),
+    ("maks-500k", ["--max-baud", "500000"], True),
+    ("rusak-1M", ["--bad-baud", "1000000"], True),
+    ("firmware-lama", ["--no-baud-switch"], True),
+)
+RUNNER_TIMEOUT = 120  # detik per skenario
+
+
+def start_emulator(speed, extra):
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "rnv3_emulator.py"), "--speed", str(speed)] + extra,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL, text=True)
+    return proc, proc.stdout.readline().strip()
+
+
+def run_runner(port, program, loops, baud):
+    """ Jalankan rnv3_runner, kembalikan (kode keluar, baris keluaran). """
+    cmd = [sys.executable, os.path.join(ROOT, "rnv3_runner.py"), program, "--port", port,
+           "--loops", str(loops)]
+    if baud:
+        cmd += ["--baud", str(baud)]
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    try:
+        hasil = subprocess.run(cmd, capture_output=True, text=True, timeout=RUNNER_TIMEOUT, env=env)
+    except subprocess.TimeoutExpired:
+        return None, []
+    return hasil.returncode, hasil.stdout.splitlines()
+
+
+def summary(lines, loops):
+    """ Baris keluaran runner yang relevan untuk negosiasi baud. """
+    prefixes = ("Baud", "Firmware tidak mengenal", "Timeout", "ERROR", f"{loops} siklus", "Serial:")
+    return [line for line in lines if line.startswith(prefixes)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji negosiasi baud M261 terhadap emulator firmware")
+    parser.add_argument("program", nargs="?", default=os.path.join(HERE, "programs", "pick_place_vacum.h"),
+                        help="File program .h (default bench/programs/pick_place_vacum.h)")
+    parser.add_argument("--baud", type=int, default=BAUD_CANDIDATES[0],
+                        help=f"Baud maksimum yang diminta runner (default {BAUD_CANDIDATES[0]})")
+    parser.add_argument("--loops", type=int, default=3, help="Jumlah putaran per skenario (default 3)")
+    parser.add_argument("--speed", type=float, default=10.0, help="Percepatan waktu emulator (default 10)")
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        print("Benchmark ini membutuhkan pty Linux.")
+        return 1
+
+    gagal = 0
+    for nama, extra, pakai_baud in SKENARIO:
+        proc, port = start_emulator(args.speed, extra)
+        try:
+            kode, lines = run_runner(port, args.program, args.loops, args.baud if pakai_baud else None)
+        finally:
+            proc.terminate()
+            proc.wait()
+        if kode != 0:
+            gagal += 1
+        print(f"{nama}: kode keluar {kode}")
+        for line in summary(lines, args.loops):
+            print(f"  {line}")
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Benchmark protokol biner (rnv3_binary): program yang sama dikirim sebagai baris
+G-code ASCII dan sebagai frame biner ke model firmware (rnv3_emulator.FirmwareModel)
+dalam waktu virtual, dengan jendela streaming yang sama seperti send_next_line.
+
+Yang dibandingkan per program:
+  - byte yang dikirim per siklus
+  - waktu siklus putaran kedua
+  - laju perintah (perintah yang dibalas "ok" per detik)
+Dengan --plan program dipecah dulu oleh rnv3_planner, sehingga jumlah perintahnya
+banyak dan jalur serial lebih berpengaruh. Model firmware hanya menghitung waktu
+kirim per byte dan --latency, waktu parsing per karakter di ATmega2560 tidak
+dimodelkan, jadi selisih sebenarnya di robot lebih besar.
+
+Pemakaian:
+    python bench/bench_binary.py [program.h ...] [--plan] [--window 4] [--latency 2] [--reaction 1]
+
+Tanpa program, semua bench/programs/*.h dipakai.
+"""
+import argparse
+import glob
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from rnv3_protocol import STREAM_WINDOW_DEFAULT  # noqa: E402
+from rnv3_planner import plan_trajectory  # noqa: E402
+from rnv3_binary import encode_plan, wire_bytes  # noqa: E402
+from bench_planner import load, stream_cycles  # noqa: E402
+
+
+def measure(plan, args):
+    selesai, limit = stream_cycles(plan, args.window, args.latency / 1000.0, args.reaction / 1000.0)
+    siklus = selesai[-1] - selesai[-2]
+    perintah = sum(step.expects_ok for step in plan)
+    return wire_bytes(plan), siklus, perintah / siklus if siklus > 0 else 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan protokol ASCII dan frame biner")
+    parser.add_argument("programs", nargs="*", help="File program .h (default bench/programs/*.h)")
+    parser.add_argument("--plan", action="store_true", help="Pecah gerakan panjang dengan rnv3_planner dulu")
+    parser.add_argument("--window", type=int, default=STREAM_WINDOW_DEFAULT,
+                        help=f"Ukuran jendela streaming (default {STREAM_WINDOW_DEFAULT})")
+    parser.add_argument("--latency", type=float, default=2.0, help="Latensi firmware per perintah, ms (default 2)")
+    parser.add_argument("--reaction", type=float, default=1.0,
+                        help="Jeda host dari 'ok' sampai baris berikutnya ditulis, ms (default 1)")
+    args = parser.parse_args(argv)
+    paths = args.programs or sorted(glob.glob(os.path.join(HERE, "programs", "*.h")))
+
+    print(f"{'program':<22}{'protokol':<10}{'byte':>8}{'siklus s':>10}{'perintah/s':>12}")
+    for path in paths:
+        nama = os.path.basename(path)
+        asli = load(path)
+        if args.plan:
+            asli, _ = plan_trajectory(asli)
+        hasil = {}
+        for label, plan in (("ascii", asli), ("biner", encode_plan(asli))):
+            hasil[label] = measure(plan, args)
+            nbyte, siklus, laju = hasil[label]
+            print(f"{nama:<22}{label:<10}{nbyte:>8}{siklus:>10.3f}{laju:>12.1f}")
+        (byte_lama, lama, _), (byte_baru, baru, _) = hasil["ascii"], hasil["biner"]
+        print(f"{'':<22}byte {100.0 * (byte_baru - byte_lama) / byte_lama:+.1f}%, "
+              f"waktu siklus {lama:.3f} s -> {baru:.3f} s ({100.0 * (baru - lama) / lama:+.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
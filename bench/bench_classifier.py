@@ -0,0 +1,113 @@
+"""
+Benchmark pengenal pesan firmware: rantai if/elif lama di read_serial
+dibandingkan classify_line (lookup tabel MESSAGE_EXACT/MESSAGE_PREFIX) di
+rnv3_protocol.
+
+Pemakaian:
+    python bench/bench_classifier.py [log ...]
+
+Tanpa argumen, semua file bench/logs/*.log dipakai. Log berisi keluaran
+serial firmware apa adanya, satu pesan per baris.
+"""
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from rnv3_protocol import (classify_line, MSG_OK, MSG_POSITION, MSG_SERVO_SETUP,  # noqa: E402
+                           MSG_HOMING_COMPLETE, MSG_READY_CALIBRATION, MSG_STOP, MSG_S1_ON,
+                           MSG_S1_OFF, MSG_S2_ON, MSG_S2_OFF, MSG_S3_ON, MSG_S3_OFF,
+                           MSG_RAIL_ON, MSG_RAIL_OFF, MSG_LINEAR_MOVE, MSG_SERVO_MOVE, MSG_ERROR)
+
+# Jenis yang tidak punya cabang di rantai lama, disamakan dengan None saat membandingkan
+LOG_ONLY = (MSG_LINEAR_MOVE, MSG_SERVO_MOVE, MSG_ERROR)
+
+
+def legacy_classify(line):
+    """ Salinan urutan pengecekan read_serial sebelum memakai classify_line. """
+    if "CURRENT POSITION:" in line:
+        return MSG_POSITION
+    elif "SETUP GRIPPER SERVO" in line:
+        return MSG_SERVO_SETUP
+    elif "HOMING COMPLETE" in line:
+        return MSG_HOMING_COMPLETE
+    elif "ok" in line.lower():
+        return MSG_OK
+    elif "stop" in line.lower():
+        return MSG_STOP
+    elif "S1 ON" in line:
+        return MSG_S1_ON
+    elif "S1 OFF" in line:
+        return MSG_S1_OFF
+    elif "S2 ON" in line:
+        return MSG_S2_ON
+    elif "S2 OFF" in line:
+        return MSG_S2_OFF
+    elif "S3 ON" in line:
+        return MSG_S3_ON
+    elif "S3 OFF" in line:
+        return MSG_S3_OFF
+    elif "RAIL OFF" in line:
+        return MSG_RAIL_OFF
+    elif "RAIL ON" in line:
+        return MSG_RAIL_ON
+    elif "READY CALIBRATION" in line:
+        return MSG_READY_CALIBRATION
+    return None
+
+
+def load_lines(paths):
+    lines = []
+    for path in paths:
+        with open(path, encoding="utf-8", errors="ignore") as f:
+            lines.extend(line.strip() for line in f if line.strip())
+    return lines
+
+
+def run(lines, repeat=5):
+    def loop(fn):
+        return lambda: [fn(line) for line in lines]
+
+    hasil = {}
+    for name, fn in (("if/elif lama", legacy_classify), ("classify_line", classify_line)):
+        number = max(1, 20000 // max(1, len(lines)))
+        best = min(timeit.repeat(loop(fn), number=number, repeat=repeat))
+        hasil[name] = best / (number * len(lines)) * 1e9
+    return hasil
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan rantai if/elif lama dengan classify_line")
+    parser.add_argument("logs", nargs="*", help="File log serial (default bench/logs/*.log)")
+    args = parser.parse_args(argv)
+    paths = args.logs or sorted(glob.glob(os.path.join(HERE, "logs", "*.log")))
+    if not paths:
+        print("Tidak ada file log.")
+        return 1
+    lines = load_lines(paths)
+    print(f"{len(lines)} baris dari {len(paths)} file log")
+
+    for name, ns in run(lines).items():
+        print(f"  {name:<15} {ns:8.1f} ns/baris")
+
+    # Baris yang diklasifikasikan berbeda oleh rantai lama
+    beda = {}
+    for line in lines:
+        baru = classify_line(line)
+        baru = None if baru in LOG_ONLY else baru
+        lama = legacy_classify(line)
+        if lama != baru:
+            beda.setdefault((line, lama, baru), 0)
+            beda[(line, lama, baru)] += 1
+    print(f"{sum(beda.values())} baris diklasifikasikan berbeda:")
+    for (line, lama, baru), count in sorted(beda.items(), key=lambda item: -item[1]):
+        print(f"  {count:5d}x {line!r}: lama={lama} baru={baru}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
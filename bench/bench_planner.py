@@ -0,0 +1,135 @@
+"""
+Benchmark planner lintasan (rnv3_planner): waktu siklus program apa adanya, satu
+perintah per titik, dibandingkan program yang gerakan panjangnya dipecah planner.
+
+Kedua rencana dikirim ke model firmware (rnv3_emulator.FirmwareModel) dalam waktu
+virtual dengan jendela streaming yang sama seperti send_next_line, ditambah jeda
+reaksi host setelah setiap "ok". Yang dibandingkan per program:
+  - waktu siklus putaran kedua (posisi awal sama dengan kondisi berulang)
+  - jumlah perintah yang dikirim per siklus
+  - kecepatan sudut motor tertinggi menurut kinematika firmware
+  - jumlah "LIMIT REACHED" (harus 0)
+
+Pemakaian:
+    python bench/bench_planner.py [program.h ...] [--window 4] [--latency 2] [--reaction 1]
+
+Tanpa program, semua bench/programs/*.h dipakai.
+"""
+import argparse
+import glob
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from rnv3_program import parse_program_file, compile_plan, last_acked_step  # noqa: E402
+from rnv3_protocol import StreamWindow, STREAM_WINDOW_DEFAULT, PRINT_REPLY_MSG  # noqa: E402
+from rnv3_emulator import FirmwareModel  # noqa: E402
+from rnv3_kinematics import plan_moves  # noqa: E402
+from rnv3_planner import plan_trajectory, format_report, speed_profiles, move_joint_speed  # noqa: E402
+
+CYCLES = 2
+LIMIT_MSG = "LIMIT REACHED"
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return compile_plan(parse_program_file(f))
+
+
+def stream_cycles(plan, window, latency, reaction, cycles=CYCLES):
+    """
+    Kirim rencana `cycles` kali ke model firmware dengan jendela streaming.
+    Mengembalikan (waktu 'ok' terakhir setiap putaran, jumlah LIMIT REACHED), waktu dalam detik.
+    """
+    model = FirmwareModel(latency=latency)
+    t = model.busy_until
+    model.run_until(t)
+    model.take_output()
+    jendela = StreamWindow(window)
+    akhir = last_acked_step(plan)
+    total = len(plan) * cycles
+    terkirim = 0
+    selesai = []
+    limit = 0
+    ok = 0  # 'ok' yang sudah diterima tetapi belum dicocokkan dengan jendela
+    while terkirim < total or jendela.in_flight:
+        # Isi jendela seperti fill_stream_window
+        while terkirim < total:
+            step = plan[terkirim % len(plan)]
+            if step.sync is not None:
+                if jendela.in_flight:
+                    break
+            elif not jendela.can_send(len(step.data)):
+                break
+            else:
+                model.receive(step.data, t)
+                if step.expects_ok:
+                    jendela.push(terkirim, len(step.data))
+            terkirim += 1
+        if not jendela.in_flight:
+            break  # Sisa langkah tanpa 'ok' di akhir putaran terakhir
+        # Tunggu 'ok' berikutnya, satu potong keluaran bisa berisi beberapa 'ok'
+        while not ok:
+            t = model.next_event()
+            model.run_until(t)
+            baris = model.take_output().decode().split("\r\n")
+            limit += sum(LIMIT_MSG in line for line in baris)
+            ok += baris.count(PRINT_REPLY_MSG)
+        ok -= 1
+        if jendela.ack() % len(plan) == akhir:
+            selesai.append(t)
+        t += reaction
+    return selesai, limit
+
+
+def peak_joint_speed(plan):
+    """ Kecepatan sudut motor tertinggi (rad/s) di putaran kedua rencana. """
+    steps, starts, ends, _, _ = plan_moves(plan, passes=2)
+    n = len(steps) // 2
+    aktif = speed_profiles(plan)
+    puncak = 0.0
+    for index, start, end in zip(steps[n:], starts[n:], ends[n:]):
+        values = plan[index].values
+        feed = values[4] if values is not None else None
+        puncak = max(puncak, move_joint_speed(start, end, feed, aktif[index]))
+    return puncak
+
+
+def measure(plan, args):
+    selesai, limit = stream_cycles(plan, args.window, args.latency / 1000.0, args.reaction / 1000.0)
+    siklus = selesai[-1] - selesai[-2]
+    perintah = sum(step.expects_ok for step in plan)
+    return siklus, perintah, peak_joint_speed(plan), limit
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bandingkan waktu siklus dengan dan tanpa planner")
+    parser.add_argument("programs", nargs="*", help="File program .h (default bench/programs/*.h)")
+    parser.add_argument("--window", type=int, default=STREAM_WINDOW_DEFAULT,
+                        help=f"Ukuran jendela streaming (default {STREAM_WINDOW_DEFAULT})")
+    parser.add_argument("--latency", type=float, default=2.0, help="Latensi firmware per perintah, ms (default 2)")
+    parser.add_argument("--reaction", type=float, default=1.0,
+                        help="Jeda host dari 'ok' sampai baris berikutnya ditulis, ms (default 1)")
+    args = parser.parse_args(argv)
+    paths = args.programs or sorted(glob.glob(os.path.join(HERE, "programs", "*.h")))
+
+    print(f"{'program':<22}{'rencana':<10}{'siklus s':>10}{'perintah':>10}{'rad/s':>8}{'limit':>7}")
+    for path in paths:
+        nama = os.path.basename(path)
+        asli = load(path)
+        rencana, laporan = plan_trajectory(asli)
+        hasil = {}
+        for label, plan in (("asli", asli), ("planner", rencana)):
+            hasil[label] = measure(plan, args)
+            siklus, perintah, puncak, limit = hasil[label]
+            print(f"{nama:<22}{label:<10}{siklus:>10.3f}{perintah:>10}{puncak:>8.2f}{limit:>7}")
+        lama, baru = hasil["asli"][0], hasil["planner"][0]
+        print(f"{'':<22}{format_report(laporan)}")
+        print(f"{'':<22}waktu siklus {lama:.3f} s -> {baru:.3f} s ({100.0 * (baru - lama) / lama:+.1f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
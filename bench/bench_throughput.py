@@ -0,0 +1,309 @@
+"""
+Benchmark throughput eksekusi program end-to-end: tombol Start di GUI
+(fungsi_pushButton_star -> send_next_line -> handle_ok) terhadap emulator
+firmware di pty (rnv3_emulator.py). Hanya berjalan di Linux.
+
+Yang diukur per program:
+  - latensi per perintah: tulis ke serial sampai "ok" diterima thread I/O
+  - reaksi host: "ok" diterima sampai baris berikutnya ditulis (overhead aplikasi)
+  - waktu device: lama eksekusi per perintah menurut model firmware
+  - waktu idle robot: jarak antar "ok" dikurangi waktu device
+  - waktu siklus terukur dibandingkan waktu siklus device
+
+Pemakaian:
+    python bench/bench_throughput.py [program.h ...] [--cycles 5] [--latency 2]
+        [--speed 20] [--window 4] [--output hasil.json] [--compare lama.json]
+
+Tanpa program, semua bench/programs/*.h dipakai. Hasil disimpan sebagai JSON
+(default bench/results/throughput-<commit>.json) agar regresi antar versi
+terlihat dengan --compare.
+"""
+import argparse
+import contextlib
+import glob
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtCore, QtWidgets  # noqa: E402
+
+from rnv3_program import parse_program_file, compile_plan  # noqa: E402
+from rnv3_protocol import StreamWindow, PRINT_REPLY_MSG  # noqa: E402
+from rnv3_emulator import FirmwareModel, BAUD  # noqa: E402
+
+PERCENTILES = (50, 90, 99)
+READY_TIMEOUT = 10.0  # detik menunggu "READY CALIBRATION"
+
+gui_windows = []  # Jendela yang sudah dipakai, dibiarkan hidup sampai proses selesai
+
+
+def percentiles(values):
+    """ Ringkasan ms: p50/p90/p99/max/mean, None jika kosong. """
+    if not values:
+        return None
+    ordered = sorted(values)
+    hasil = {}
+    for p in PERCENTILES:
+        index = min(len(ordered) - 1, int(round(p / 100.0 * (len(ordered) - 1))))
+        hasil[f"p{p}"] = round(ordered[index] * 1000, 3)
+    hasil["max"] = round(ordered[-1] * 1000, 3)
+    hasil["mean"] = round(statistics.fmean(ordered) * 1000, 3)
+    return hasil
+
+
+def device_times(plan, latency, baud=BAUD):
+    """
+    Lama eksekusi (detik, waktu firmware) setiap langkah yang dibalas 'ok', dari byte
+    terakhir diterima sampai 'ok'. Diambil dari putaran kedua agar posisi awal sama
+    dengan kondisi berulang.
+    """
+    model = FirmwareModel(baud=baud, latency=latency)
+    t = model.busy_until
+    model.run_until(t)
+    model.take_output()
+    times = {}
+    for putaran in range(2):
+        for position, step in enumerate(plan):
+            model.receive(step.data, t)
+            arrive = t + len(step.data) * model.byte_time
+            if not step.expects_ok:
+                model.run_until(arrive)
+                model.take_output()
+                t = arrive
+                continue
+            while True:
+                t = model.next_event()
+                model.run_until(t)
+                if PRINT_REPLY_MSG in model.take_output().decode().split("\r\n"):
+                    break
+            times[position] = t - arrive
+    return times
+
+
+class Probe:
+    """ Mencatat waktu tulis dan waktu 'ok' di SerialLink milik GUI. """
+
+    def __init__(self, link):
+        self.writes = []  # (waktu, data)
+        self.oks = []  # Cap waktu thread I/O saat 'ok' diterima
+        write = link.write
+        take_lines = link.take_lines
+
+        def probe_write(data):
+            self.writes.append((time.monotonic(), bytes(data)))
+            return write(data)
+
+        def probe_take_lines():
+            batch = take_lines()
+            self.oks.extend(stamp for stamp, line in batch if line == PRINT_REPLY_MSG)
+            return batch
+
+        link.write = probe_write
+        link.take_lines = probe_take_lines
+
+
+def wait_until(condition, timeout):
+    """ Jalankan event loop Qt sampai `condition()` benar atau waktu habis. """
+    loop = QtCore.QEventLoop()
+    timer = QtCore.QTimer()
+    timer.timeout.connect(lambda: loop.quit() if condition() else None)
+    timer.start(5)
+    deadline = QtCore.QTimer()
+    deadline.setSingleShot(True)
+    deadline.timeout.connect(loop.quit)
+    deadline.start(int(timeout * 1000))
+    loop.exec_()
+    timer.stop()
+    deadline.stop()
+    return condition()
+
+
+def start_emulator(speed, latency_ms):
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "rnv3_emulator.py"),
+         "--speed", str(speed), "--latency", str(latency_ms)],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL, text=True)
+    return proc, proc.stdout.readline().strip()
+
+
+def run_program(gui, path, args):
+    """ Jalankan satu program sebanyak args.cycles putaran, kembalikan dict hasil. """
+    with open(path, encoding="utf-8") as f:
+        program = parse_program_file(f)
+    plan = compile_plan(program)
+    device = device_times(plan, args.latency / 1000.0)
+    device_wall = {position: t / args.speed for position, t in device.items()}
+
+    proc, port = start_emulator(args.speed, args.latency)
+    win = QtWidgets.QMainWindow()
+    ui = gui.Ui_RUSKOMPONEN_BOT()
+    try:
+        with contextlib.redirect_stdout(open(os.devnull, "w")):
+            ui.setupUi(win)
+            ui.lineEdit_com.setMaxLength(64)  # Path pty lebih panjang dari nama COM
+            ui.lineEdit_com.setText(port)
+            ui.stream_window = StreamWindow(args.window)
+            ui.program_model.set_lines(program)
+            ui.pushButton_sambungkan.setChecked(True)
+            ui.fungsi_pushButton_sambungkan()
+            if ui.serial is None or not wait_until(lambda: ui.ready_calibration_detected, READY_TIMEOUT):
+                raise RuntimeError(f"Emulator di {port} tidak mengirim READY CALIBRATION")
+            probe = Probe(ui.serial)
+
+            mulai = time.monotonic()
+            ui.fungsi_pushButton_star()
+            # Batas waktu longgar: sepuluh kali waktu device ditambah 10 detik
+            batas = 10 * sum(device_wall.values()) * args.cycles + 10
+            wait_until(lambda: ui.cycle_stats.cycles >= args.cycles, batas)
+            total = time.monotonic() - mulai
+            siklus = list(ui.cycle_stats.recent)
+            ui.fungsi_pushButton_stop()
+            ui.serial.close()
+            ui.serial = None
+    finally:
+        proc.terminate()
+        proc.wait()
+        gui_windows.append((win, ui))  # Timer GUI masih bisa berjalan, jangan hapus widget-nya
+
+    if len(siklus) < args.cycles:
+        raise RuntimeError(f"{os.path.basename(path)}: hanya {len(siklus)} dari {args.cycles} siklus selesai")
+
+    # Pasangkan setiap tulisan yang dibalas 'ok' dengan 'ok' berikutnya (urutan firmware sama)
+    acked = [(t, data) for t, data in probe.writes if data in {step.data for step in plan if step.expects_ok}]
+    steps = [position for position, step in enumerate(plan) if step.expects_ok]
+    latency, reaction, idle, device_used = [], [], [], []
+    write_times = [t for t, data in probe.writes]
+    w = 0
+    for i, ok in enumerate(probe.oks[:len(acked)]):
+        latency.append(ok - acked[i][0])
+        # Reaksi host: tulisan pertama setelah 'ok' ini, sebelum 'ok' berikutnya
+        while w < len(write_times) and write_times[w] < ok:
+            w += 1
+        berikut = probe.oks[i + 1] if i + 1 < len(probe.oks) else None
+        if w < len(write_times) and (berikut is None or write_times[w] < berikut):
+            reaction.append(write_times[w] - ok)
+        if i > 0:
+            waktu_device = device_wall[steps[i % len(steps)]]
+            device_used.append(waktu_device)
+            idle.append(max(0.0, ok - probe.oks[i - 1] - waktu_device))
+
+    device_cycle = sum(device_wall.values())
+    steady = siklus[1:] or siklus  # Siklus pertama termasuk waktu mulai
+    mean_cycle = statistics.fmean(steady)
+    return {
+        "program": os.path.relpath(path, ROOT),
+        "steps": len(plan),
+        "cycles": len(siklus),
+        "commands": len(probe.oks),
+        "total_s": round(total, 3),
+        "commands_per_s": round(len(probe.oks) / total, 2) if total else None,
+        "command_latency_ms": percentiles(latency),
+        "host_reaction_ms": percentiles(reaction),
+        "device_time_ms": percentiles(device_used),
+        "robot_idle_ms": percentiles(idle),
+        "host_share": round(sum(idle) / (sum(idle) + sum(device_used)), 4) if device_used else None,
+        "cycle_s": {
+            "measured_mean": round(mean_cycle, 4),
+            "measured_min": round(min(steady), 4),
+            "measured_max": round(max(steady), 4),
+            "device": round(device_cycle, 4),
+            "overhead": round(mean_cycle - device_cycle, 4),
+            "units_per_hour": round(3600.0 / mean_cycle, 1) if mean_cycle > 0 else None,
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_result(hasil, lama=None):
+    siklus = hasil["cycle_s"]
+    print(f"{hasil['program']}: {hasil['commands']} perintah, {hasil['commands_per_s']} perintah/s")
+    for key in ("command_latency_ms", "host_reaction_ms", "device_time_ms", "robot_idle_ms"):
+        p = hasil[key]
+        if p:
+            print(f"  {key:<20} p50 {p['p50']:9.3f}  p90 {p['p90']:9.3f}  p99 {p['p99']:9.3f}  maks {p['max']:9.3f}")
+    print(f"  siklus: {siklus['measured_mean']:.3f} s (device {siklus['device']:.3f} s, "
+          f"overhead {siklus['overhead'] * 1000:.1f} ms), {siklus['units_per_hour']} unit/jam")
+    if lama:
+        beda = siklus["measured_mean"] - lama["cycle_s"]["measured_mean"]
+        reaksi_lama = (lama.get("host_reaction_ms") or {}).get("p50")
+        reaksi = (hasil.get("host_reaction_ms") or {}).get("p50")
+        pesan = f"  dibanding sebelumnya: siklus {beda * 1000:+.1f} ms"
+        if reaksi is not None and reaksi_lama is not None:
+            pesan += f", reaksi host p50 {reaksi - reaksi_lama:+.3f} ms"
+        print(pesan)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Benchmark throughput program terhadap emulator firmware")
+    parser.add_argument("programs", nargs="*", help="File program .h (default bench/programs/*.h)")
+    parser.add_argument("--cycles", type=int, default=5, help="Jumlah siklus per program")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latensi firmware sebelum 'ok' (ms)")
+    parser.add_argument("--speed", type=float, default=20.0, help="Percepatan waktu emulator")
+    parser.add_argument("--window", type=int, default=4, help="Ukuran jendela streaming")
+    parser.add_argument("--output", help="File hasil JSON")
+    parser.add_argument("--compare", help="File hasil JSON sebelumnya untuk dibandingkan")
+    args = parser.parse_args(argv)
+
+    if not sys.platform.startswith("linux"):
+        print("Benchmark ini membutuhkan pty Linux.")
+        return 1
+    paths = args.programs or sorted(glob.glob(os.path.join(HERE, "programs", "*.h")))
+    if not paths:
+        print("Tidak ada file program.")
+        return 1
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv[:1])  # noqa: F841
+    import Ruskomponen_BOT_BLK as gui
+
+    lama = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            lama = {hasil["program"]: hasil for hasil in json.load(f)["results"]}
+
+    results = []
+    for path in paths:
+        hasil = run_program(gui, path, args)
+        results.append(hasil)
+        print_result(hasil, lama.get(hasil["program"]))
+
+    commit = git_commit()
+    output = args.output or os.path.join(HERE, "results", f"throughput-{commit or int(time.time())}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "commit": commit,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "settings": {"cycles": args.cycles, "latency_ms": args.latency, "speed": args.speed,
+                         "window": args.window},
+            "results": results,
+        }, f, indent=2)
+    print(f"Hasil disimpan di {output}")
+
+    # Tanpa app.exec_() sinyal aboutToQuit tidak pernah terpancar, hentikan thread I/O di sini
+    for win, ui in gui_windows:
+        if ui.serial_io_thread is not None:
+            ui.serial_io_thread.quit()
+            ui.serial_io_thread.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,19 @@
+// File ini dihasilkan secara otomatis
+// Ruskomponen
+    "G0 X0,00 Y217,00 Z57,00 E0,00 F0,00",
+    "LG1 ON",
+    "LG1 OFF",
+    "G0 X1,00 Y217,00 Z57,00 E0,00 F0,00",
+    "LG2 ON",
+    "LG2 OFF",
+    "G0 X2,00 Y217,00 Z57,00 E0,00 F0,00",
+    "LG1 ON",
+    "LG1 OFF",
+    "G0 X1,00 Y217,00 Z57,00 E0,00 F0,00",
+    "LG2 ON",
+    "LG2 OFF",
+    "G100 B115,00",
+    "LG1 ON",
+    "LG1 OFF",
+    "LG2 ON",
+    "LG2 OFF"
@@ -0,0 +1,12 @@
+// File ini dihasilkan secara otomatis
+// Ruskomponen
+    "G0 X0,00 Y217,00 Z57,00 E0,00 F0,00",
+    "G0 X120,00 Y180,00 Z57,00 E0,00 F0,00",
+    "G0 X120,00 Y180,00 Z-96,00 E0,00 F0,00",
+    "VACUM ON",
+    "G0 X120,00 Y180,00 Z57,00 E0,00 F0,00",
+    "G0 X-120,00 Y180,00 Z57,00 E0,00 F0,00",
+    "G0 X-120,00 Y180,00 Z-96,00 E0,00 F0,00",
+    "VACUM OFF",
+    "G0 X-120,00 Y180,00 Z57,00 E0,00 F0,00",
+    "G0 X0,00 Y217,00 Z57,00 E0,00 F0,00"
@@ -0,0 +1,98 @@
+from math import gcd
+
+from PyQt5 import QtCore
+
+# Satu jam animasi untuk semua efek kedip di jendela utama, menggantikan satu
+# QTimer per tombol. Semua efek berjalan sefase dan event loop hanya dibangunkan
+# satu timer. Jam berhenti total saat tidak ada efek aktif atau jendela diminimize.
+
+
+class AnimationEffect:
+    """
+    Satu efek berkala di AnimationClock. start/stop/isActive sama dengan QTimer
+    sehingga bisa dipakai di tempat blink_timer yang lama.
+    """
+
+    def __init__(self, clock, callback):
+        self.clock = clock
+        self.callback = callback
+        self.period_ms = None
+
+    def start(self, period_ms):
+        self.clock.add(self, period_ms)
+
+    def stop(self):
+        self.clock.remove(self)
+
+    def isActive(self):
+        return self.period_ms is not None
+
+
+class AnimationClock(QtCore.QObject):
+    """
+    Timer bersama untuk AnimationEffect. Interval timer adalah FPB periode efek yang
+    aktif, jadi satu efek 500 ms tetap hanya membangunkan event loop tiap 500 ms.
+    Efek dengan periode yang sama selalu berganti keadaan pada tick yang sama.
+    """
+
+    def __init__(self, window=None, parent=None):
+        super().__init__(parent)
+        self.effects = []  # AnimationEffect yang aktif
+        self.elapsed_ms = 0  # Waktu jam sejak mulai, dasar fase semua efek
+        self.paused = False
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.tick)
+        self.window = window
+        if window is not None:
+            # Berhenti saat jendela diminimize, lanjut saat dibuka lagi
+            window.installEventFilter(self)
+
+    def effect(self, callback):
+        """ Buat efek baru yang memanggil `callback` setiap periodenya. """
+        return AnimationEffect(self, callback)
+
+    def add(self, effect, period_ms):
+        if effect.period_ms == period_ms:
+            return  # Sudah berjalan dengan periode sama, fase tidak diubah
+        if not self.effects:
+            self.elapsed_ms = 0
+        effect.period_ms = period_ms
+        if effect not in self.effects:
+            self.effects.append(effect)
+        self.update_timer()
+
+    def remove(self, effect):
+        if effect.period_ms is None:
+            return
+        effect.period_ms = None
+        self.effects.remove(effect)
+        self.update_timer()
+
+    def update_timer(self):
+        if not self.effects or self.paused:
+            self.timer.stop()
+            return
+        interval = 0
+        for effect in self.effects:
+            interval = gcd(interval, effect.period_ms)
+        # Jaga fase: waktu jam dibulatkan ke kelipatan interval baru
+        self.elapsed_ms -= self.elapsed_ms % interval
+        if self.timer.interval() != interval or not self.timer.isActive():
+            self.timer.start(interval)
+
+    def tick(self):
+        self.elapsed_ms += self.timer.interval()
+        for effect in tuple(self.effects):  # Callback boleh menghentikan efek
+            if effect.period_ms is not None and self.elapsed_ms % effect.period_ms == 0:
+                effect.callback()
+
+    def set_paused(self, paused):
+        if self.paused != paused:
+            self.paused = paused
+            self.update_timer()
+
+    def eventFilter(self, source, event):
+        if source is self.window and event.type() in (QtCore.QEvent.WindowStateChange, QtCore.QEvent.Hide,
+                                                      QtCore.QEvent.Show):
+            self.set_paused(self.window.isMinimized() or not self.window.isVisible())
+        return super().eventFilter(source, event)
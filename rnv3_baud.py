@@ -0,0 +1,189 @@
+import os
+import re
+import sys
+import time
+
+from PyQt5 import QtCore
+
+# Menaikkan baud rate serial setelah tersambung.
+#
+# Firmware selalu mulai di BAUD_DEFAULT (config.h BAUD). Aplikasi meminta baud lebih
+# tinggi dengan "M261 S<baud>": firmware membalas "BAUD: [<baud>]" dan "ok" di baud
+# lama, lalu pindah. Aplikasi ikut pindah dan mengirim "M261" (tanpa S) sebagai
+# konfirmasi. Jika konfirmasi tidak dibalas dalam BAUD_PROBE_TIMEOUT_MS, aplikasi
+# mengirim "M261 S115200" di baud baru (untuk firmware yang sudah terkonfirmasi),
+# kembali ke BAUD_DEFAULT, menunggu firmware membatalkan baud baru sendiri
+# (BAUD_CONFIRM_MS tanpa konfirmasi), lalu mencoba baud berikutnya yang lebih rendah.
+# Firmware lama membalas "ERROR: COMMAND NOT RECOGNIZED" dan sambungan tetap di
+# BAUD_DEFAULT.
+#
+# Di aplikasi baud dinaikkan jika dijalankan dengan --baud <maks> atau environment
+# RNV3_BAUD=<maks>, di rnv3_runner/rnv3_cell dengan --baud <maks>.
+
+ENV_BAUD = "RNV3_BAUD"
+ARG_BAUD = "--baud"
+
+BAUD_DEFAULT = 115200  # config.h BAUD, baud setelah reset
+BAUD_CANDIDATES = (1000000, 500000, 250000)  # Tanpa galat pembagi di ATmega2560 16 MHz (U2X)
+BAUD_QUERY = "M261"
+BAUD_SWITCH_TIMEOUT_MS = 3000  # Batas waktu 'ok' M261 S<baud> di baud lama
+BAUD_PROBE_TIMEOUT_MS = 300  # Batas waktu 'ok' konfirmasi di baud baru
+BAUD_CONFIRM_MS = 1000  # config.h BAUD_CONFIRM_MS, firmware kembali ke BAUD_DEFAULT setelah ini
+BAUD_REVERT_MARGIN_MS = 200  # Tambahan tunggu setelah gagal, sebelum mencoba baud berikutnya
+
+_BAUD_RE = re.compile(r'BAUD:\s*\[(\d+)\]')
+UNKNOWN_COMMAND = "ERROR: COMMAND NOT RECOGNIZED"
+
+
+def requested_baud(argv=None):
+    """ Baud maksimum yang diminta lewat --baud <maks> atau environment, None jika tidak diminta. """
+    argv = sys.argv if argv is None else argv
+    value = None
+    if ARG_BAUD in argv[:-1]:
+        value = argv[argv.index(ARG_BAUD) + 1]
+    elif os.environ.get(ENV_BAUD):
+        value = os.environ[ENV_BAUD]
+    try:
+        return int(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def candidates(max_baud):
+    """ Baud yang dicoba untuk batas `max_baud`, tertinggi lebih dulu. """
+    if not max_baud:
+        return ()
+    return tuple(baud for baud in BAUD_CANDIDATES if BAUD_DEFAULT < baud <= max_baud)
+
+
+def reported_baud(line):
+    """ Baud dari balasan M261, None jika baris bukan balasan itu. """
+    match = _BAUD_RE.match(line)
+    return int(match.group(1)) if match else None
+
+
+def line_rate(baud):
+    """ Byte per detik maksimum di jalur serial 8N1. """
+    return baud / 10.0
+
+
+def format_report(negotiator):
+    """ Satu baris hasil negosiasi untuk ditampilkan. """
+    if negotiator.unknown:
+        pesan = f"Firmware tidak mengenal {BAUD_QUERY}, tetap di {BAUD_DEFAULT} baud"
+    elif negotiator.baud == BAUD_DEFAULT:
+        pesan = f"Baud tetap {BAUD_DEFAULT}"
+    else:
+        pesan = f"Baud {BAUD_DEFAULT} -> {negotiator.baud}, konfirmasi {negotiator.round_trip * 1000:.1f} ms"
+    pesan += f" (maks {line_rate(negotiator.baud) / 1000:.1f} KB/s)"
+    if negotiator.failed:
+        pesan += ", gagal: " + ", ".join(str(baud) for baud in negotiator.failed)
+    return pesan
+
+
+def format_throughput(link, seconds):
+    """ Throughput efektif sambungan: byte dikirim dan diterima selama `seconds` detik. """
+    sent, received = link.bytes_written, link.bytes_read()
+    if seconds <= 0:
+        return f"Serial: {sent} byte dikirim, {received} byte diterima"
+    return (f"Serial: {sent} byte dikirim ({sent / seconds / 1000:.2f} KB/s), "
+            f"{received} byte diterima ({received / seconds / 1000:.2f} KB/s) dalam {seconds:.1f} s")
+
+
+class BaudNegotiator(QtCore.QObject):
+    """
+    Urutan M261 di atas untuk satu sambungan. Pemilik sambungan memberikan:
+      - link   : SerialLink (write, set_baud)
+      - send   : send(perintah, timeout_ms, on_ok, on_timeout), menulis perintah yang
+                 dibalas 'ok' lewat AckTracker pemiliknya
+      - resync : (opsional) AckTracker.drop_expired pemiliknya, membuang perintah yang
+                 sudah timeout karena balasannya hilang di baud yang gagal
+    dan meneruskan setiap baris dari firmware ke handle_line selama negosiasi berjalan.
+    Selesai dengan memancarkan finished(baud akhir); `report` berisi ringkasannya.
+    """
+
+    finished = QtCore.pyqtSignal(int)
+
+    def __init__(self, link, send, max_baud, parent=None, resync=None):
+        super().__init__(parent)
+        self.link = link
+        self.send = send
+        self.resync = resync
+        self.remaining = list(candidates(max_baud))
+        self.baud = BAUD_DEFAULT
+        self.trying = None  # Baud yang sedang dicoba
+        self.reported = None  # Baud di balasan M261 terakhir
+        self.unknown = False  # Firmware tidak mengenal M261
+        self.failed = []  # Baud yang gagal dikonfirmasi
+        self.probe_started = None
+        self.round_trip = None  # Detik dari M261 konfirmasi ditulis sampai 'ok'-nya diterima
+        self.report = None
+        self.active = False
+
+    def start(self):
+        self.active = True
+        self.try_next()
+
+    def handle_line(self, line):
+        if not self.active:
+            return
+        if line == UNKNOWN_COMMAND:
+            self.unknown = True
+            return
+        baud = reported_baud(line)
+        if baud is not None:
+            self.reported = baud
+
+    def stop(self):
+        """ Sambungan ditutup di tengah negosiasi, langkah berikutnya tidak dijalankan. """
+        self.active = False
+
+    def try_next(self):
+        if not self.active:
+            return
+        if self.unknown or not self.remaining:
+            self.finish()
+            return
+        self.trying = self.remaining.pop(0)
+        self.reported = None
+        self.send(f"{BAUD_QUERY} S{self.trying}", BAUD_SWITCH_TIMEOUT_MS, self.switch, self.finish)
+
+    def switch(self):
+        """ 'ok' M261 S<baud> diterima di baud lama, firmware sekarang pindah. """
+        if self.reported != self.trying:
+            self.try_next()  # Firmware tidak mendukung baud ini (atau tidak mengenal M261)
+            return
+        self.link.set_baud(self.trying)
+        self.reported = None
+        self.probe_started = time.monotonic()
+        self.send(BAUD_QUERY, BAUD_PROBE_TIMEOUT_MS, self.confirmed, self.probe_failed)
+
+    def confirmed(self):
+        if self.reported != self.trying:
+            self.probe_failed()
+            return
+        self.baud = self.trying
+        self.round_trip = time.monotonic() - self.probe_started
+        self.finish()
+
+    def probe_failed(self):
+        """ Kembali ke baud lama, firmware yang belum terkonfirmasi kembali sendiri. """
+        self.failed.append(self.trying)
+        # Lewat send seperti perintah lain, agar 'ok'-nya tidak tergeser ke perintah berikutnya.
+        # Batas waktunya sekaligus waktu tunggu sampai firmware kembali ke BAUD_DEFAULT.
+        self.send(f"{BAUD_QUERY} S{BAUD_DEFAULT}", BAUD_CONFIRM_MS + BAUD_REVERT_MARGIN_MS,
+                  self.reverted, self.reverted)
+        self.link.set_baud(BAUD_DEFAULT)
+
+    def reverted(self):
+        """ Firmware sudah kembali ke BAUD_DEFAULT, balasan dari baud yang gagal tidak akan terbaca. """
+        if self.resync is not None:
+            self.resync()
+        self.try_next()
+
+    def finish(self):
+        if not self.active:
+            return
+        self.active = False
+        self.report = format_report(self)
+        self.finished.emit(self.baud)
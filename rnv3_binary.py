@@ -0,0 +1,160 @@
+import os
+import re
+import sys
+
+from rnv3_protocol import parse_command
+
+# Protokol biner ringkas antara aplikasi dan firmware (Command::handleGcode dan
+# Command::processFrame di command.cpp).
+#
+# Satu perintah G/M dikirim sebagai frame:
+#   A5 | panjang | kode (2 byte) | mask (1 byte) | nilai (3 byte per bit mask) | CRC-8
+#   - kode   : uint16 little endian, nomor perintah, bit 15 = perintah M
+#   - mask   : bit 0..7 = X Y Z E F S A B yang ikut dikirim
+#   - nilai  : int24 little endian, fixed-point x100 (S x1000, detik -> ms)
+#   - CRC-8  : polinomial 0x07, dihitung dari byte panjang sampai nilai terakhir
+# Sumbu yang tidak dikirim sama artinya dengan huruf yang tidak ditulis di G-code:
+# X/Y/Z/E tetap di posisinya, F dan S 0, A dan B memakai nilai sebelumnya.
+# Byte 0xA5 tidak pernah muncul di teks ASCII, jadi firmware bisa menerima frame dan
+# baris G-code biasa bergantian tanpa pindah mode.
+#
+# Firmware lama tidak mengenal frame, jadi aplikasi bertanya dulu dengan M260 setelah
+# READY CALIBRATION. Firmware baru membalas "PROTOCOL: [BINARY 1]", firmware lama
+# membalas "ERROR: COMMAND NOT RECOGNIZED" dan program tetap dikirim sebagai ASCII.
+#
+# Di aplikasi protokol biner dicoba jika dijalankan dengan --binary atau environment
+# RNV3_BINARY=1, di rnv3_runner/rnv3_cell dengan --binary.
+
+ENV_BINARY = "RNV3_BINARY"
+ARG_BINARY = "--binary"
+
+PROTOCOL_QUERY = "M260"  # Firmware membalas versi frame yang dikenalnya
+PROTOCOL_VERSION = 1
+
+FRAME_START = 0xA5
+FIELDS = "XYZEFSAB"  # Urutan bit mask
+SCALES = {"S": 1000}  # Selain ini x100
+FIXED_MAX = (1 << 23) - 1
+MIN_PAYLOAD = 3  # kode + mask
+MAX_PAYLOAD = MIN_PAYLOAD + 3 * len(FIELDS)
+NUM_MAX = 0x7FFF
+# F dan S tidak perlu dikirim jika 0, processMessage juga mengisinya 0
+DEFAULTS = {"F": 0.0, "S": 0.0}
+
+_PROTOCOL_RE = re.compile(r'PROTOCOL:\s*\[BINARY\s+(\d+)\]')
+
+
+def enabled(argv=None):
+    """ Protokol biner diminta lewat argumen atau environment. """
+    argv = sys.argv if argv is None else argv
+    return ARG_BINARY in argv or os.environ.get(ENV_BINARY) == "1"
+
+
+def protocol_version(line):
+    """ Versi frame dari balasan M260, None jika baris bukan balasan itu. """
+    match = _PROTOCOL_RE.match(line)
+    return int(match.group(1)) if match else None
+
+
+def crc8(data):
+    """ CRC-8 polinomial 0x07 tanpa refleksi, nilai awal 0 (sama dengan crc8 di command.cpp). """
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x07) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+    return crc
+
+
+def _fixed(value, scale):
+    """ Nilai fixed-point, None jika tidak bisa dikirim tanpa mengubah nilainya. """
+    raw = round(value * scale)
+    if abs(raw - value * scale) > 1e-6 or abs(raw) > FIXED_MAX:
+        return None
+    return raw
+
+
+def encode_command(message):
+    """
+    Frame untuk satu baris G-code (tanpa terminator), atau None jika baris itu harus
+    tetap dikirim sebagai ASCII: bukan perintah G/M, nomor di luar rentang, atau nilai
+    yang tidak pas di fixed-point (misal X12.345). Nilai dibaca seperti processMessage.
+    """
+    parsed = parse_command(message)
+    if parsed is None:
+        return None
+    letter, num, fields = parsed
+    if not 0 <= num <= NUM_MAX:
+        return None
+    code = num | (0x8000 if letter == "M" else 0)
+    mask = 0
+    values = bytearray()
+    for bit, axis in enumerate(FIELDS):
+        if axis not in fields or fields[axis] == DEFAULTS.get(axis):
+            continue
+        raw = _fixed(fields[axis], SCALES.get(axis, 100))
+        if raw is None:
+            return None
+        mask |= 1 << bit
+        values += (raw & 0xFFFFFF).to_bytes(3, "little")
+    body = bytes((MIN_PAYLOAD + len(values),)) + code.to_bytes(2, "little") + bytes((mask,)) + values
+    return bytes((FRAME_START,)) + body + bytes((crc8(body),))
+
+
+def decode_frame(frame):
+    """
+    Kebalikan encode_command untuk satu frame lengkap (mulai dari 0xA5). Mengembalikan
+    (huruf, nomor, {huruf nilai: angka}) seperti parse_command. ValueError dengan teks
+    yang sama dengan pesan error firmware jika frame rusak.
+    """
+    if len(frame) < 2 or frame[0] != FRAME_START or not MIN_PAYLOAD <= frame[1] <= MAX_PAYLOAD:
+        raise ValueError("FRAME LENGTH")
+    size = frame[1]
+    if len(frame) != size + 3:
+        raise ValueError("FRAME LENGTH")
+    if crc8(frame[1:size + 2]) != frame[size + 2]:
+        raise ValueError("FRAME CRC")
+    code = int.from_bytes(frame[2:4], "little")
+    mask = frame[4]
+    if MIN_PAYLOAD + 3 * bin(mask).count("1") != size:
+        raise ValueError("FRAME LENGTH")
+    fields = {}
+    index = 5
+    for bit, axis in enumerate(FIELDS):
+        if mask & (1 << bit):
+            raw = int.from_bytes(frame[index:index + 3], "little", signed=True)
+            fields[axis] = raw / SCALES.get(axis, 100)
+            index += 3
+    return ("M" if code & 0x8000 else "G"), code & NUM_MAX, fields
+
+
+def encode_plan(plan):
+    """
+    Rencana eksekusi dengan `data` setiap langkah yang bisa dikirim sebagai frame
+    diganti frame-nya, kecuali jika frame lebih panjang dari barisnya (misal G28).
+    Teks perintah, kebijakan ack dan batas waktu tidak berubah, sehingga jendela
+    streaming langsung menghitung byte frame.
+    """
+    hasil = []
+    for step in plan:
+        frame = encode_command(step.command) if step.sync is None else None
+        if frame is not None and len(frame) <= len(step.data):
+            step = step._replace(data=frame)
+        hasil.append(step)
+    return tuple(hasil)
+
+
+def wire_bytes(plan):
+    """ Jumlah byte yang dikirim untuk satu putaran rencana. """
+    return sum(len(step.data) for step in plan)
+
+
+def format_summary(ascii_plan, binary_plan):
+    """ Satu baris ringkasan encode_plan untuk ditampilkan. """
+    lama, baru = wire_bytes(ascii_plan), wire_bytes(binary_plan)
+    frame = sum(a.data != b.data for a, b in zip(ascii_plan, binary_plan))
+    pesan = (f"Protokol biner: {frame} dari {len(binary_plan)} langkah dikirim sebagai frame, "
+             f"{lama} -> {baru} byte per putaran")
+    if lama:
+        pesan += f" ({100.0 * (baru - lama) / lama:+.0f}%)"
+    return pesan
@@ -0,0 +1,233 @@
+"""
+Menjalankan beberapa robot RNV3 sekaligus dari satu proses tanpa GUI.
+
+Pemakaian:
+    python rnv3_cell.py --robot COM3=ambil.h --robot COM4=taruh.h [--loops 10] [--window 4]
+                        [--no-home] [--plan] [--binary] [--baud 1000000] [--status 10] [-v]
+
+Setiap robot punya ProgramRunner sendiri (sambungan, kalibrasi G28, program dan
+statistik siklus), tetapi semua port dilayani satu thread I/O dan satu event loop
+Qt. Robot diberi nama R1, R2, ... sesuai urutan --robot. Status semua robot dan
+laju gabungan sel dicetak setiap --status detik dan saat selesai.
+
+Baris "SYNC <nama>" di program menjadi titik sinkron antar robot: robot yang
+sampai lebih dulu (semua perintah sebelumnya sudah selesai) menunggu sampai semua
+robot lain yang programnya memuat SYNC dengan nama sama juga sampai, misalnya
+robot A selesai menaruh benda sebelum robot B mengambilnya.
+
+Ctrl+C pertama menghentikan semua robot setelah perintah yang sudah terkirim
+selesai, Ctrl+C kedua langsung keluar. Kode keluar: 0 jika semua robot selesai,
+1 jika ada yang gagal.
+"""
+import argparse
+import sys
+import time
+
+from PyQt5 import QtCore
+
+from rnv3_protocol import STREAM_WINDOW_DEFAULT
+from rnv3_serial import start_io_thread
+from rnv3_runner import ProgramRunner, load_plan, run_event_loop, STATE_BERJALAN
+from rnv3_program import sync_names
+
+STATUS_INTERVAL_DEFAULT = 10  # Detik antar laporan status
+
+
+def parse_robot_spec(spec):
+    """ "PORT=PROGRAM" menjadi (port, path program). """
+    port, sep, path = spec.partition("=")
+    if not sep or not port or not path:
+        raise argparse.ArgumentTypeError(f"Format --robot harus PORT=PROGRAM, bukan '{spec}'")
+    return port, path
+
+
+class SyncBarriers:
+    """
+    Titik sinkron untuk baris "SYNC <nama>". Peserta sebuah titik adalah semua
+    robot yang programnya memuat nama itu. Robot yang sampai lebih dulu hanya
+    dicatat; robot terakhir yang sampai melepas semuanya di pemanggilan yang sama,
+    jadi tidak ada polling dan tidak ada jeda tambahan selain event loop.
+    """
+
+    def __init__(self):
+        self.participants = {}  # nama -> set ProgramRunner
+        self.waiting = {}  # nama -> list ProgramRunner yang sudah sampai
+
+    def register(self, runner):
+        for name in sync_names(runner.plan):
+            self.participants.setdefault(name, set()).add(runner)
+
+    def arrive(self, name, runner):
+        """ True jika semua peserta sudah sampai (runner boleh lanjut), False jika harus menunggu. """
+        waiting = self.waiting.setdefault(name, [])
+        if len(waiting) + 1 < len(self.participants.get(name, ())):
+            waiting.append(runner)
+            return False
+        self.release(name)
+        return True
+
+    def release(self, name):
+        for runner in self.waiting.pop(name, []):
+            runner.sync_released()
+
+    def leave(self, runner):
+        """ Robot selesai atau gagal: tidak ditunggu lagi di titik mana pun. """
+        for members in self.participants.values():
+            members.discard(runner)
+        for name in list(self.waiting):
+            waiting = self.waiting[name]
+            if runner in waiting:
+                waiting.remove(runner)
+            if waiting and len(waiting) >= len(self.participants[name]):
+                self.release(name)
+
+    def warnings(self):
+        """ Titik dengan satu peserta saja, dan urutan titik yang bisa saling menunggu (deadlock). """
+        pesan = [f"SYNC {name} hanya ada di program {next(iter(members)).name}, tidak menunggu robot lain"
+                 for name, members in sorted(self.participants.items()) if len(members) == 1]
+        runners = sorted({r for members in self.participants.values() for r in members}, key=lambda r: r.name)
+        for i, a in enumerate(runners):
+            for b in runners[i + 1:]:
+                bersama = sync_names(a.plan) & sync_names(b.plan)
+                urutan_a = [step.sync for step in a.plan if step.sync in bersama]
+                urutan_b = [step.sync for step in b.plan if step.sync in bersama]
+                if urutan_a != urutan_b:
+                    pesan.append(f"Urutan SYNC {a.name} ({', '.join(urutan_a)}) berbeda dengan "
+                                 f"{b.name} ({', '.join(urutan_b)}), robot bisa saling menunggu")
+        return pesan
+
+
+class RobotCell(QtCore.QObject):
+    """
+    Sekumpulan ProgramRunner yang berbagi satu thread I/O. Selesai dengan
+    QCoreApplication.exit setelah semua robot selesai atau gagal.
+    """
+
+    def __init__(self, robots, loops=1, window=STREAM_WINDOW_DEFAULT, home=True, verbose=False,
+                 status_s=STATUS_INTERVAL_DEFAULT, binary=False, max_baud=None, parent=None):
+        super().__init__(parent)
+        self.robots = robots  # List (port, plan)
+        self.loops = loops
+        self.window = window
+        self.home = home
+        self.verbose = verbose
+        self.binary = binary
+        self.max_baud = max_baud
+        self.runners = []
+        self.barriers = SyncBarriers()
+        self.io_thread = None
+        self.started_at = None
+        self.status_timer = QtCore.QTimer(self)
+        self.status_timer.timeout.connect(self.print_status)
+        self.status_ms = int(status_s * 1000)
+
+    def start(self):
+        # Satu thread I/O untuk semua port, setiap QSerialPort tetap punya worker sendiri
+        self.io_thread = start_io_thread(self)
+        self.started_at = time.monotonic()
+        for nomor, (port, plan) in enumerate(self.robots, start=1):
+            runner = ProgramRunner(port, plan, loops=self.loops, window=self.window, home=self.home,
+                                   verbose=self.verbose, io_thread=self.io_thread, name=f"R{nomor}",
+                                   barriers=self.barriers, binary=self.binary, max_baud=self.max_baud,
+                                   parent=self)
+            runner.finished.connect(self.runner_finished)
+            self.barriers.register(runner)
+            self.runners.append(runner)
+        for pesan in self.barriers.warnings():
+            print(f"Peringatan: {pesan}")
+        for runner in self.runners:
+            runner.start()
+        if self.status_ms > 0:
+            self.status_timer.start(self.status_ms)
+
+    def runner_finished(self, code):
+        self.barriers.leave(self.sender())
+        if any(runner.exit_code is None for runner in self.runners):
+            return
+        self.status_timer.stop()
+        self.print_status()
+        QtCore.QCoreApplication.exit(self.exit_code())
+
+    def exit_code(self):
+        return 0 if all(runner.exit_code == 0 for runner in self.runners) else 1
+
+    def interrupt(self):
+        for runner in self.runners:
+            if runner.exit_code is None:
+                runner.interrupt()
+
+    def terminate(self):
+        for runner in self.runners:
+            runner.finish(1, "Dihentikan")
+
+    # ------------------------------------------------------------------------------------------
+    # Status
+
+    def cycles(self):
+        return sum(runner.cycle_stats.cycles for runner in self.runners)
+
+    def units_per_hour(self):
+        """ Laju gabungan robot yang masih berjalan, dari rata-rata siklus terakhir masing-masing. """
+        return sum(runner.cycle_stats.units_per_hour() or 0.0 for runner in self.runners
+                   if runner.state == STATE_BERJALAN)
+
+    def status_lines(self):
+        lines = [f"{'robot':<6}{'port':<16}{'keadaan':<12}{'siklus':>7}{'rata2 s':>9}{'unit/jam':>10}"]
+        for runner in self.runners:
+            stats = runner.cycle_stats
+            rata = stats.mean()
+            uph = stats.units_per_hour()
+            lines.append(f"{runner.name:<6}{runner.port_name:<16}{runner.state:<12}{stats.cycles:>7}"
+                         f"{rata if rata is not None else 0:>9.2f}{uph if uph else 0:>10.0f}")
+        durasi = time.monotonic() - self.started_at
+        siklus = self.cycles()
+        total = f"sel: {siklus} siklus dalam {durasi:.1f} s ({3600.0 * siklus / durasi:.0f} unit/jam)"
+        if any(runner.state == STATE_BERJALAN for runner in self.runners):
+            total += f", laju sekarang {self.units_per_hour():.0f} unit/jam"
+        lines.append(total)
+        return lines
+
+    def print_status(self):
+        print("\n".join(self.status_lines()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan beberapa robot RNV3 sekaligus tanpa GUI")
+    parser.add_argument("--robot", action="append", required=True, type=parse_robot_spec, metavar="PORT=PROGRAM",
+                        help="Port serial dan file program .h satu robot, ulangi untuk setiap robot")
+    parser.add_argument("--loops", type=int, default=1, help="Jumlah putaran per robot, 0 = tanpa batas (default 1)")
+    parser.add_argument("--window", type=int, default=STREAM_WINDOW_DEFAULT,
+                        help=f"Ukuran jendela streaming (default {STREAM_WINDOW_DEFAULT})")
+    parser.add_argument("--no-home", action="store_true", help="Lewati kalibrasi G28")
+    parser.add_argument("--plan", action="store_true", help="Pecah gerakan panjang dengan rnv3_planner")
+    parser.add_argument("--binary", action="store_true",
+                        help="Kirim program sebagai frame biner jika firmware mendukung (M260)")
+    parser.add_argument("--baud", type=int, metavar="MAKS",
+                        help="Naikkan baud setiap robot sampai MAKS jika firmware mendukung (M261)")
+    parser.add_argument("--status", type=float, default=STATUS_INTERVAL_DEFAULT,
+                        help=f"Detik antar laporan status, 0 = hanya di akhir (default {STATUS_INTERVAL_DEFAULT})")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Tampilkan semua pesan serial")
+    args = parser.parse_args(argv)
+
+    ports = [port for port, _ in args.robot]
+    if len(set(ports)) != len(ports):
+        print("Satu port hanya boleh dipakai satu robot.")
+        return 1
+    robots = []
+    for port, path in args.robot:
+        try:
+            robots.append((port, load_plan(path, planner=args.plan)))
+        except ValueError as e:
+            print(f"{path}: {e}")
+            return 1
+
+    app = QtCore.QCoreApplication(sys.argv[:1])
+    cell = RobotCell(robots, loops=max(0, args.loops), window=args.window, home=not args.no_home,
+                     verbose=args.verbose, status_s=args.status, binary=args.binary,
+                     max_baud=args.baud)
+    QtCore.QTimer.singleShot(0, cell.start)
+    return run_event_loop(app, cell.interrupt, cell.terminate)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
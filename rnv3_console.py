@@ -0,0 +1,61 @@
+import os
+import sys
+from collections import deque
+
+from PyQt5 import QtCore
+
+# Tampilan log (textEdit_vew) yang diperbarui per frame, bukan per baris.
+#
+# Setiap baris serial (masuk dan keluar) juga dicetak ke stdout hanya jika aplikasi
+# dijalankan dengan --verbose/-v atau environment RNV3_VERBOSE=1 (sama dengan -v di
+# rnv3_runner/rnv3_cell).
+
+CONSOLE_MAX_LINES = 2000  # Batas scrollback, baris paling lama dibuang otomatis oleh widget
+CONSOLE_FLUSH_MS = 33  # Interval penggabungan baris (~30 frame per detik)
+ENV_VERBOSE = "RNV3_VERBOSE"
+ARG_VERBOSE = ("--verbose", "-v")
+
+
+def verbose_enabled(argv=None):
+    """ Log per baris serial ke stdout diminta lewat argumen atau environment. """
+    argv = sys.argv if argv is None else argv
+    return any(arg in argv for arg in ARG_VERBOSE) or os.environ.get(ENV_VERBOSE) == "1"
+
+
+class ConsoleBuffer(QtCore.QObject):
+    """
+    Mengumpulkan baris log lalu menuliskannya ke QPlainTextEdit sekaligus
+    paling banyak sekali per frame. Jumlah baris di widget dibatasi dengan
+    setMaximumBlockCount sehingga biaya append tetap sama walau aplikasi
+    berjalan berjam-jam.
+    """
+
+    def __init__(self, widget, max_lines=CONSOLE_MAX_LINES, interval_ms=CONSOLE_FLUSH_MS, parent=None):
+        super().__init__(parent)
+        self.widget = widget
+        self.widget.setMaximumBlockCount(max_lines)
+        self.widget.setUndoRedoEnabled(False)
+        # Baris yang belum tampil, ikut dibatasi agar ledakan log tidak menumpuk di memori
+        self.pending = deque(maxlen=max_lines)
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def append(self, text):
+        """ Tambahkan satu pesan, tampil paling lambat satu interval kemudian. """
+        self.pending.append(str(text).rstrip("\r\n"))
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """ Tulis semua baris yang tertunda dengan satu kali perubahan dokumen. """
+        if not self.pending:
+            return
+        text = "\n".join(self.pending)
+        self.pending.clear()
+        self.widget.appendPlainText(text)
+
+    def clear(self):
+        self.pending.clear()
+        self.widget.clear()
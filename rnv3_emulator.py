@@ -0,0 +1,659 @@
+"""
+Emulator protokol serial firmware robotRNV3_v2_01 di pty Linux.
+
+Dipakai untuk mencoba aplikasi, benchmark dan runner tanpa robot. Emulator
+membuka pasangan pty dan mencetak path sisi slave (misal /dev/pts/5) yang bisa
+diisi di kolom port aplikasi.
+
+Pemakaian:
+    python rnv3_emulator.py [--link /tmp/rnv3] [--speed 10] [--latency 2] [--no-binary]
+                            [--max-baud 500000] [--bad-baud 1000000] [--no-baud-switch]
+
+Perilaku yang ditiru dari firmware:
+  - Setiap kali port dibuka, firmware "reset" seperti Arduino yang di-reset DTR:
+    bootloader membuang byte yang datang, lalu setup() mencetak
+    "SETUP GRIPPER SERVO : MIN .. MAX ..", "RAIL ON" dan "READY CALIBRATION".
+  - Serial hanya dibaca ketika tidak ada perintah yang sedang dieksekusi.
+    Selama itu byte menumpuk di buffer RX 64 byte, kelebihannya dibuang.
+  - Satu "ok" per perintah G/M setelah gerakan selesai (kecuali M208).
+    Teks selain G/M dibalas "ERROR: COMMAND NOT RECOGNIZED" tanpa "ok".
+  - Lama gerakan G0/G1 mengikuti Interpolation::setInterpolation:
+    v = F, atau v = sqrt(jarak) * 10 jika F < 5 (minimal 5 mm/s).
+  - Frame biner rnv3_binary diterima kapan saja (byte awal 0xA5), M260 dibalas
+    "PROTOCOL: [BINARY 1]". Dengan --no-binary emulator meniru firmware lama.
+  - M261 S<baud> memindah baud setelah "ok", M261 mengonfirmasi baud baru, tanpa
+    konfirmasi dalam BAUD_CONFIRM firmware kembali ke BAUD. Baud yang dipasang
+    aplikasi di pty dibaca dengan TCGETS2, byte dengan baud berbeda dari firmware
+    rusak di kedua arah. --max-baud membatasi baud yang diterima, --bad-baud meniru
+    adapter USB yang menerima baud itu tapi datanya rusak, --no-baud-switch meniru
+    firmware lama tanpa M261.
+  - Perubahan sensor dilaporkan sebagai "S1 ON", "S1 OFF", dan seterusnya.
+    Ketik 1, 2 atau 3 lalu Enter di terminal emulator untuk membalik sensor.
+"""
+import argparse
+import fcntl
+import math
+import os
+import select
+import struct
+import sys
+import time
+import tty
+from collections import deque
+
+from rnv3_protocol import PRINT_REPLY_MSG, RX_BUFFER_SIZE, parse_command
+from rnv3_binary import FRAME_START, MIN_PAYLOAD, MAX_PAYLOAD, PROTOCOL_VERSION, decode_frame
+
+# Nilai di bawah mengikuti config.h firmware, ubah bersamaan jika firmware diubah.
+BAUD = 115200
+BAUD_RATES = (115200, 250000, 500000, 1000000)  # Baud yang diterima M261 S<baud>
+BAUD_MAX = 1000000
+BAUD_CONFIRM = 1.0  # BAUD_CONFIRM_MS, kembali ke BAUD jika baud baru tidak dikonfirmasi
+
+TCGETS2 = 0x802C542A  # struct termios2 Linux: c_ispeed dan c_ospeed uint32 di offset 36 dan 40
+TERMIOS2_SIZE = 44
+LOW_SHANK_LENGTH = 140.0
+HIGH_SHANK_LENGTH = 140.0
+END_EFFECTOR_OFFSET = 77.0
+INITIAL_X = 0.0
+INITIAL_Y = HIGH_SHANK_LENGTH + END_EFFECTOR_OFFSET
+INITIAL_Z = 138.0
+INITIAL_E0 = 0.0
+RAIL = True
+RAIL_LENGTH = 355.0
+MIN_SERVO = 27
+MAX_SERVO = 115
+SPEED_PROFILE = 2
+Z_MIN = -140.0
+Z_MAX = LOW_SHANK_LENGTH + 70.0
+SHANKS_MIN_ANGLE_COS = 0.791436948
+SHANKS_MAX_ANGLE_COS = -0.774944489
+R_MIN = math.sqrt(LOW_SHANK_LENGTH ** 2 + HIGH_SHANK_LENGTH ** 2
+                  - 2 * LOW_SHANK_LENGTH * HIGH_SHANK_LENGTH * SHANKS_MIN_ANGLE_COS)
+R_MAX = math.sqrt(LOW_SHANK_LENGTH ** 2 + HIGH_SHANK_LENGTH ** 2
+                  - 2 * LOW_SHANK_LENGTH * HIGH_SHANK_LENGTH * SHANKS_MAX_ANGLE_COS)
+VACUM_DELAY_ON = 0.3  # detik
+VACUM_DELAY_OFF = 0.3  # detik
+SERVO_MS_PER_DEGREE = 5  # waktuPerDerajat di G100
+
+# Homing: per sumbu mencari endstop lalu mundur X/Y/Z/E0_HOME_STEPS langkah, HOME_DWELL us per langkah
+HOME_DWELL = 1200e-6
+HOME_STEPS = (800, 900, 3520, 200)  # Urutan homeSequence: Y, X, Z, E0
+HOME_SEARCH_TIME = 0.5  # Perkiraan waktu mencari endstop per sumbu, posisi awal tidak diketahui
+HOMING_TIME = len(HOME_STEPS) * HOME_SEARCH_TIME + sum(HOME_STEPS) * HOME_DWELL
+
+# Urutan boot setelah reset DTR
+BOOTLOADER_TIME = 1.0  # Bootloader Mega2560, byte yang datang selama ini hilang
+BOOT_MESSAGES = (
+    (0.0, f"SETUP GRIPPER SERVO : MIN {MIN_SERVO} MAX {MAX_SERVO}"),
+    (0.15, "RAIL ON" if RAIL else "RAIL OFF"),  # delay(50) + delay(100)
+    (0.25, "READY CALIBRATION"),  # delay(100)
+)
+
+SENSOR_COUNT = 3
+LIMIT_SAMPLES = 200  # Jumlah titik pengecekan isAllowedPosition sepanjang satu gerakan
+
+def _fmt(value):
+    """ String(float) Arduino: dua angka di belakang koma. """
+    return f"{value:.2f}"
+
+
+def move_duration(dist, feed, profile=SPEED_PROFILE):
+    """
+    Lama gerakan G0/G1 sejauh `dist` mm dalam detik, meniru setInterpolation
+    dan updateActualPosition.
+    """
+    v = feed
+    if v < 5:  # Termasuk 0 = nilai default
+        v = math.sqrt(dist) * 10
+    if v < 5:
+        v = 5
+    if dist <= 0:
+        return 0.0
+    return _progress_time(1.0, profile) * dist / v
+
+
+def _progress_time(progress, profile=SPEED_PROFILE):
+    """ Nilai t * tmul saat kurva kecepatan mencapai `progress` (0..1). """
+    if profile == 1:  # ARCTAN APPROX, selesai saat atan(...) >= 1
+        x = math.tan(min(1.0, (progress - 0.5) * 2))
+        return (x + math.pi * 0.5) / math.pi
+    if profile == 2:  # COSIN APPROX
+        return math.acos(max(-1.0, min(1.0, 1 - 2 * progress))) / math.pi
+    return progress  # FLAT SPEED CURVE
+
+
+def is_allowed_position(x, y, z, e):
+    """ Interpolation::isAllowedPosition. """
+    rrot_ee = math.hypot(x, y)
+    if rrot_ee == 0:
+        return False  # Pembagian nol di firmware menghasilkan NaN, selalu ditolak
+    rrot = rrot_ee - END_EFFECTOR_OFFSET
+    rrot_x = rrot * (y / rrot_ee)
+    rrot_y = rrot * (x / rrot_ee)
+    module = rrot_x ** 2 + rrot_y ** 2 + z ** 2
+    allowed = R_MIN ** 2 <= module <= R_MAX ** 2 and Z_MIN <= z <= Z_MAX
+    if RAIL:
+        allowed = allowed and 0 <= e <= RAIL_LENGTH
+    return allowed
+
+
+class Cmd:
+    """ Struct Cmd firmware. """
+    __slots__ = ("id", "num", "x", "y", "z", "e", "f", "s", "a", "b")
+
+
+class FirmwareModel:
+    """
+    Mesin status firmware tanpa I/O. Waktu (detik) selalu diberikan pemanggil,
+    sehingga model yang sama bisa dijalankan di pty atau di simulasi.
+
+    Byte masuk diberi waktu tiba sesuai baud rate, balasan dikumpulkan di
+    `output` dan diambil dengan take_output().
+    """
+
+    def __init__(self, baud=BAUD, latency=0.0, rx_buffer=RX_BUFFER_SIZE, speed_profile=SPEED_PROFILE, binary=True,
+                 baud_switch=True, max_baud=BAUD_MAX, bad_bauds=()):
+        self.boot_baud = baud
+        self.binary = binary  # False = firmware lama tanpa frame biner dan M260
+        self.baud_switch = baud_switch  # False = firmware lama tanpa M261
+        self.max_baud = max_baud  # Baud tertinggi yang diterima M261 S<baud>
+        self.bad_bauds = set(bad_bauds)  # Baud yang diterima firmware tapi rusak di jalur (adapter USB)
+        self.garbled = 0  # Byte yang rusak karena baud host dan firmware berbeda
+        self.latency = latency  # Waktu tambahan sebelum "ok" (loop firmware, perhitungan geometri)
+        self.rx_capacity = rx_buffer - 1  # Ring buffer HardwareSerial menyisakan satu slot kosong
+        self.speed_profile = speed_profile
+        self.output = []  # (baud, bytearray)
+        self.inputs = [False] * SENSOR_COUNT
+        self.dropped = 0  # Byte yang hilang karena buffer RX penuh atau bootloader
+        self.commands = 0  # Jumlah perintah yang dieksekusi
+        self.reset(0.0)
+
+    def reset(self, now):
+        """ Reset seperti Arduino saat DTR dibalik: semua status kembali ke awal. """
+        self.baud = self.boot_baud
+        self.byte_time = 10.0 / self.baud  # 8N1: 10 bit per byte
+        self.baud_event = None  # (waktu, baud): pindah baud setelah "ok" M261, atau batal jika tidak dikonfirmasi
+        self.wire = deque()  # (waktu tiba, byte, baud host) yang masih di jalur serial
+        self.wire_free = now
+        self.rx = bytearray()
+        self.message = ""
+        self.frame = None  # Frame biner yang sedang dibaca, mulai dari 0xA5
+        self.scheduled = deque()  # (waktu, teks) yang akan dicetak
+        self.bootloader_until = now + BOOTLOADER_TIME
+        self.busy_until = self.bootloader_until + BOOT_MESSAGES[-1][0]  # Serial belum dibaca selama setup()
+        self.blocked_until = self.busy_until  # delay() di firmware, sensor tidak dibaca
+        for offset, text in BOOT_MESSAGES:
+            self._say(self.bootloader_until + offset, text)
+        self.relative = False
+        self.position = [INITIAL_X, INITIAL_Y, INITIAL_Z, INITIAL_E0]
+        self.offset = [0.0, 0.0, 0.0, 0.0]
+        self.speed_profile_active = self.speed_profile
+        self.servo = [90.0, float(MAX_SERVO)]  # servoA.write(90), servoB.write(MAX_SERVO)
+        self.servo_value = [0.0, 0.0]  # valueA/valueB tidak direset processMessage
+        self.reported = [False] * SENSOR_COUNT  # IO1Before..IO3Before, level sensor sendiri tidak ikut reset
+
+    # ------------------------------------------------------------------------------------------
+    # Masukan dari luar
+
+    def receive(self, data, now, baud=None):
+        """
+        Byte dari host, tiba satu per satu sesuai baud rate. `baud` adalah baud host,
+        None jika selalu sama dengan firmware. Byte dengan baud berbeda rusak.
+        """
+        baud = baud or self.baud
+        t = max(now, self.wire_free)
+        for byte in data:
+            t += 10.0 / baud
+            self.wire.append((t, byte, baud))
+        self.wire_free = t
+
+    def set_input(self, index, level):
+        """ Ubah level sensor IO1..IO3 (index 0..2). """
+        self.inputs[index] = bool(level)
+
+    def toggle_input(self, index):
+        self.inputs[index] = not self.inputs[index]
+
+    def take_output(self):
+        data = b"".join(part for baud, part in self.output)
+        self.output.clear()
+        return data
+
+    def take_output_parts(self):
+        """ Keluaran sebagai list (baud saat dikirim, byte), untuk jalur yang baud-nya bisa berbeda. """
+        parts = [(baud, bytes(part)) for baud, part in self.output]
+        self.output.clear()
+        return parts
+
+    def _write(self, data):
+        if self.output and self.output[-1][0] == self.baud:
+            self.output[-1][1].extend(data)
+        else:
+            self.output.append((self.baud, bytearray(data)))
+
+    # ------------------------------------------------------------------------------------------
+    # Jalannya waktu
+
+    def next_event(self):
+        """ Waktu kejadian berikutnya, None jika firmware menunggu masukan. """
+        times = []
+        if self.scheduled:
+            times.append(self.scheduled[0][0])
+        if self.wire:
+            times.append(self.wire[0][0])
+        if self.busy_until is not None:
+            times.append(self.busy_until)
+        if self.baud_event is not None:
+            times.append(self.baud_event[0])
+        if self.inputs != self.reported:
+            times.append(self.blocked_until)
+        return min(times) if times else None
+
+    def run_until(self, now):
+        """ Jalankan semua kejadian sampai waktu `now` sesuai urutan waktunya. """
+        while True:
+            t_say = self.scheduled[0][0] if self.scheduled else math.inf
+            t_byte = self.wire[0][0] if self.wire else math.inf
+            t_busy = self.busy_until if self.busy_until is not None else math.inf
+            t_baud = self.baud_event[0] if self.baud_event is not None else math.inf
+            t = min(t_say, t_byte, t_busy, t_baud)
+            if t > now:
+                break
+            if t_say == t:
+                self._write((self.scheduled.popleft()[1] + "\r\n").encode())
+            elif t_busy == t:
+                self.busy_until = None
+                self._consume(t)
+            elif t_baud == t:
+                self._switch_baud(t)
+            else:
+                _, byte, baud = self.wire.popleft()
+                if baud != self.baud or baud in self.bad_bauds:
+                    self.garbled += 1
+                else:
+                    self._receive_byte(byte, t)
+        if self.inputs != self.reported and self.blocked_until <= now:
+            self._report_inputs()
+
+    def _receive_byte(self, byte, t):
+        if t < self.bootloader_until or len(self.rx) >= self.rx_capacity:
+            self.dropped += 1
+            return
+        self.rx.append(byte)
+        if self.busy_until is None:
+            self._consume(t)
+
+    def _report_inputs(self):
+        for i in range(SENSOR_COUNT):
+            if self.inputs[i] != self.reported[i]:
+                self.reported[i] = self.inputs[i]
+                self._write(f"S{i + 1} {'ON' if self.inputs[i] else 'OFF'}\r\n".encode())
+
+    def _say(self, t, text):
+        self.scheduled.append((t, text))
+
+    def _switch_baud(self, t):
+        """
+        switchBaud: pindah setelah "ok" M261 S<baud> terkirim. Baud selain BAUD harus
+        dikonfirmasi dengan M261 dalam BAUD_CONFIRM, kalau tidak kembali ke BAUD.
+        """
+        _, baud = self.baud_event
+        self.baud = baud
+        self.byte_time = 10.0 / baud
+        self.rx.clear()  # Serial.end() membuang buffer RX
+        self.message = ""
+        self.frame = None
+        self.baud_event = (t + BAUD_CONFIRM, self.boot_baud) if baud != self.boot_baud else None
+
+    def _consume(self, t):
+        """ Command::handleGcode, satu karakter per loop selama tidak ada perintah berjalan. """
+        while self.rx and self.busy_until is None:
+            byte = self.rx.pop(0)
+            if self.frame is not None:
+                self.frame.append(byte)
+                cmd = self._read_frame(t)
+                if cmd is not None:
+                    self._execute(cmd, t)
+                continue
+            if self.binary and byte == FRAME_START:
+                self.frame = bytearray((byte,))
+                continue
+            c = chr(byte)
+            if c == "\n":
+                continue
+            if c == "\r":
+                cmd = self._process_message(self.message, t)
+                self.message = ""
+                if cmd is not None:
+                    self._execute(cmd, t)
+            else:
+                self.message += c
+
+    # ------------------------------------------------------------------------------------------
+    # Perintah
+
+    def _process_message(self, msg, t):
+        """ Command::processMessage, None jika bukan perintah G/M. """
+        parsed = parse_command(msg)
+        if parsed is None:
+            self._say(t, "ERROR: COMMAND NOT RECOGNIZED")
+            return None
+        return self._make_cmd(*parsed)
+
+    def _read_frame(self, t):
+        """ Command::handleGcode/processFrame, None selama frame belum lengkap atau jika frame rusak. """
+        frame = self.frame
+        if len(frame) == 2 and not MIN_PAYLOAD <= frame[1] <= MAX_PAYLOAD:
+            self.frame = None
+            self._say(t, "ERROR: FRAME LENGTH")
+            return None
+        if len(frame) < 2 or len(frame) < frame[1] + 3:
+            return None
+        self.frame = None
+        try:
+            parsed = decode_frame(frame)
+        except ValueError as error:
+            self._say(t, f"ERROR: {error}")
+            return None
+        return self._make_cmd(*parsed)
+
+    def _make_cmd(self, letter, num, fields):
+        cmd = Cmd()
+        cmd.id = letter
+        cmd.num = num
+        cmd.x = cmd.y = cmd.z = cmd.e = math.nan
+        cmd.f = cmd.s = 0.0
+        for axis, value in fields.items():
+            if axis in "XYZEFS":
+                setattr(cmd, axis.lower(), value)
+            elif axis == "A":
+                self.servo_value[0] = value
+            elif axis == "B":
+                self.servo_value[1] = value
+        cmd.a, cmd.b = self.servo_value
+        return cmd
+
+    def _execute(self, cmd, t):
+        """ executeCommand. Menentukan lama eksekusi dan menjadwalkan "ok". """
+        self.commands += 1
+        duration = 0.0  # Sampai gerakan/servo selesai
+        blocking = 0.0  # delay(), loop firmware berhenti
+        switch_to = None  # Baud setelah "ok" (M261 S<baud>)
+
+        if cmd.id == "G":
+            if cmd.num in (0, 1):
+                duration = self._linear_move(cmd, t)
+                blocking = cmd.s  # Tanpa break, G0/G1 ikut menjalankan cmdDwell
+            elif cmd.num == 4:
+                blocking = cmd.s
+            elif cmd.num == 28:
+                blocking = HOMING_TIME
+                self.position = [INITIAL_X, INITIAL_Y, INITIAL_Z, INITIAL_E0]
+                self._say(t + blocking, "HOMING COMPLETE")
+            elif cmd.num == 90:
+                self.relative = False
+                self._say(t, "ABSOLUTE MODE ON")
+            elif cmd.num == 91:
+                self.relative = True
+                self._say(t, "RELATIVE MODE ON")
+            elif cmd.num == 92:
+                target = [p if math.isnan(v) else v
+                          for v, p in zip((cmd.x, cmd.y, cmd.z, cmd.e), self.position)]
+                self.offset = [p - v for p, v in zip(self.position, target)]
+                self._say(t, "POSITION OFFSET: [X" + _fmt(self.offset[0]) + " Y:" + _fmt(self.offset[1])
+                          + " Z:" + _fmt(self.offset[2]) + " E:" + _fmt(self.offset[3]) + "]")
+                self._say(t, self._position_text(target))
+            elif cmd.num == 100:
+                duration = self._servo_move(cmd, t)
+            else:
+                self._say(t, "ERROR: COMMAND NOT RECOGNIZED")
+        else:
+            if cmd.num == 114:
+                self._say(t, "RELATIVE MODE" if self.relative else "ABSOLUTE MODE")
+                self._say(t, self._position_text([p - o for p, o in zip(self.position, self.offset)]))
+            elif cmd.num == 119:
+                self._say(t, "ENDSTOP: [X:0 Y:0 Z:0" + (" E:0" if RAIL else "") + "]")
+            elif cmd.num == 205:
+                self.speed_profile_active = int(cmd.s)
+                self._say(t, f"SPEED PROFILE: [{self.speed_profile_active}]")
+            elif cmd.num == 208:
+                return  # Tidak menunggu gerakan, tidak ada "ok"
+            elif cmd.num == 209:
+                blocking = VACUM_DELAY_ON
+            elif cmd.num == 230:
+                self._say(t, "Tunggu..")
+                blocking = VACUM_DELAY_OFF
+            elif cmd.num == 260 and self.binary:
+                self._say(t, f"PROTOCOL: [BINARY {PROTOCOL_VERSION}]")
+            elif cmd.num == 261 and self.baud_switch:
+                baud = int(cmd.s)
+                if baud == 0:
+                    self.baud_event = None  # Konfirmasi baud baru
+                    self._say(t, f"BAUD: [{self.baud}]")
+                elif baud in BAUD_RATES and baud <= self.max_baud:
+                    self._say(t, f"BAUD: [{baud}]")
+                    switch_to = baud
+                else:
+                    self._say(t, "ERROR: BAUD NOT SUPPORTED")
+            elif cmd.num not in (1, 2, 6, 7, 17, 18, 106, 107, 206, 207):
+                self._say(t, "ERROR: COMMAND NOT RECOGNIZED")
+
+        self.blocked_until = t + blocking
+        self.busy_until = t + max(duration, blocking) + self.latency
+        self._say(self.busy_until, PRINT_REPLY_MSG)
+        if switch_to is not None:
+            self.baud_event = (self.busy_until, switch_to)
+
+    def _position_text(self, pos):
+        return ("CURRENT POSITION: [X:" + _fmt(pos[0]) + " Y:" + _fmt(pos[1])
+                + " Z:" + _fmt(pos[2]) + " E:" + _fmt(pos[3]) + "]")
+
+    def _linear_move(self, cmd, t):
+        """ cmdMove + setInterpolation, mengembalikan lama gerakan. """
+        start = list(self.position)
+        target = []
+        for value, pos, off in zip((cmd.x, cmd.y, cmd.z, cmd.e), start, self.offset):
+            if math.isnan(value):
+                target.append(pos)
+            else:
+                target.append(value + (pos if self.relative else off))
+        self._say(t, "LINEAR MOVE: [X:" + _fmt(target[0] - self.offset[0]) + " Y:" + _fmt(target[1] - self.offset[1])
+                  + " Z:" + _fmt(target[2] - self.offset[2]) + " E:" + _fmt(target[3] - self.offset[3]) + "]")
+
+        delta = [b - a for a, b in zip(start, target)]
+        dist = max(math.sqrt(delta[0] ** 2 + delta[1] ** 2 + delta[2] ** 2), abs(delta[3]))
+        duration = move_duration(dist, cmd.f, self.speed_profile_active)
+        if dist <= 0:
+            return duration
+
+        # Gerakan berhenti di titik terakhir yang diizinkan jika melewati batas jangkauan
+        end = target
+        for i in range(1, LIMIT_SAMPLES + 1):
+            progress = i / LIMIT_SAMPLES
+            point = [a + progress * d for a, d in zip(start, delta)]
+            if not is_allowed_position(*point):
+                stop = _progress_time(progress, self.speed_profile_active) / _progress_time(1.0, self.speed_profile_active)
+                self._say(t + duration * stop, "ERROR: LIMIT REACHED: [X:" + _fmt(point[0]) + " Y:" + _fmt(point[1])
+                          + " Z:" + _fmt(point[2]) + " E:" + _fmt(point[3]) + "]")
+                previous = (i - 1) / LIMIT_SAMPLES
+                end = [a + previous * d for a, d in zip(start, delta)]
+                duration *= stop
+                break
+        self.position = end
+        return duration
+
+    def _servo_move(self, cmd, t):
+        """ G100, "ok" dikirim setelah servo terlama sampai (5 ms per derajat). """
+        parts = []
+        waktu = [0.0, 0.0]
+        if 0 <= cmd.a <= 180:
+            waktu[0] = abs(cmd.a - self.servo[0]) * SERVO_MS_PER_DEGREE / 1000.0
+            self.servo[0] = float(int(cmd.a))  # Servo::read() mengembalikan derajat bulat
+            parts.append("A:" + _fmt(cmd.a))
+        else:
+            self._say(t, "Nilai cmd.valueA di luar rentang yang diizinkan!")
+        if MIN_SERVO <= cmd.b <= MAX_SERVO:
+            waktu[1] = abs(cmd.b - self.servo[1]) * SERVO_MS_PER_DEGREE / 1000.0
+            self.servo[1] = float(int(cmd.b))
+            parts.append("B:" + _fmt(cmd.b))
+        else:
+            self._say(t, "Nilai cmd.valueB di luar rentang yang diizinkan!")
+        self._say(t, "SERVO MOVE: [" + " ".join(parts) + "]")
+        return int(max(waktu) * 1000) / 1000.0  # servoMoveDuration bertipe int (ms)
+
+
+class PtyEmulator:
+    """
+    Menjalankan FirmwareModel di pty. Membuka sisi slave dianggap sama dengan
+    menyambungkan USB (reset DTR), menutupnya sama dengan mencabut USB.
+    `speed` mempercepat seluruh waktu firmware, misal 10 untuk uji cepat.
+    """
+
+    def __init__(self, model=None, speed=1.0, link=None, verbose=True):
+        self.model = model if model is not None else FirmwareModel()
+        self.speed = float(speed)
+        self.verbose = verbose
+        self.master, slave = os.openpty()
+        tty.setraw(slave)
+        self.path = os.ttyname(slave)
+        os.close(slave)  # Pemakai membuka path ini sendiri, emulator mendeteksinya dari POLLHUP
+        self.link = link
+        if link:
+            if os.path.islink(link):
+                os.unlink(link)
+            os.symlink(self.path, link)
+        self.connected = False
+        self.running = False
+        self.t0 = time.monotonic()
+
+    def now(self):
+        """ Waktu firmware (detik), sudah dikalikan `speed`. """
+        return (time.monotonic() - self.t0) * self.speed
+
+    def log(self, text):
+        if self.verbose:
+            print(text, file=sys.stderr, flush=True)
+
+    def run(self, stdin=None):
+        """ Loop utama sampai stop() dipanggil atau Ctrl+C. """
+        poller = select.poll()
+        poller.register(self.master, select.POLLIN)
+        if stdin is not None:
+            poller.register(stdin, select.POLLIN)
+        self.running = True
+        try:
+            while self.running:
+                self.step(poller, stdin)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def step(self, poller, stdin=None):
+        timeout = None
+        event = self.model.next_event() if self.connected else None
+        if event is not None:
+            timeout = max(0, int(math.ceil((event - self.now()) / self.speed * 1000)))
+        if not self.connected:
+            timeout = 50  # POLLHUP selalu aktif tanpa klien, cek ulang secara berkala
+        hangup = False
+        for fd, flags in poller.poll(timeout):
+            if fd == self.master:
+                if flags & select.POLLHUP:
+                    hangup = True
+                elif flags & select.POLLIN:
+                    self._read_master()
+            elif fd == stdin:
+                self._read_stdin(stdin)
+
+        if hangup and self.connected:
+            self.connected = False
+            self.log("Port ditutup")
+        elif not hangup and not self.connected:
+            self.connected = True
+            self.model.reset(self.now())
+            self.log("Port dibuka, firmware reset")
+        if not self.connected:
+            if hangup:
+                time.sleep(0.05)
+            return
+
+        self.model.run_until(self.now())
+        parts = self.model.take_output_parts()
+        if parts:
+            host = self.host_baud()
+            data = b"".join(part for baud, part in parts
+                            if host is None or (baud == host and baud not in self.model.bad_bauds))
+            if data:
+                os.write(self.master, data)
+
+    def host_baud(self):
+        """ Baud yang dipasang aplikasi di sisi slave, None jika tidak bisa dibaca. """
+        try:
+            raw = fcntl.ioctl(self.master, TCGETS2, bytes(TERMIOS2_SIZE))
+        except OSError:
+            return None
+        return struct.unpack_from("I", raw, 40)[0] or None
+
+    def _read_master(self):
+        try:
+            data = os.read(self.master, 4096)
+        except OSError:
+            return
+        if data:
+            self.model.receive(data, self.now(), self.host_baud())
+
+    def _read_stdin(self, stdin):
+        text = os.read(stdin, 256).decode(errors="ignore")
+        for char in text:
+            if char in "123":
+                index = int(char) - 1
+                self.model.toggle_input(index)
+                self.log(f"S{char} {'ON' if self.model.inputs[index] else 'OFF'}")
+
+    def stop(self):
+        self.running = False
+
+    def close(self):
+        if self.master is not None:
+            os.close(self.master)
+            self.master = None
+        if self.link and os.path.islink(self.link):
+            os.unlink(self.link)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Emulator firmware robotRNV3_v2_01 di pty")
+    parser.add_argument("--link", help="Buat symlink ke pty, misal /tmp/rnv3 (kolom port aplikasi maksimal 10 karakter)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Percepatan waktu firmware (default 1)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Tambahan waktu sebelum 'ok' dalam ms")
+    parser.add_argument("--baud", type=int, default=BAUD, help="Baud rate untuk waktu kirim per byte")
+    parser.add_argument("--profile", type=int, default=SPEED_PROFILE, choices=(0, 1, 2),
+                        help="SPEED_PROFILE awal firmware")
+    parser.add_argument("--no-binary", action="store_true",
+                        help="Tiru firmware lama tanpa frame biner (M260 tidak dikenal)")
+    parser.add_argument("--no-baud-switch", action="store_true",
+                        help="Tiru firmware lama tanpa pindah baud (M261 tidak dikenal)")
+    parser.add_argument("--max-baud", type=int, default=BAUD_MAX, help=f"Baud tertinggi untuk M261 (default {BAUD_MAX})")
+    parser.add_argument("--bad-baud", type=int, action="append", default=[],
+                        help="Baud yang diterima M261 tapi datanya rusak di jalur, bisa diulang")
+    args = parser.parse_args(argv)
+
+    model = FirmwareModel(baud=args.baud, latency=args.latency / 1000.0, speed_profile=args.profile,
+                          binary=not args.no_binary, baud_switch=not args.no_baud_switch,
+                          max_baud=args.max_baud, bad_bauds=args.bad_baud)
+    emulator = PtyEmulator(model, speed=args.speed, link=args.link)
+    print(emulator.link or emulator.path, flush=True)
+    emulator.log("Ketik 1, 2 atau 3 lalu Enter untuk membalik sensor S1..S3, Ctrl+C untuk keluar")
+    stdin = sys.stdin.fileno() if sys.stdin is not None and sys.stdin.isatty() else None
+    emulator.run(stdin)
+    if model.dropped:
+        emulator.log(f"{model.dropped} byte hilang (buffer RX penuh atau bootloader)")
+    if model.garbled:
+        emulator.log(f"{model.garbled} byte rusak (baud aplikasi dan firmware berbeda)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Perkiraan waktu siklus program tanpa robot.
+
+Pemakaian:
+    python rnv3_estimator.py program.h [--slowest 3]
+
+Lama setiap perintah di firmware bisa dihitung dari programnya saja:
+  - G0/G1 : Interpolation::setInterpolation, v = F atau sqrt(jarak) * 10 (minimal
+            5 mm/s), dengan kurva kecepatan M205 yang sedang aktif
+  - G4 S  : cmdDwell, delay S detik (G0/G1 dengan S juga ikut delay)
+  - G100  : 5 ms per derajat servo yang bergerak paling jauh
+  - M209  : VACUM_DELAY_ON, M230 : VACUM_DELAY_OFF
+  - G28   : perkiraan lama homing, sama dengan rnv3_emulator
+Posisi lengan dan servo diambil dari putaran kedua, yaitu kondisi saat program
+berulang. Setiap perintah yang dibalas "ok" ditambah COMMAND_OVERHEAD_S.
+"""
+import argparse
+import re
+import sys
+from collections import namedtuple
+
+from rnv3_kinematics import plan_moves, INITIAL_POSITION, MIN_SERVO, MAX_SERVO
+from rnv3_program import parse_program_file, compile_plan
+from rnv3_planner import move_time, firmware_distance, speed_profiles, COMMAND_OVERHEAD_S
+from rnv3_protocol import command_code
+
+# Nilai di bawah mengikuti config.h dan robotRNV3_v2_01.ino, ubah bersamaan jika firmware diubah.
+VACUM_DELAY_ON = 0.3  # detik
+VACUM_DELAY_OFF = 0.3  # detik
+SERVO_MS_PER_DEGREE = 5  # waktuPerDerajat di G100
+SERVO_INITIAL = (90.0, float(MAX_SERVO))  # servoA.write(90), servoB.write(MAX_SERVO) di setup()
+HOMING_TIME = 8.5  # detik, perkiraan (posisi awal sebelum homing tidak diketahui)
+
+SLOWEST_COUNT = 3  # Jumlah baris terlama yang ditandai
+
+_S_RE = re.compile(r'S(-?\d+\.?\d*)')
+
+# Hasil estimate_plan: `steps` detik per langkah rencana (urut sesuai rencana),
+# `rows` detik per baris program, `total` detik satu putaran.
+CycleEstimate = namedtuple("CycleEstimate", "steps rows total")
+
+
+def _dwell(command):
+    """ Nilai S (detik) yang dipakai cmdDwell, 0 jika tidak ada. """
+    match = _S_RE.search(command.upper().replace(" ", ""))
+    return max(0.0, float(match.group(1))) if match else 0.0
+
+
+def _servo_time(servo, a, b):
+    """ Lama G100 (detik) dan posisi servo sesudahnya, servo di luar rentang tidak bergerak. """
+    waktu = 0.0
+    servo = list(servo)
+    for i, (value, low, high) in enumerate(((a, 0, 180), (b, MIN_SERVO, MAX_SERVO))):
+        if value is not None and low <= value <= high:
+            waktu = max(waktu, abs(value - servo[i]) * SERVO_MS_PER_DEGREE / 1000.0)
+            servo[i] = float(int(value))  # Servo::read() mengembalikan derajat bulat
+    return int(waktu * 1000) / 1000.0, servo  # servoMoveDuration bertipe int (ms)
+
+
+def estimate_plan(plan, start=INITIAL_POSITION):
+    """ Perkiraan lama setiap langkah dan satu putaran rencana eksekusi (lihat keterangan modul). """
+    steps, starts, ends, _, _ = plan_moves(plan, start, passes=2)
+    n = len(steps) // 2
+    gerakan = {index: (s, e) for index, s, e in zip(steps[n:], starts[n:].tolist(), ends[n:].tolist())}
+    aktif = speed_profiles(plan)
+
+    servo = SERVO_INITIAL
+    for _ in range(2):
+        waktu = []
+        for index, step in enumerate(plan):
+            kode = command_code(step.command)
+            detik = 0.0
+            if kode in (("G", 0), ("G", 1)):
+                s, e = gerakan[index]
+                feed = step.values[4] if step.values is not None else None
+                dist = firmware_distance([b - a for a, b in zip(s, e)])
+                detik = max(move_time(dist, feed, aktif[index]), _dwell(step.command))
+            elif kode == ("G", 4):
+                detik = _dwell(step.command)
+            elif kode == ("G", 28):
+                detik = HOMING_TIME
+            elif kode == ("G", 100) and step.values is not None:
+                detik, servo = _servo_time(servo, step.values[5], step.values[6])
+            elif kode == ("M", 209):
+                detik = VACUM_DELAY_ON
+            elif kode == ("M", 230):
+                detik = VACUM_DELAY_OFF
+            if step.expects_ok:
+                detik += COMMAND_OVERHEAD_S
+            waktu.append(float(detik))
+
+    rows = {}
+    for step, detik in zip(plan, waktu):
+        rows[step.row] = rows.get(step.row, 0.0) + detik
+    return CycleEstimate(tuple(waktu), rows, sum(waktu))
+
+
+def slowest(estimate, count=SLOWEST_COUNT):
+    """ Baris program terlama, urut dari yang paling lama. """
+    urut = sorted(estimate.rows.items(), key=lambda item: (-item[1], item[0]))
+    return [row for row, detik in urut[:count] if detik > COMMAND_OVERHEAD_S]
+
+
+def format_estimate(estimate, count=SLOWEST_COUNT):
+    """ Satu baris ringkasan untuk ditampilkan. """
+    pesan = f"Perkiraan waktu siklus {estimate.total:.2f} s"
+    if estimate.total > 0:
+        pesan += f" ({3600.0 / estimate.total:.0f} unit/jam)"
+    terlama = slowest(estimate, count)
+    if terlama:
+        pesan += ", terlama: " + ", ".join(f"baris {row + 1} ({estimate.rows[row]:.2f} s)" for row in terlama)
+    return pesan
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perkiraan waktu siklus program robot RNV3 tanpa robot")
+    parser.add_argument("program", help="File program .h yang disimpan aplikasi")
+    parser.add_argument("--slowest", type=int, default=SLOWEST_COUNT,
+                        help=f"Jumlah baris terlama yang ditandai (default {SLOWEST_COUNT})")
+    args = parser.parse_args(argv)
+
+    with open(args.program, encoding="utf-8") as f:
+        plan = compile_plan(parse_program_file(f))
+    if not plan:
+        print("Program tidak ada.")
+        return 1
+    estimate = estimate_plan(plan)
+    terlama = set(slowest(estimate, args.slowest))
+    teks = {}
+    for step in plan:
+        teks.setdefault(step.row, step.command)
+    for row, detik in sorted(estimate.rows.items()):
+        tanda = "  <- terlama" if row in terlama else ""
+        print(f"{row + 1:>5}  {detik:>8.3f} s  {teks[row]}{tanda}")
+    print(format_estimate(estimate, args.slowest))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
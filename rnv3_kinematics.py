@@ -0,0 +1,200 @@
+from collections import namedtuple
+
+import numpy as np
+
+from rnv3_protocol import command_code
+
+# Kinematika lengan RNV3 di sisi aplikasi, rumusnya sama dengan firmware:
+#   inverse      : RobotGeometry::calculateGrad, X/Y/Z -> sudut motor rot, low, high
+#   forward      : kebalikannya, sudut motor -> X/Y/Z
+#   check_points : Interpolation::isAllowedPosition, ditambah pose yang tidak bisa
+#                  dicapai calculateGrad dengan benar
+#
+# Semua fungsi menerima skalar atau array NumPy. Satu program utuh (setiap titik
+# sepanjang setiap gerakan) dicek dengan sekali hitung sebelum dijalankan, dan
+# nilai spinbox yang sedang digeser dicek dengan fungsi yang sama.
+
+# Nilai di bawah mengikuti config.h firmware, ubah bersamaan jika firmware diubah.
+LOW_SHANK_LENGTH = 140.0
+HIGH_SHANK_LENGTH = 140.0
+END_EFFECTOR_OFFSET = 77.0
+INITIAL_POSITION = (0.0, HIGH_SHANK_LENGTH + END_EFFECTOR_OFFSET, 138.0, 0.0)  # Posisi setelah G28
+RAIL = True
+RAIL_LENGTH = 355.0
+MIN_SERVO = 27
+MAX_SERVO = 115
+Z_MIN = -140.0
+Z_MAX = LOW_SHANK_LENGTH + 70.0
+SHANKS_MIN_ANGLE_COS = 0.791436948
+SHANKS_MAX_ANGLE_COS = -0.774944489
+R_MIN = np.sqrt(LOW_SHANK_LENGTH ** 2 + HIGH_SHANK_LENGTH ** 2
+                - 2 * LOW_SHANK_LENGTH * HIGH_SHANK_LENGTH * SHANKS_MIN_ANGLE_COS)
+R_MAX = np.sqrt(LOW_SHANK_LENGTH ** 2 + HIGH_SHANK_LENGTH ** 2
+                - 2 * LOW_SHANK_LENGTH * HIGH_SHANK_LENGTH * SHANKS_MAX_ANGLE_COS)
+
+PATH_SAMPLES = 200  # Titik pengecekan sepanjang satu gerakan, sama dengan emulator
+
+# Jenis masalah sebuah titik, digabung sebagai bit
+MASALAH_RADIUS = 1  # Jarak dari bahu di luar R_MIN..R_MAX, firmware berhenti (LIMIT REACHED)
+MASALAH_Z = 2  # Z di luar Z_MIN..Z_MAX, firmware berhenti
+MASALAH_REL = 4  # E di luar panjang rel, firmware berhenti
+MASALAH_BELAKANG = 8  # Y < 0, asin di calculateGrad mencerminkan pose ke depan
+MASALAH_SUDUT = 16  # calculateGrad tidak punya solusi atau menghasilkan pose lain
+MASALAH_SERVO = 32  # G100 di luar rentang servo, firmware menolak
+
+_KETERANGAN = (
+    (MASALAH_RADIUS, f"di luar jangkauan lengan ({R_MIN:.0f}..{R_MAX:.0f} mm dari bahu)"),
+    (MASALAH_Z, f"Z di luar {Z_MIN:.0f}..{Z_MAX:.0f}"),
+    (MASALAH_REL, f"E di luar rel 0..{RAIL_LENGTH:.0f}"),
+    (MASALAH_BELAKANG, "Y negatif, firmware mencerminkan pose ke depan"),
+    (MASALAH_SUDUT, "sudut lengan tidak bisa dihitung firmware"),
+    (MASALAH_SERVO, f"servo di luar rentang (A 0..180, B {MIN_SERVO}..{MAX_SERVO})"),
+)
+
+# Satu masalah di program. point adalah titik pertama yang bermasalah (X, Y, Z, E
+# dalam koordinat program), on_path True jika titik itu di tengah gerakan, dan
+# next_cycle True jika masalahnya baru muncul saat program diulang.
+ReachIssue = namedtuple("ReachIssue", "row mask point on_path next_cycle")
+
+
+def inverse(x, y, z):
+    """ RobotGeometry::calculateGrad: sudut (rot, low, high) dalam radian, NaN jika tidak ada solusi. """
+    x, y, z = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, y, z)))
+    low_2 = LOW_SHANK_LENGTH ** 2
+    high_2 = HIGH_SHANK_LENGTH ** 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rrot_ee = np.hypot(x, y)
+        rrot = rrot_ee - END_EFFECTOR_OFFSET  # Jari-jari dari atas
+        rside = np.hypot(rrot, z)  # Jari-jari dari samping
+        rside_2 = rside ** 2
+        rot = np.arcsin(x / rrot_ee)
+        high = np.pi - np.arccos((low_2 + high_2 - rside_2) / (2 * LOW_SHANK_LENGTH * HIGH_SHANK_LENGTH))
+        bahu = np.arccos((low_2 - high_2 + rside_2) / (2 * LOW_SHANK_LENGTH * rside))
+        low = np.where(z > 0, np.arccos(z / rside), np.pi - np.arcsin(rrot / rside)) - bahu
+    return rot, low, high + low
+
+
+def forward(rot, low, high):
+    """ Kebalikan inverse: posisi (x, y, z) ujung tool dari sudut motor. """
+    rot, low, high = (np.asarray(v, dtype=float) for v in (rot, low, high))
+    rrot = LOW_SHANK_LENGTH * np.sin(low) + HIGH_SHANK_LENGTH * np.sin(high)
+    z = LOW_SHANK_LENGTH * np.cos(low) + HIGH_SHANK_LENGTH * np.cos(high)
+    rrot_ee = rrot + END_EFFECTOR_OFFSET
+    return rrot_ee * np.sin(rot), rrot_ee * np.cos(rot), z
+
+
+def check_points(x, y, z, e=0.0):
+    """ Bit MASALAH_* setiap titik (posisi mesin), 0 jika bisa dicapai. """
+    x, y, z, e = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, y, z, e)))
+    rrot_ee = np.hypot(x, y)
+    module = (rrot_ee - END_EFFECTOR_OFFSET) ** 2 + z ** 2
+    # Di firmware rrot_ee = 0 menghasilkan NaN sehingga selalu ditolak
+    mask = np.where((rrot_ee > 0) & (module >= R_MIN ** 2) & (module <= R_MAX ** 2), 0, MASALAH_RADIUS)
+    mask |= np.where((z >= Z_MIN) & (z <= Z_MAX), 0, MASALAH_Z)
+    if RAIL:
+        mask |= np.where((e >= 0) & (e <= RAIL_LENGTH), 0, MASALAH_REL)
+    mask |= np.where(y < 0, MASALAH_BELAKANG, 0)
+    # Pose yang diizinkan isAllowedPosition belum tentu dicapai calculateGrad. Di dalam
+    # R_MIN..R_MAX kedua acos selalu terdefinisi dan Y >= 0 sudah dicek, sisanya hanya
+    # cabang Z > 0 yang memakai acos(z / rside): salah jika ujung tool lebih dekat ke
+    # poros daripada END_EFFECTOR_OFFSET (sama dengan forward(inverse(p)) != p).
+    lolos = mask == 0
+    mask |= np.where(lolos & (z > 0) & (rrot_ee < END_EFFECTOR_OFFSET), MASALAH_SUDUT, 0)
+    return mask
+
+
+def describe(mask):
+    """ Keterangan bit MASALAH_* untuk ditampilkan. """
+    return ", ".join(teks for bit, teks in _KETERANGAN if int(mask) & bit)
+
+
+def plan_moves(plan, start=INITIAL_POSITION, passes=1):
+    """
+    Simulasi posisi firmware (G90/G91, G92, G28) untuk rencana eksekusi.
+    Mengembalikan (steps, starts, ends, offsets, servo_rows): posisi langkah G0/G1
+    di rencana beserta array titik awal, titik akhir dan offset G92 dalam posisi
+    mesin, dan baris G100 yang ditolak firmware.
+    """
+    position = [float(v) for v in start]
+    offset = [0.0] * 4
+    relative = False
+    steps, starts, ends, offsets, servo_rows = [], [], [], [], []
+    for _ in range(passes):
+        for index, step in enumerate(plan):
+            # Sama dengan processMessage: "G X10" tanpa nomor dibaca sebagai G0
+            code = command_code(step.command)
+            if code is None or code[0] != "G":
+                continue
+            num = code[1]
+            values = step.values[:4] if step.values is not None else (None,) * 4
+            if num in (0, 1):
+                target = [pos if v is None else v + (pos if relative else off)
+                          for v, pos, off in zip(values, position, offset)]
+                steps.append(index)
+                starts.append(position)
+                ends.append(target)
+                offsets.append(offset)
+                position = target
+            elif num == 28:
+                position = list(INITIAL_POSITION)
+            elif num == 90:
+                relative = False
+            elif num == 91:
+                relative = True
+            elif num == 92:
+                offset = [pos - (pos if v is None else v) for v, pos in zip(values, position)]
+            elif num == 100 and step.values is not None:
+                a, b = step.values[5], step.values[6]
+                if (a is not None and not 0 <= a <= 180) or (b is not None and not MIN_SERVO <= b <= MAX_SERVO):
+                    servo_rows.append(step.row)
+    shape = (len(steps), 4)
+    return (steps, np.array(starts, dtype=float).reshape(shape), np.array(ends, dtype=float).reshape(shape),
+            np.array(offsets, dtype=float).reshape(shape), servo_rows)
+
+
+def check_plan(plan, start=INITIAL_POSITION, loop=True, samples=PATH_SAMPLES):
+    """
+    Cek semua gerakan rencana eksekusi sekaligus, termasuk titik-titik di sepanjang
+    lintasan lurus yang ditempuh firmware. Dengan loop=True rencana disimulasikan dua
+    putaran sehingga gerakan dari akhir program kembali ke awal ikut dicek.
+    Mengembalikan list ReachIssue, satu per baris: masalah putaran pertama urut sesuai
+    baris, lalu masalah yang baru muncul di putaran kedua.
+    """
+    passes = 2 if loop else 1
+    steps, starts, ends, offsets, servo_rows = plan_moves(plan, start, passes)
+    rows = [plan[index].row for index in steps]
+    issues = {row: ReachIssue(row, MASALAH_SERVO, None, False, False) for row in servo_rows}
+    n = len(rows) // passes
+    # Putaran kedua hanya perlu dicek untuk gerakan yang berbeda dari putaran pertama
+    # (kembali ke titik awal, atau semua gerakan jika program memakai G91)
+    moves = np.ones(len(rows), dtype=bool)
+    if loop:
+        moves[n:] = np.any((starts[n:] != starts[:n]) | (ends[n:] != ends[:n]), axis=1)
+    moves = np.flatnonzero(moves)
+    if len(moves):
+        # Titik ke-i dari n di setiap gerakan, seperti pos_tracker di updateActualPosition
+        t = np.arange(1, samples + 1) / samples
+        points = starts[moves, None, :] + t[None, :, None] * (ends[moves] - starts[moves])[:, None, :]
+        masks = check_points(points[..., 0], points[..., 1], points[..., 2], points[..., 3])
+        bad = np.flatnonzero(masks.any(axis=1))
+        first = masks[bad].astype(bool).argmax(axis=1)
+        for i, sample in zip(bad.tolist(), first.tolist()):
+            move = int(moves[i])
+            row = rows[move]
+            if row not in issues:
+                point = tuple((points[i, sample] - offsets[move]).tolist())
+                issues[row] = ReachIssue(row, int(masks[i, sample]), point, sample < samples - 1, move >= n)
+    return ([issue for row, issue in sorted(issues.items()) if not issue.next_cycle]
+            + [issue for issue in issues.values() if issue.next_cycle])
+
+
+def format_issue(issue):
+    """ Satu baris pesan untuk ReachIssue. """
+    pesan = f"Baris {issue.row + 1}: {describe(issue.mask)}"
+    if issue.point is not None:
+        x, y, z, e = issue.point
+        tempat = "di tengah gerakan" if issue.on_path else "di titik tujuan"
+        pesan += f" {tempat} X:{x:.2f} Y:{y:.2f} Z:{z:.2f} E:{e:.2f}"
+    if issue.next_cycle:
+        pesan += " (saat program diulang)"
+    return pesan
@@ -0,0 +1,192 @@
+import difflib
+import math
+import re
+from collections import namedtuple
+
+from rnv3_kinematics import plan_moves, INITIAL_POSITION, MIN_SERVO, MAX_SERVO
+from rnv3_program import compile_plan
+from rnv3_protocol import command_code
+
+# Optimasi program: membuang perintah yang tidak mengubah apa pun di robot.
+#   - G0/G1 ke posisi tempat lengan sudah berada
+#   - titik tengah dua gerakan pada satu garis lurus (arah sama, F sama), firmware
+#     tetap menempuh garis yang sama tanpa berhenti di titik tengah
+#   - LG1/LG2/LG3 ON/OFF yang keadaannya sudah sama
+#   - G100 yang tidak mengubah posisi servo A/B
+# Setiap perintah dicek di putaran pertama dan putaran kedua. Keadaan awal
+# putaran pertama (LG, servo, posisi lengan) dianggap tidak diketahui, jadi perintah
+# pertama setiap perangkat dan gerakan pertama selalu dipertahankan: lengan bisa saja
+# baru digeser manual atau berhenti di tengah program. Gerakan hanya dinilai dari
+# posisi yang dicapai di dalam program. Gerakan tidak dioptimasi jika program
+# memakai G91/G92, dan gerakan dengan S (dwell) tidak pernah dibuang.
+# Baris tidak diubah teksnya, hanya dihapus, sehingga hasilnya mudah dibandingkan.
+
+MERGE_TOLERANCE_MM = 0.01  # Titik tengah dianggap di garis lurus jika selisih jaraknya di bawah ini
+# Posisi awal kedua untuk simulasi: koordinat yang berbeda antara simulasi dari
+# INITIAL_POSITION dan dari titik ini belum ditentukan oleh program
+_OTHER_START = tuple(v + 1.0 for v in INITIAL_POSITION)
+
+# Perintah G/M -> (perangkat, keadaan sesudahnya), sesuai executeCommand firmware
+_TOGGLES = {
+    ("M", 1): (("LG1", True),),
+    ("M", 2): (("LG1", False),),
+    ("M", 206): (("LG2", True),),
+    ("M", 207): (("LG2", False),),
+    ("M", 208): (("LG2", False),),
+    ("M", 6): (("LG3", True),),
+    ("M", 7): (("LG3", False),),
+}
+# Perintah lain yang ikut mengubah keadaan LG tetapi tidak pernah dibuang
+_SIDE_EFFECTS = {
+    ("M", 209): (("LG3", True), ("LG2", False)),  # Vacum ON
+    ("M", 230): (("LG3", False), ("LG2", False)),  # Vacum OFF, LG2 hanya menyala sesaat
+}
+
+_S_RE = re.compile(r'S-?\d')
+
+# Satu baris yang dibuang: nomor baris di program asli, teksnya, dan alasannya
+OptimizeChange = namedtuple("OptimizeChange", "row text reason")
+
+
+def _state(keadaan):
+    return "ON" if keadaan else "OFF"
+
+
+def _redundant_toggles(plan, kode):
+    """ {posisi langkah: alasan} untuk LG ON/OFF yang keadaannya sudah sama di kedua putaran. """
+    keadaan = {}  # Perangkat -> True/False, tidak ada = belum diketahui
+    sama = {}
+    for putaran in range(2):
+        for index, k in enumerate(kode):
+            efek = _TOGGLES.get(k)
+            if efek is not None:
+                (nama, target), = efek
+                ulang = keadaan.get(nama) == target
+                sama[index] = ulang if putaran == 0 else sama[index] and ulang
+                keadaan[nama] = target
+            for nama, target in _SIDE_EFFECTS.get(k, ()):
+                keadaan[nama] = target
+    return {index: f"{_TOGGLES[kode[index]][0][0]} sudah {_state(_TOGGLES[kode[index]][0][1])}"
+            for index, ulang in sama.items() if ulang}
+
+
+def _redundant_servo(plan, kode):
+    """ {posisi langkah: alasan} untuk G100 yang tidak mengubah servo di kedua putaran. """
+    servo = [None, None]  # Derajat A dan B, None = belum diketahui
+    sama = {}
+    for putaran in range(2):
+        for index, (step, k) in enumerate(zip(plan, kode)):
+            if k != ("G", 100) or step.values is None:
+                continue
+            ulang = True
+            for i, (value, low, high) in enumerate(((step.values[5], 0, 180),
+                                                    (step.values[6], MIN_SERVO, MAX_SERVO))):
+                if value is None:
+                    continue
+                if not low <= value <= high:
+                    ulang = False  # Ditolak firmware, biarkan pengecekan jangkauan yang melapor
+                    continue
+                ulang = ulang and servo[i] == float(int(value))
+                servo[i] = float(int(value))  # Servo::read() mengembalikan derajat bulat
+            sama[index] = ulang if putaran == 0 else sama[index] and ulang
+    return {index: "servo sudah di posisi ini" for index, ulang in sama.items() if ulang}
+
+
+def _feed(step):
+    return step.values[4] if step.values is not None else None
+
+
+def _redundant_moves(plan, kode):
+    """
+    ({posisi langkah: alasan} gerakan yang tidak bergerak, [(tengah, berikutnya)] pasangan
+    gerakan yang bisa digabung). Kosong jika program memakai G91/G92.
+    """
+    if ("G", 91) in kode or ("G", 92) in kode:
+        return {}, []
+    steps, starts, ends, _, _ = plan_moves(plan, INITIAL_POSITION, passes=2)
+    _, starts_lain, ends_lain, _, _ = plan_moves(plan, _OTHER_START, passes=2)
+    n = len(steps) // 2
+
+    # Sumbu yang tidak pernah ditulis di G0/G1 tetap di nilai awalnya sepanjang program,
+    # tidak ikut dibandingkan. Titik yang sama di kedua simulasi sudah ditentukan program,
+    # bukan oleh posisi awal lengan.
+    sumbu = [i for i in range(4)
+             if any(plan[index].values is not None and plan[index].values[i] is not None for index in steps)]
+
+    def titik(points):
+        return [[p[i] for i in sumbu] for p in points.tolist()]
+
+    starts, ends = titik(starts), titik(ends)
+    tentu = [a == b and c == d for a, b, c, d in zip(starts, titik(starts_lain), ends, titik(ends_lain))]
+
+    def dwell(index):
+        return _S_RE.search(plan[index].command.upper().replace(" ", "")) is not None
+
+    diam = {}
+    for k in range(n):
+        index = steps[k]
+        if dwell(index) or not (tentu[k] and tentu[k + n]):
+            continue
+        if starts[k] == ends[k] and starts[k + n] == ends[k + n]:
+            diam[index] = "gerakan ke posisi yang sama"
+
+    gabung = []
+    for k in range(n - 1):
+        tengah, berikutnya = steps[k], steps[k + 1]
+        if berikutnya != tengah + 1 or dwell(tengah) or dwell(berikutnya):
+            continue  # Ada perintah lain di antaranya, atau gerakan dengan dwell
+        if _feed(plan[tengah]) != _feed(plan[berikutnya]):
+            continue  # F berbeda, kecepatan gerakan gabungan akan berubah
+        lurus = all(tentu[p] and tentu[p + 1] for p in (k, k + n))
+        for p in (k, k + n):
+            a, b, c = starts[p], ends[p], ends[p + 1]
+            ab, bc, ac = math.dist(a, b), math.dist(b, c), math.dist(a, c)
+            lurus = lurus and ab > 0 and bc > 0 and ab + bc - ac < MERGE_TOLERANCE_MM
+        if lurus:
+            gabung.append((tengah, berikutnya))
+    return diam, gabung
+
+
+def optimize_program(lines):
+    """
+    Optimasi list ProgramLine. Mengembalikan (baris baru, list OptimizeChange urut
+    nomor baris). Baris baru adalah objek ProgramLine yang sama tanpa yang dibuang.
+    """
+    lines = list(lines)
+    asal = list(range(len(lines)))  # Nomor baris asli setiap baris yang tersisa
+    changes = []
+    while True:
+        plan = compile_plan(lines)
+        kode = [command_code(step.command) if step.sync is None else None for step in plan]
+        buang = _redundant_toggles(plan, kode)
+        buang.update(_redundant_servo(plan, kode))
+        diam, gabung = _redundant_moves(plan, kode)
+        buang.update(diam)
+        if not buang:
+            # Penggabungan satu per satu tidak saling bertumpuk: titik tengah yang dibuang
+            # mengubah titik awal gerakan berikutnya
+            dipakai = set()
+            for tengah, berikutnya in gabung:
+                if tengah in dipakai:
+                    continue
+                buang[tengah] = f"titik tengah garis lurus, digabung ke baris {asal[plan[berikutnya].row] + 1}"
+                dipakai.update((tengah, berikutnya))
+        # Program harus tetap punya perintah yang dibalas 'ok'
+        sisa = [step for index, step in enumerate(plan) if index not in buang and step.expects_ok]
+        if not buang or not sisa:
+            break
+        rows = {plan[index].row: alasan for index, alasan in buang.items()}
+        changes.extend(OptimizeChange(asal[row], lines[row].text, alasan) for row, alasan in rows.items())
+        lines = [line for row, line in enumerate(lines) if row not in rows]
+        asal = [nomor for row, nomor in enumerate(asal) if row not in rows]
+    return lines, sorted(changes)
+
+
+def format_changes(changes):
+    """ Satu baris per perubahan untuk ditampilkan. """
+    return [f"Baris {change.row + 1}: {change.text}  ({change.reason})" for change in changes]
+
+
+def format_diff(old_texts, new_texts):
+    """ Unified diff teks program sebelum dan sesudah optimasi. """
+    return list(difflib.unified_diff(old_texts, new_texts, "program", "optimasi", n=1, lineterm=""))
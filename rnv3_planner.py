@@ -0,0 +1,337 @@
+import os
+import re
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+from rnv3_kinematics import inverse, plan_moves, INITIAL_POSITION
+from rnv3_program import PlanStep
+from rnv3_protocol import expects_ok, ack_timeout_ms, command_code, parse_command
+
+# Perencana lintasan di sisi aplikasi.
+#
+# Firmware menjalankan setiap G0/G1 sebagai satu garis lurus dengan satu kurva
+# kecepatan (M205: S0 datar, S1 arctan, S2 cosinus). Dengan kurva cosinus bawaan
+# kecepatan rata-rata hanya 2/pi dari kecepatan puncaknya, dan di dekat singularitas
+# (ujung tool dekat poros atau lengan hampir lurus) motor bisa diminta berputar jauh
+# lebih cepat dari bagian lain gerakan yang sama.
+#
+# plan_trajectory memecah gerakan panjang menjadi sub-gerakan pada garis yang sama,
+# dijalankan dengan kurva datar (M205 S0) dan dikirim lewat jendela streaming biasa:
+#   - naik dan turun kecepatan bertahap (RAMP_STEPS anak tangga), tidak pernah lebih
+#     cepat atau lebih keras (percepatan puncak) dari gerakan aslinya,
+#   - di bagian jelajah berjalan di kecepatan puncak gerakan aslinya,
+#   - setiap sub-gerakan dibatasi sehingga tidak ada motor yang melebihi
+#     JOINT_SPEED_MAX, dihitung dengan kinematika firmware (rnv3_kinematics).
+# Gerakan hanya dipecah jika perkiraan waktunya lebih cepat. Gerakan yang tidak
+# dipecah tetapi melebihi JOINT_SPEED_MAX diperlambat dengan F. Gerakan dengan S
+# tidak pernah dipecah atau diperlambat: firmware menjalankan cmdDwell setelah G0/G1
+# tersebut, dan baris buatan planner tidak membawa S.
+#
+# Di aplikasi planner aktif jika dijalankan dengan --planner atau environment
+# RNV3_PLANNER=1, di rnv3_runner/rnv3_cell dengan --plan.
+
+ENV_PLANNER = "RNV3_PLANNER"
+ARG_PLANNER = "--planner"
+
+SPEED_PROFILE = 2  # config.h, kurva kecepatan firmware setelah reset
+PROFILE_FLAT = 0  # M205 S0
+
+JOINT_SPEED_MAX = 2.0  # rad/s, kecepatan sudut maksimum motor rot/low/high
+RAIL_SPEED_MAX = 150.0  # mm/s, kecepatan maksimum rel
+FEED_MIN = 5  # F di bawah ini diganti kecepatan otomatis oleh firmware
+SEGMENT_MM = 20.0  # Panjang maksimum sub-gerakan di bagian jelajah
+RAMP_STEPS = 4  # Jumlah anak tangga kecepatan saat mulai dan saat berhenti
+MIN_MOVE_MM = 40.0  # Gerakan yang lebih pendek tidak dipecah
+MIN_GAIN = 0.05  # Gerakan dipecah hanya jika perkiraan waktunya minimal 5% lebih cepat
+COMMAND_OVERHEAD_S = 0.005  # Perkiraan jeda antar perintah: 'ok', host, baris berikutnya dibaca
+PROFILE_SAMPLES = 200  # Titik per gerakan untuk menghitung kecepatan motor
+
+_S_RE = re.compile(r'S(-?\d+)')
+
+# Ringkasan hasil plan_trajectory. Waktu adalah perkiraan lama semua gerakan
+# dalam satu putaran (detik), tanpa perintah lain.
+PlannerReport = namedtuple("PlannerReport", "moves split slowed time_before time_after skipped")
+
+
+def enabled(argv=None):
+    """ Planner diminta lewat argumen atau environment. """
+    argv = sys.argv if argv is None else argv
+    return ARG_PLANNER in argv or os.environ.get(ENV_PLANNER) == "1"
+
+
+def firmware_feed(dist, feed):
+    """ Kecepatan v di Interpolation::setInterpolation untuk F = `feed`. """
+    v = feed if feed is not None else 0.0
+    if v < 5:  # Termasuk 0 = nilai default
+        v = np.sqrt(dist) * 10
+    return max(v, 5.0)
+
+
+def firmware_distance(delta):
+    """ Jarak yang dipakai firmware: panjang garis XYZ, atau perpindahan rel jika lebih besar. """
+    return max(float(np.sqrt(delta[0] ** 2 + delta[1] ** 2 + delta[2] ** 2)), abs(float(delta[3])))
+
+
+def profile_speed(profile, progress):
+    """ Kecepatan lintasan relatif terhadap v di setiap progress (0..1), meniru updateActualPosition. """
+    progress = np.asarray(progress, dtype=float)
+    if profile == 1:  # ARCTAN APPROX
+        return np.pi / 2 * np.cos(2 * progress - 1) ** 2
+    if profile == 2:  # COSIN APPROX
+        return np.pi * np.sqrt(np.clip(progress * (1 - progress), 0.0, None))
+    return np.ones_like(progress)  # FLAT SPEED CURVE
+
+
+def profile_duration(profile):
+    """ Nilai t * tmul saat gerakan selesai, lama gerakan = nilai ini * jarak / v. """
+    if profile == 1:
+        return (np.tan(1.0) + np.pi / 2) / np.pi
+    return 1.0
+
+
+def speed_limit(start, end, samples=PROFILE_SAMPLES):
+    """
+    Kecepatan lintasan maksimum (mm/s, dalam jarak firmware) di setiap titik
+    gerakan agar tidak ada motor yang melebihi JOINT_SPEED_MAX atau RAIL_SPEED_MAX.
+    Mengembalikan (progress, batas).
+    """
+    start = np.asarray(start, dtype=float)
+    delta = np.asarray(end, dtype=float) - start
+    dist = firmware_distance(delta)
+    progress = np.linspace(0.0, 1.0, samples + 1)
+    points = start + progress[:, None] * delta
+    sudut = np.stack(inverse(points[:, 0], points[:, 1], points[:, 2]))
+    # Radian per mm jarak firmware, motor tercepat menentukan batas
+    laju = np.abs(np.gradient(sudut, progress, axis=1)).max(axis=0) / dist
+    with np.errstate(divide="ignore"):
+        batas = JOINT_SPEED_MAX / laju
+        if delta[3]:
+            batas = np.minimum(batas, RAIL_SPEED_MAX * dist / abs(delta[3]))
+    return progress, batas
+
+
+def move_joint_speed(start, end, feed, profile):
+    """ Kecepatan sudut motor tertinggi (rad/s) selama satu G0/G1, rel dinyatakan relatif terhadap batasnya. """
+    dist = firmware_distance(np.asarray(end, dtype=float) - np.asarray(start, dtype=float))
+    if dist <= 0:
+        return 0.0
+    progress, batas = speed_limit(start, end)
+    kecepatan = firmware_feed(dist, feed) * profile_speed(profile, progress)
+    return float(np.max(kecepatan / batas) * JOINT_SPEED_MAX)
+
+
+def move_time(dist, feed, profile):
+    """ Lama satu G0/G1 sejauh `dist` mm (detik). """
+    return profile_duration(profile) * dist / firmware_feed(dist, feed) if dist > 0 else 0.0
+
+
+def _pieces(dist, v_puncak, a_puncak):
+    """
+    Batas (progress awal, progress akhir, kecepatan) sub-gerakan sebelum dibatasi
+    kecepatan motor: anak tangga naik, jelajah dipotong per SEGMENT_MM, anak tangga turun.
+    """
+    if np.isfinite(a_puncak):
+        jarak_ramp = v_puncak ** 2 / (2 * a_puncak)
+        if 2 * jarak_ramp > dist:  # Tidak sempat mencapai kecepatan puncak
+            v_puncak = np.sqrt(a_puncak * dist)
+            jarak_ramp = dist / 2
+    else:
+        jarak_ramp = 0.0  # Gerakan asli sudah dengan kurva datar
+    naik = []
+    s = 0.0
+    for k in range(1, RAMP_STEPS + 1 if jarak_ramp > 0 else 1):
+        v = v_puncak * k / RAMP_STEPS
+        s_akhir = v ** 2 / (2 * a_puncak)
+        naik.append((s, s_akhir, v))
+        s = s_akhir
+    jelajah = dist - 2 * jarak_ramp
+    n = int(np.ceil(jelajah / SEGMENT_MM - 1e-9)) if jelajah > 1e-9 else 0
+    tengah = [(jarak_ramp + jelajah * i / n, jarak_ramp + jelajah * (i + 1) / n, v_puncak) for i in range(n)]
+    turun = [(dist - b, dist - a, v) for a, b, v in reversed(naik)]
+    return [(a / dist, b / dist, v) for a, b, v in naik + tengah + turun]
+
+
+def plan_move(start, end, feed, profile, split=True):
+    """
+    Rencana satu G0/G1. Mengembalikan (sub, t_asli, t_rencana, feed_aman):
+    `sub` adalah list (titik akhir, F) jika gerakan sebaiknya dipecah, selain itu None
+    dan gerakan dikirim utuh dengan F = feed_aman (None jika tidak perlu diubah).
+    """
+    start = np.asarray(start, dtype=float)
+    end = np.asarray(end, dtype=float)
+    delta = end - start
+    dist = firmware_distance(delta)
+    t_asli = move_time(dist, feed, profile)
+    if dist <= 0:
+        return None, t_asli, t_asli, None
+    v_asli = firmware_feed(dist, feed)
+    progress, batas = speed_limit(start, end)
+    g = profile_speed(profile, progress)
+
+    # Satu perintah: F tertinggi yang menjaga semua motor di bawah batas
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v_aman = float(np.min(np.where(g > 0, batas / g, np.inf)))
+    feed_aman = None
+    t_utuh = t_asli
+    if v_aman < v_asli:
+        feed_aman = max(FEED_MIN, int(v_aman))
+        t_utuh = move_time(dist, feed_aman, profile)
+    if not split or dist < MIN_MOVE_MM:
+        return None, t_asli, t_utuh, feed_aman
+
+    # Kecepatan dan percepatan puncak gerakan asli sebagai batas sub-gerakan
+    v_puncak = v_asli * float(g.max())
+    dg = np.gradient(g, progress)
+    a_puncak = v_asli ** 2 / dist * float(np.max(np.abs(g * dg)))
+    if a_puncak <= 0:
+        a_puncak = np.inf
+    pieces = _pieces(dist, v_puncak, a_puncak)
+
+    # Batas motor di setiap potongan, lalu perubahan kecepatan antar potongan
+    # dibatasi satu anak tangga agar perlambatan di dekat singularitas tetap bertahap
+    langkah_v = v_puncak / RAMP_STEPS
+    v = []
+    for a, b, kecepatan in pieces:
+        di_potongan = (progress >= a) & (progress <= b)
+        v.append(min(kecepatan, float(batas[di_potongan].min()) if di_potongan.any() else kecepatan))
+    for i in range(1, len(v)):
+        v[i] = min(v[i], v[i - 1] + langkah_v)
+    for i in range(len(v) - 2, -1, -1):
+        v[i] = min(v[i], v[i + 1] + langkah_v)
+
+    # Potongan berurutan dengan F sama digabung, F dibulatkan ke bawah
+    sub = []
+    for (a, b, _), kecepatan in zip(pieces, v):
+        f = int(kecepatan)
+        if f < FEED_MIN:
+            return None, t_asli, t_utuh, feed_aman  # Terlalu dekat singularitas untuk dipecah
+        if sub and sub[-1][2] == f:
+            sub[-1] = (sub[-1][0], b, f)
+        else:
+            sub.append((a, b, f))
+    t_rencana = sum(dist * (b - a) / f for a, b, f in sub) + COMMAND_OVERHEAD_S * (len(sub) - 1)
+    if t_rencana > t_utuh * (1 - MIN_GAIN):
+        return None, t_asli, t_utuh, feed_aman
+    return [(start + b * delta, f) for a, b, f in sub], t_asli, t_rencana, None
+
+
+def _angka(value):
+    """ Angka pendek untuk G-code, agar lebih banyak baris muat di buffer RX firmware. """
+    teks = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if teks == "-0" else teks
+
+
+def _step(row, command, values=None):
+    """ PlanStep untuk baris G-code buatan planner, disiapkan seperti compile_plan. """
+    wire = f"{command}\r\n"
+    return PlanStep(row, command, wire.encode(), expects_ok(wire), ack_timeout_ms(wire), values, ())
+
+
+def _move_step(row, point, offset, feed, with_e, ui=()):
+    x, y, z, e = (p - o for p, o in zip(point, offset))
+    command = f"G0 X{_angka(x)} Y{_angka(y)} Z{_angka(z)}"
+    if with_e:
+        command += f" E{_angka(e)}"
+    command += f" F{feed}"
+    return _step(row, command, (x, y, z, e if with_e else None, float(feed), None, None))._replace(ui=ui)
+
+
+def _has_dwell(command):
+    """ G0/G1 dengan S, firmware ikut menjalankan cmdDwell (sama dengan rnv3_optimizer). """
+    parsed = parse_command(command)
+    return parsed is not None and "S" in parsed[2]
+
+
+def _profile_step(row, profile):
+    return _step(row, f"M205 S{profile}")
+
+
+def speed_profiles(plan):
+    """
+    Kurva kecepatan (M205 S) yang aktif di setiap langkah saat program berulang,
+    dimulai dari kurva yang berlaku di akhir putaran sebelumnya.
+    """
+    profil = SPEED_PROFILE
+    for _ in range(2):
+        aktif = []
+        for step in plan:
+            if command_code(step.command) == ("M", 205):
+                match = _S_RE.search(step.command.upper())
+                profil = int(match.group(1)) if match else profil
+            aktif.append(profil)
+    return aktif
+
+
+def plan_trajectory(plan, start=INITIAL_POSITION):
+    """
+    Rencana eksekusi baru dengan gerakan panjang dipecah (lihat keterangan modul).
+    Langkah baru memakai nomor baris gerakan aslinya sehingga highlight tetap di
+    baris program. Program dengan G91/G92 dikembalikan apa adanya.
+    Mengembalikan (rencana, PlannerReport).
+    """
+    kode = [command_code(step.command) for step in plan]
+    if ("G", 91) in kode or ("G", 92) in kode:
+        return plan, PlannerReport(0, 0, 0, 0.0, 0.0, "program memakai G91/G92")
+
+    # Posisi di putaran kedua, sama dengan kondisi saat program berulang
+    steps, starts, ends, offsets, _ = plan_moves(plan, start, passes=2)
+    n = len(steps) // 2
+    gerakan = {index: i for i, index in enumerate(steps[:n], start=n)}
+    aktif = speed_profiles(plan)
+
+    baru = []
+    datar = False  # M205 S0 dari planner sedang berlaku
+    split = slowed = 0
+    t_sebelum = t_sesudah = 0.0
+    pertama = steps[0] if steps else None
+    for index, step in enumerate(plan):
+        i = gerakan.get(index)
+        if kode[index] == ("M", 205):
+            datar = False  # Program sendiri mengatur kurva kecepatan
+        if i is None:
+            baru.append(step)
+            continue
+        feed = step.values[4] if step.values is not None else None
+        # Gerakan pertama tidak dipecah: titik awalnya tergantung kondisi robot
+        # (setelah kalibrasi, atau dari akhir putaran sebelumnya)
+        tetap = _has_dwell(step.command)
+        sub, t_asli, t_rencana, feed_aman = plan_move(starts[i], ends[i], feed, aktif[index],
+                                                      split=index != pertama and not tetap)
+        if tetap:
+            t_rencana, feed_aman = t_asli, None  # Dikirim apa adanya, dwell-nya tetap jalan
+        t_sebelum += t_asli
+        t_sesudah += t_rencana
+        if sub is None:
+            if datar:
+                baru.append(_profile_step(step.row, aktif[index]))
+                datar = False
+            if feed_aman is not None:
+                slowed += 1
+                values = step.values
+                baru.append(_move_step(step.row, ends[i], offsets[i], feed_aman,
+                                       values is not None and values[3] is not None, step.ui))
+            else:
+                baru.append(step)
+            continue
+        split += 1
+        if not datar:
+            baru.append(_profile_step(step.row, PROFILE_FLAT))
+            datar = True
+        with_e = bool(ends[i][3] != starts[i][3])
+        for k, (point, f) in enumerate(sub):
+            baru.append(_move_step(step.row, point, offsets[i], f, with_e, step.ui if k == 0 else ()))
+    if datar and plan:
+        baru.append(_profile_step(plan[-1].row, aktif[-1]))
+    return tuple(baru), PlannerReport(n, split, slowed, float(t_sebelum), float(t_sesudah), None)
+
+
+def format_report(report):
+    """ Satu baris ringkasan PlannerReport untuk ditampilkan. """
+    if report.skipped:
+        return f"Planner tidak dipakai: {report.skipped}."
+    pesan = f"Planner: {report.split} dari {report.moves} gerakan dipecah"
+    if report.slowed:
+        pesan += f", {report.slowed} diperlambat (batas kecepatan motor)"
+    return pesan + f", perkiraan waktu gerak {report.time_before:.2f} s -> {report.time_after:.2f} s."
@@ -0,0 +1,153 @@
+import socket
+import sys
+from collections import namedtuple
+
+from PyQt5 import QtCore
+from PyQt5.QtSerialPort import QSerialPortInfo
+
+# Deteksi port serial yang dicolok/dicabut tanpa enumerasi setiap detik.
+#
+# Di Linux PortWatcher mendengarkan uevent kernel lewat socket netlink, jadi
+# availablePorts() hanya dipanggil saat benar-benar ada perangkat tty yang
+# berubah. Di sistem lain (Windows) dipakai polling dengan interval panjang.
+# Selama robot tersambung enumerasi dihentikan sama sekali, pencabutan kabel
+# saat tersambung dideteksi dari error port (lihat SerialLink.port_lost).
+
+PORT_POLL_MS = 3000  # Interval polling cadangan jika uevent tidak tersedia
+UEVENT_SETTLE_MS = 500  # Tunggu udev selesai membuat /dev/tty* sebelum enumerasi
+
+NETLINK_KOBJECT_UEVENT = 15  # linux/netlink.h, tidak ada di modul socket
+UEVENT_GROUP_KERNEL = 1
+
+# Deskripsi port yang disimpan, sehingga tidak perlu bertanya ke sistem lagi
+PortInfo = namedtuple("PortInfo", "name description location")
+
+
+def enumerate_ports():
+    """ Semua port serial saat ini sebagai dict nama -> PortInfo. """
+    return {info.portName(): PortInfo(info.portName(), info.description(), info.systemLocation())
+            for info in QSerialPortInfo.availablePorts()}
+
+
+def open_uevent_socket():
+    """ Socket netlink uevent kernel, None jika tidak didukung (bukan Linux, sandbox, dll). """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+        sock.bind((0, UEVENT_GROUP_KERNEL))
+        sock.setblocking(False)
+    except (OSError, AttributeError):
+        return None
+    return sock
+
+
+def parse_uevent(data):
+    """ Pesan uevent ("add@/devices/...\\0ACTION=add\\0...") menjadi dict. """
+    fields = {}
+    for item in data.split(b"\0")[1:]:
+        key, sep, value = item.partition(b"=")
+        if sep:
+            fields[key.decode(errors="replace")] = value.decode(errors="replace")
+    return fields
+
+
+class PortWatcher(QtCore.QObject):
+    """
+    Memancarkan attached/detached (PortInfo) saat port serial muncul atau hilang.
+    `ports` berisi PortInfo terakhir yang diketahui, dipakai tanpa enumerasi ulang.
+    """
+
+    attached = QtCore.pyqtSignal(object)
+    detached = QtCore.pyqtSignal(object)
+
+    def __init__(self, poll_ms=PORT_POLL_MS, parent=None):
+        super().__init__(parent)
+        self.ports = {}
+        self.suspended = False
+        self.dirty = False  # Ada perubahan selama ditangguhkan, enumerasi saat resume
+        self.sock = None
+        self.notifier = None
+        self.poll_timer = QtCore.QTimer(self)
+        self.poll_timer.setInterval(poll_ms)
+        self.poll_timer.timeout.connect(self.rescan)
+        # Satu uevent colok biasanya diikuti beberapa uevent lain, digabung jadi satu enumerasi
+        self.settle_timer = QtCore.QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(UEVENT_SETTLE_MS)
+        self.settle_timer.timeout.connect(self.rescan)
+
+    def start(self):
+        """ Enumerasi awal lalu mulai mendengarkan uevent (atau polling). """
+        self.sock = open_uevent_socket()
+        if self.sock is not None:
+            self.notifier = QtCore.QSocketNotifier(self.sock.fileno(), QtCore.QSocketNotifier.Read, self)
+            self.notifier.activated.connect(self.read_uevents)
+        self.rescan()
+        self.update_polling()
+
+    def uses_uevents(self):
+        return self.sock is not None
+
+    def suspend(self):
+        """ Hentikan enumerasi, misalnya selama robot tersambung. """
+        self.suspended = True
+        self.settle_timer.stop()
+        self.update_polling()
+
+    def resume(self):
+        self.suspended = False
+        self.update_polling()
+        # Tanpa uevent tidak diketahui apa yang berubah selama ditangguhkan
+        if self.dirty or not self.uses_uevents():
+            self.rescan()
+
+    def update_polling(self):
+        if self.uses_uevents() or self.suspended:
+            self.poll_timer.stop()
+        elif not self.poll_timer.isActive():
+            self.poll_timer.start()
+
+    def read_uevents(self):
+        changed = False
+        while True:
+            try:
+                data = self.sock.recv(8192)
+            except BlockingIOError:
+                break
+            except OSError:
+                break
+            fields = parse_uevent(data)
+            if fields.get("SUBSYSTEM") == "tty" and fields.get("ACTION") in ("add", "remove"):
+                changed = True
+        if not changed:
+            return
+        if self.suspended:
+            self.dirty = True
+        else:
+            self.settle_timer.start()
+
+    def rescan(self):
+        if self.suspended:
+            self.dirty = True
+            return
+        self.dirty = False
+        current = enumerate_ports()
+        lama = self.ports
+        self.ports = current
+        for name, info in lama.items():
+            if name not in current or current[name] != info:
+                self.detached.emit(info)
+        for name, info in current.items():
+            if name not in lama or lama[name] != info:
+                self.attached.emit(info)
+
+    def stop(self):
+        self.poll_timer.stop()
+        self.settle_timer.stop()
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier = None
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
@@ -0,0 +1,221 @@
+import re
+import time
+from collections import deque, namedtuple
+
+from rnv3_protocol import expects_ok, ack_timeout_ms
+
+# Program robot: satu baris teks per perintah, diparse sekali saat diedit.
+
+AXES = "XYZEFAB"  # Urutan nilai di ProgramLine.values
+_AXIS_INDEX = {axis: i for i, axis in enumerate(AXES)}
+
+# Satu pencarian untuk semua nilai, menggantikan satu re.search per huruf.
+# Angka berhenti di koma desimal, seperti pencarian per huruf sebelumnya.
+GCODE_VALUE_RE = re.compile(r'([XYZEFAB])(-?\d+\.?\d*)')
+
+
+class ProgramLine:
+    """
+    Satu baris program yang sudah diparse. `values` berisi nilai X, Y, Z, E, F, A, B
+    (sesuai urutan AXES) atau None jika huruf tersebut tidak ada di baris.
+    """
+    __slots__ = ("text", "values")
+
+    def __init__(self, text):
+        self.text = text
+        values = [None] * len(AXES)
+        for axis, number in GCODE_VALUE_RE.findall(text):
+            i = _AXIS_INDEX[axis]
+            if values[i] is None:  # Ambil kemunculan pertama, sama seperti re.search
+                values[i] = float(number)
+        self.values = tuple(values)
+
+    def value(self, axis, default):
+        """ Nilai satu sumbu, atau `default` jika tidak ada di baris ini. """
+        v = self.values[_AXIS_INDEX[axis]]
+        return default if v is None else v
+
+    def has_values(self):
+        return any(v is not None for v in self.values)
+
+
+def parse_program_file(lines):
+    """ Baris file program .h (format "G0 X0 ...",) menjadi list ProgramLine. """
+    program = []
+    for line in lines:
+        line = line.strip()  # Hapus spasi di awal/akhir
+
+        # Abaikan baris kosong dan komentar
+        if not line or line.startswith("//"):
+            continue
+
+        # Hapus tanda kutip dan koma dari setiap baris
+        cleaned_line = line.strip('" ,')
+        if cleaned_line:  # Pastikan hanya menambahkan baris yang valid
+            program.append(ProgramLine(cleaned_line))
+    return program
+
+
+def format_program_file(texts):
+    """ Kebalikan parse_program_file, menghasilkan isi file program .h. """
+    out = ["// File ini dihasilkan secara otomatis\n", "// Ruskomponen\n"]
+    last = len(texts) - 1
+    for i, text in enumerate(texts):
+        if i == last:  # Jika ini adalah elemen terakhir
+            out.append(f'    "{text}"\n')  # Tidak ada koma
+        else:
+            out.append(f'    "{text}",\n')  # Tambahkan koma
+    return "".join(out)
+
+
+# Efek tampilan (tombol) yang dipicu sebuah baris, urut seperti pengecekan di apply_line_to_ui
+UI_SERVO = "servo"
+UI_VACUM = "vacum"
+UI_LG1 = "LG1"
+UI_LG2 = "LG2"
+UI_LG3 = "LG3"
+
+UI_EFFECTS = (
+    ("SERVO ON", ((UI_SERVO, True),)),
+    ("SERVO OFF", ((UI_SERVO, False),)),
+    ("VACUM ON", ((UI_VACUM, True), (UI_LG3, True), (UI_LG2, False))),
+    ("VACUM OFF", ((UI_VACUM, False), (UI_LG3, False))),
+    ("LG1 ON", ((UI_LG1, True),)),
+    ("LG1 OFF", ((UI_LG1, False),)),
+    ("LG2 ON", ((UI_LG2, True),)),
+    ("LG2 OFF", ((UI_LG2, False),)),
+    ("LG3 ON", ((UI_LG3, True),)),
+    ("LG3 OFF", ((UI_LG3, False),)),
+)
+
+# SERVO ON/OFF tidak dikenal firmware sehingga tidak dibalas 'ok',
+# kirim perintah M5/M3 milik tombol servo sebagai gantinya
+WIRE_SUBSTITUTES = (
+    ("SERVO ON", "M5"),
+    ("SERVO OFF", "M3"),
+)
+
+# Satu langkah rencana eksekusi. Tuple sehingga tidak bisa diubah setelah dikompilasi.
+#   row        : nomor baris di program (untuk highlight)
+#   command    : teks yang dikirim tanpa terminator
+#   data       : byte siap tulis ke serial
+#   expects_ok : firmware akan membalas 'ok' (kebijakan ack)
+#   timeout_ms : batas waktu menunggu 'ok'
+#   values     : nilai X, Y, Z, E, F, A, B untuk spinbox (None jika tidak ada)
+#   ui         : tuple (efek, nyala) untuk tombol servo/vacum/LG
+#   sync       : nama titik sinkron untuk baris "SYNC <nama>", selain itu None
+PlanStep = namedtuple("PlanStep", "row command data expects_ok timeout_ms values ui sync", defaults=(None,))
+
+# "SYNC <nama>": tidak dikirim ke robot. Pengirim menunggu semua perintah sebelumnya
+# selesai, lalu menunggu semua robot lain yang programnya memuat SYNC dengan nama
+# yang sama sampai di titik itu juga (lihat rnv3_cell.SyncBarriers).
+SYNC_KEYWORD = "SYNC"
+
+
+def parse_sync(text):
+    """ Nama titik sinkron jika `text` adalah baris "SYNC <nama>", selain itu None. """
+    parts = text.split()
+    if len(parts) == 2 and parts[0].upper() == SYNC_KEYWORD:
+        return parts[1].upper()
+    return None
+
+
+def compile_step(row, program_line):
+    """ Kompilasi satu ProgramLine menjadi PlanStep, None untuk baris kosong. """
+    text = program_line.text.strip()
+    if not text:
+        return None
+    sync = parse_sync(text)
+    if sync is not None:
+        return PlanStep(row, text, b"", False, 0, None, (), sync)
+    command = text
+    for fragment, substitute in WIRE_SUBSTITUTES:
+        if fragment in text:
+            command = substitute
+            break
+    ui = tuple(effect for fragment, effects in UI_EFFECTS if fragment in text for effect in effects)
+    wire = f"{command}\r\n"
+    return PlanStep(row, command, wire.encode(), expects_ok(wire), ack_timeout_ms(wire),
+                    program_line.values if program_line.has_values() else None, ui)
+
+
+def compile_plan(program_lines):
+    """
+    Kompilasi program menjadi rencana eksekusi (tuple PlanStep). Baris kosong
+    dilewati di sini sekali saja, bukan setiap kali program berulang.
+    """
+    plan = []
+    for row, program_line in enumerate(program_lines):
+        step = compile_step(row, program_line)
+        if step is not None:
+            plan.append(step)
+    return tuple(plan)
+
+
+def sync_names(plan):
+    """ Nama semua titik sinkron di rencana. """
+    return {step.sync for step in plan if step.sync is not None}
+
+
+def last_acked_step(plan):
+    """
+    Posisi langkah terakhir di rencana yang dibalas 'ok'. Balasan untuk langkah ini
+    menandai satu siklus program selesai. None jika tidak ada langkah yang dibalas,
+    program seperti itu tidak bisa dijalankan berulang karena jendela streaming
+    tidak akan pernah penuh.
+    """
+    for position in range(len(plan) - 1, -1, -1):
+        if plan[position].expects_ok:
+            return position
+    return None
+
+
+class CycleStats:
+    """
+    Penghitung siklus program dan statistik waktu siklus. Satu siklus dihitung
+    dari selesainya siklus sebelumnya (atau start) sampai langkah terakhir
+    yang dibalas 'ok' selesai dieksekusi firmware.
+    """
+
+    def __init__(self, clock=time.monotonic, recent=20):
+        self.clock = clock
+        self.recent = deque(maxlen=recent)  # Waktu siklus terakhir untuk laju unit/jam
+        self.start()
+
+    def start(self):
+        self.cycles = 0
+        self.total = 0.0
+        self.shortest = None
+        self.longest = None
+        self.recent.clear()
+        self.cycle_start = self.clock()
+
+    def complete(self):
+        """ Catat satu siklus selesai, mengembalikan durasinya dalam detik. """
+        now = self.clock()
+        duration = now - self.cycle_start
+        self.cycle_start = now
+        self.cycles += 1
+        self.total += duration
+        self.shortest = duration if self.shortest is None else min(self.shortest, duration)
+        self.longest = duration if self.longest is None else max(self.longest, duration)
+        self.recent.append(duration)
+        return duration
+
+    def mean(self):
+        return self.total / self.cycles if self.cycles else None
+
+    def units_per_hour(self):
+        """ Laju produksi dari rata-rata siklus terakhir (satu siklus = satu unit). """
+        if not self.recent:
+            return None
+        rata = sum(self.recent) / len(self.recent)
+        return 3600.0 / rata if rata > 0 else None
+
+    def summary(self):
+        if not self.cycles:
+            return "Belum ada siklus selesai"
+        uph = self.units_per_hour()
+        return (f"{self.cycles} siklus, rata-rata {self.mean():.2f} s "
+                f"(min {self.shortest:.2f} s, maks {self.longest:.2f} s), "
+                f"{uph:.0f} unit/jam" if uph else f"{self.cycles} siklus")
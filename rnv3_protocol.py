@@ -0,0 +1,389 @@
+import re
+import time
+from collections import deque
+
+# Protokol serial antara aplikasi dan firmware robotRNV3_v2_01.
+# Nilai di bawah mengikuti config.h firmware, ubah bersamaan jika firmware diubah.
+
+QUEUE_SIZE = 15  # Ukuran Queue<Cmd> di firmware (QUEUE_SIZE)
+RX_BUFFER_SIZE = 64  # Buffer RX HardwareSerial ATmega2560, hanya 63 byte yang bisa terisi
+PRINT_REPLY_MSG = "ok"  # Balasan firmware setiap satu perintah selesai dieksekusi
+
+STREAM_WINDOW_DEFAULT = 4  # Jumlah baris maksimal yang boleh "di jalan" sekaligus
+ACK_TIMEOUT_DEFAULT = 30000  # Batas waktu menunggu "ok" per perintah dalam ms (sama dengan homing_timer)
+MAX_LINE_LENGTH = 256  # Baris masuk yang lebih panjang dari ini dianggap sampah (misal saat Arduino reset)
+
+# Alias teks yang diterjemahkan Command::processMessage menjadi perintah M
+FIRMWARE_ALIASES = {
+    "VACUM ON": "M209",
+    "VACUM OFF": "M230",
+    "LG1 ON": "M1",
+    "LG1 OFF": "M2",
+    "LG2 ON": "M206",
+    "LG2 OFF": "M207",
+    "LG3 ON": "M6",
+    "LG3 OFF": "M7",
+}
+
+
+def expects_ok(gcode_line):
+    """
+    Cek apakah firmware akan membalas "ok" untuk baris ini.
+    Meniru Command::processMessage: hanya perintah G/M yang masuk antrean,
+    dan M208 tidak menunggu gerakan sehingga tidak pernah dibalas.
+    """
+    msg = gcode_line.strip()
+    msg = FIRMWARE_ALIASES.get(msg.upper(), msg)
+    msg = msg.upper().replace(" ", "")
+    if not msg or msg[0] not in "GM":
+        return False
+    match = re.match(r'[GM](\d*)', msg)
+    if msg[0] == "M" and match.group(1) and int(match.group(1)) == 208:
+        return False
+    return True
+
+
+def command_code(gcode_line):
+    """
+    Huruf dan nomor perintah seperti dibaca Command::processMessage, misal ("G", 0)
+    atau ("M", 209) untuk "VACUM ON". None jika baris bukan perintah G/M.
+    """
+    msg = gcode_line.strip()
+    msg = FIRMWARE_ALIASES.get(msg.upper(), msg).upper().replace(" ", "")
+    match = re.match(r'([GM])(\d*)', msg)
+    if match is None:
+        return None
+    return match.group(1), int(match.group(2)) if match.group(2) else 0
+
+
+_INT_RE = re.compile(r'\s*[-+]?\d+')
+_FLOAT_RE = re.compile(r'\s*[-+]?(\d+\.?\d*|\.\d+)')
+_SEGMENT_RE = re.compile(r'([A-Za-z])([^A-Za-z]*)')
+
+
+def _to_int(text):
+    """ String::toInt (atol): angka di awal teks, 0 jika tidak ada. """
+    match = _INT_RE.match(text)
+    return int(match.group()) if match else 0
+
+
+def _to_float(text):
+    """ String::toFloat (atof): angka di awal teks, 0 jika tidak ada. """
+    match = _FLOAT_RE.match(text)
+    return float(match.group()) if match else 0.0
+
+
+def parse_command(message):
+    """
+    Baca satu baris persis seperti Command::processMessage (tanpa terminator).
+    Mengembalikan (huruf, nomor, {huruf nilai: angka}) dengan segmen terakhir yang
+    berlaku jika huruf yang sama muncul dua kali, atau None jika bukan perintah G/M.
+    """
+    msg = FIRMWARE_ALIASES.get(message.upper(), message)
+    msg = msg.upper().replace(" ", "")
+    if not msg or msg[0] not in "GM":
+        return None
+    end = 1
+    while end < len(msg) and not msg[end].isalpha():
+        end += 1
+    fields = {letter: _to_float(value) for letter, value in _SEGMENT_RE.findall(msg[end:])}
+    return msg[0], _to_int(msg[1:end]), fields
+
+
+def ack_timeout_ms(gcode_line):
+    """
+    Batas waktu menunggu "ok" untuk satu baris, ditambah lama dwell S untuk G4 dan
+    juga G0/G1 (di executeCommand case 0/1 berlanjut ke cmdDwell).
+    """
+    parsed = parse_command(gcode_line.strip())
+    if parsed is not None and parsed[0] == "G" and parsed[1] in (0, 1, 4):
+        dwell = parsed[2].get("S", 0.0)
+        if dwell > 0:
+            return ACK_TIMEOUT_DEFAULT + int(dwell * 1000)
+    return ACK_TIMEOUT_DEFAULT
+
+
+class StreamWindow:
+    """
+    Jendela geser (sliding window) untuk streaming G-code ke firmware.
+
+    Firmware hanya membaca serial ketika tidak sedang bergerak, jadi baris yang
+    dikirim lebih dulu menunggu di buffer RX. Selama total byte yang belum dibalas
+    "ok" masih muat di buffer RX dan jumlah baris tidak melebihi ruang antrean
+    firmware, baris berikutnya boleh langsung dikirim tanpa menunggu "ok".
+    """
+
+    def __init__(self, max_lines=STREAM_WINDOW_DEFAULT, max_bytes=RX_BUFFER_SIZE - 1):
+        self.max_lines = max(1, min(int(max_lines), QUEUE_SIZE))
+        self.max_bytes = max_bytes
+        self.in_flight = deque()  # (indeks baris, jumlah byte) yang menunggu "ok"
+        self.bytes_in_flight = 0
+
+    def __len__(self):
+        return len(self.in_flight)
+
+    def free_slots(self):
+        """ Sisa ruang antrean firmware menurut perhitungan di sisi aplikasi. """
+        return self.max_lines - len(self.in_flight)
+
+    def can_send(self, nbytes):
+        """ Cek apakah baris sepanjang `nbytes` boleh dikirim sekarang. """
+        if not self.in_flight:
+            return True  # Jendela kosong: baris yang lebih panjang dari buffer tetap dikirim sendirian
+        if self.free_slots() <= 0:
+            return False
+        return self.bytes_in_flight + nbytes <= self.max_bytes
+
+    def push(self, index, nbytes):
+        """ Catat baris yang baru saja ditulis ke serial. """
+        self.in_flight.append((index, nbytes))
+        self.bytes_in_flight += nbytes
+
+    def head(self):
+        """
+        Indeks baris yang sedang dieksekusi firmware (tertua yang belum dibalas), None jika
+        jendela kosong atau baris itu milik program yang sudah dihentikan.
+        """
+        return self.in_flight[0][0] if self.in_flight else None
+
+    def ack(self):
+        """ Baris tertua selesai dieksekusi. Mengembalikan indeksnya, atau None jika jendela kosong. """
+        if not self.in_flight:
+            return None
+        index, nbytes = self.in_flight.popleft()
+        self.bytes_in_flight -= nbytes
+        return index
+
+    def reset(self):
+        """ Kosongkan jendela, hanya jika buffer firmware juga kosong (reset DTR). """
+        self.in_flight.clear()
+        self.bytes_in_flight = 0
+
+    def discard_pending(self):
+        """
+        Program dihentikan: baris yang sudah terkirim tetap menempati buffer RX dan
+        antrean firmware sampai dibalas "ok", tapi indeksnya tidak lagi berlaku untuk
+        program berikutnya. Byte dan slotnya tetap dihitung sampai "ok"-nya datang.
+        """
+        self.in_flight = deque((None, nbytes) for _, nbytes in self.in_flight)
+
+
+class LineFramer:
+    """
+    Buffer terima serial yang memotong data menjadi baris secara bertahap.
+
+    Hanya byte yang baru datang yang dicari terminatornya, dan hanya bagian yang
+    sudah lengkap yang di-decode. Sisa baris yang belum lengkap tetap di bytearray
+    yang sama sampai potongan berikutnya datang. Baris yang lebih panjang dari
+    `max_line` dibuang sampai terminator berikutnya.
+    """
+
+    def __init__(self, max_line=MAX_LINE_LENGTH):
+        self.max_line = max_line
+        self.buffer = bytearray()
+        self.scan_from = 0  # Posisi di buffer yang belum pernah dicari "\n"
+        self.discarding = False  # True selama membuang sisa baris yang terlalu panjang
+        self.overflows = 0  # Jumlah baris yang dibuang karena terlalu panjang
+
+    def feed(self, data):
+        """ Tambahkan data mentah, kembalikan list baris (str) yang sudah lengkap. """
+        buf = self.buffer
+        buf.extend(data)
+        lines = []
+        # Terminator terakhir dicari mundur, hanya di byte yang baru datang
+        last = buf.rfind(b"\n", self.scan_from)
+        if last >= 0:
+            # Bagian yang sudah lengkap di-decode dan dipotong sekali jalan
+            parts = buf[:last].decode('utf-8', 'ignore').split("\n")
+            del buf[:last + 1]
+            if self.discarding:
+                parts[0] = ""  # Ekor baris yang terlalu panjang
+                self.discarding = False
+            for part in parts:
+                if len(part) > self.max_line:
+                    self.overflows += 1
+                    continue
+                part = part.strip()
+                if part:
+                    lines.append(part)
+
+        if len(buf) > self.max_line:
+            # Tidak ada terminator dalam batas panjang baris, buang sampai "\n" berikutnya
+            buf.clear()
+            if not self.discarding:
+                self.overflows += 1
+            self.discarding = True
+        self.scan_from = len(buf)
+        return lines
+
+    def reset(self):
+        self.buffer.clear()
+        self.scan_from = 0
+        self.discarding = False
+
+
+class PendingAck:
+    """ Satu perintah yang sudah ditulis ke serial dan menunggu "ok". """
+    __slots__ = ("command", "timeout_ms", "deadline", "on_ok", "on_timeout", "on_late", "expired")
+
+    def __init__(self, command, timeout_ms, on_ok=None, on_timeout=None, on_late=None):
+        self.command = command
+        self.timeout_ms = timeout_ms
+        self.deadline = None  # Baru dihitung saat perintah ini mulai dieksekusi firmware
+        self.on_ok = on_ok
+        self.on_timeout = on_timeout
+        self.on_late = on_late  # Dipanggil jika "ok" baru datang setelah timeout
+        self.expired = False
+
+
+class AckTracker:
+    """
+    Antrean perintah yang menunggu balasan "ok" dari firmware.
+
+    Firmware membalas tepat satu "ok" per perintah G/M dan dalam urutan yang sama
+    dengan urutan kirim, jadi setiap "ok" langsung dicocokkan dengan perintah tertua
+    tanpa polling. Setiap perintah punya batas waktu sendiri yang mulai dihitung
+    ketika perintah itu menjadi yang terdepan (sedang dieksekusi firmware).
+
+    Perintah yang timeout tidak dibuang: firmware mungkin masih mengeksekusinya, jadi
+    perintah itu tetap di antrean sebagai penampung satu "ok" yang terlambat (on_late),
+    dan batas waktu perintah berikutnya mulai dihitung.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.pending = deque()
+
+    def __len__(self):
+        return len(self.pending)
+
+    def expect(self, command, timeout_ms=ACK_TIMEOUT_DEFAULT, on_ok=None, on_timeout=None, on_late=None):
+        """ Daftarkan perintah yang baru dikirim. """
+        entry = PendingAck(command, timeout_ms, on_ok, on_timeout, on_late)
+        self.pending.append(entry)
+        self._start_head()
+        return entry
+
+    def _active(self):
+        """ Perintah tertua yang belum timeout, None jika tidak ada. """
+        for entry in self.pending:
+            if not entry.expired:
+                return entry
+        return None
+
+    def _start_head(self, restart=False):
+        head = self._active()
+        if head is not None and (head.deadline is None or restart):
+            head.deadline = self.clock() + head.timeout_ms / 1000.0
+
+    def ack(self):
+        """
+        Cocokkan satu "ok" dengan perintah tertua. Mengembalikan PendingAck atau None.
+        Untuk perintah yang sudah timeout, on_ok-nya sudah diganti on_late.
+        """
+        if not self.pending:
+            return None
+        entry = self.pending.popleft()
+        # "ok" terlambat: perintah berikutnya baru sekarang mulai dieksekusi firmware
+        self._start_head(restart=entry.expired)
+        return entry
+
+    def next_deadline_ms(self):
+        """ Sisa waktu (ms) sampai perintah tertua timeout, None jika tidak ada yang ditunggu. """
+        head = self._active()
+        if head is None:
+            return None
+        return max(0, int((head.deadline - self.clock()) * 1000))
+
+    def expire(self):
+        """ Tandai perintah terdepan yang sudah lewat batas waktu, kembalikan list-nya. """
+        expired = []
+        head = self._active()
+        while head is not None and head.deadline <= self.clock():
+            head.expired = True
+            head.on_ok = head.on_late
+            expired.append(head)
+            self._start_head()
+            head = self._active()
+        return expired
+
+    def drop_expired(self):
+        """ Lupakan perintah yang sudah timeout, "ok"-nya tidak akan datang (misal baud sudah diganti). """
+        self.pending = deque(entry for entry in self.pending if not entry.expired)
+
+    def detach_callbacks(self, owner=None, on_drained=None):
+        """
+        Tetap tunggu "ok" perintah yang sudah terkirim, tapi jangan jalankan callback-nya.
+        Perintah dengan on_ok `owner` memanggil `on_drained` saat dibalas atau timeout.
+        """
+        for entry in self.pending:
+            milik = owner is not None and (entry.on_ok == owner or (entry.expired and entry.on_ok == on_drained))
+            drained = on_drained if milik else None
+            entry.on_ok = drained
+            entry.on_timeout = drained
+            entry.on_late = drained
+
+    def clear(self):
+        self.pending.clear()
+
+
+# Jenis pesan dari firmware, dikembalikan oleh classify_line.
+MSG_OK = "ok"
+MSG_POSITION = "position"
+MSG_SERVO_SETUP = "servo_setup"
+MSG_HOMING_COMPLETE = "homing_complete"
+MSG_READY_CALIBRATION = "ready_calibration"
+MSG_STOP = "stop"
+MSG_S1_ON = "s1_on"
+MSG_S1_OFF = "s1_off"
+MSG_S2_ON = "s2_on"
+MSG_S2_OFF = "s2_off"
+MSG_S3_ON = "s3_on"
+MSG_S3_OFF = "s3_off"
+MSG_RAIL_ON = "rail_on"
+MSG_RAIL_OFF = "rail_off"
+MSG_LINEAR_MOVE = "linear_move"
+MSG_SERVO_MOVE = "servo_move"
+MSG_PROTOCOL = "protocol"
+MSG_ERROR = "error"
+
+# Pesan status yang dikirim firmware apa adanya, harus sama persis dengan baris
+# (sudah di-strip) agar "ENDSTOP: [...]" tidak terbaca sebagai "stop" dan teks lain
+# yang kebetulan mengandung "ok" tidak dianggap balasan.
+MESSAGE_EXACT = {
+    PRINT_REPLY_MSG: MSG_OK,
+    PRINT_REPLY_MSG.upper(): MSG_OK,
+    "S1 ON": MSG_S1_ON,
+    "S1 OFF": MSG_S1_OFF,
+    "S2 ON": MSG_S2_ON,
+    "S2 OFF": MSG_S2_OFF,
+    "S3 ON": MSG_S3_ON,
+    "S3 OFF": MSG_S3_OFF,
+    "HOMING COMPLETE": MSG_HOMING_COMPLETE,
+    "READY CALIBRATION": MSG_READY_CALIBRATION,
+    "RAIL ON": MSG_RAIL_ON,
+    "RAIL OFF": MSG_RAIL_OFF,
+    "STOP": MSG_STOP,
+}
+
+# Pesan yang membawa data, dikenali dari teks sebelum ":" pertama
+MESSAGE_PREFIX = {
+    "LINEAR MOVE": MSG_LINEAR_MOVE,
+    "SERVO MOVE": MSG_SERVO_MOVE,
+    "CURRENT POSITION": MSG_POSITION,
+    "SETUP GRIPPER SERVO": MSG_SERVO_SETUP,
+    "PROTOCOL": MSG_PROTOCOL,
+    "ERROR": MSG_ERROR,
+}
+
+
+def classify_line(line):
+    """
+    Tentukan jenis pesan firmware dengan dua kali lookup tabel (tanpa lower() dan
+    tanpa rantai pencarian substring). Mengembalikan salah satu konstanta MSG_*,
+    atau None untuk pesan yang hanya ditampilkan.
+    """
+    kind = MESSAGE_EXACT.get(line)
+    if kind is None:
+        kind = MESSAGE_PREFIX.get(line.partition(":")[0].rstrip())
+    return kind
@@ -0,0 +1,402 @@
+"""
+Menjalankan program robot (.h) tanpa GUI.
+
+Pemakaian:
+    python rnv3_runner.py program.h --port COM3 [--loops 10] [--window 4] [--no-home] [--plan] [--binary]
+                          [--baud 1000000] [-v]
+
+Urutan sama dengan aplikasi: buka port dan reset Arduino lewat DTR, tunggu
+"READY CALIBRATION", kalibrasi dengan G28, lalu kirim program dengan jendela
+streaming yang sama seperti send_next_line. --loops 0 berarti berulang terus
+sampai Ctrl+C. Ctrl+C pertama berhenti mengirim dan menunggu perintah yang
+sudah terkirim selesai, Ctrl+C kedua langsung keluar. Dengan --plan gerakan
+panjang dipecah menjadi sub-gerakan oleh rnv3_planner sebelum dikirim. Dengan
+--binary firmware ditanya dengan M260 dan, jika mendukung, program dikirim sebagai
+frame biner rnv3_binary. Dengan --baud baud dinaikkan sampai batas itu dengan M261
+(rnv3_baud) sebelum kalibrasi, dan throughput serial dicetak di akhir.
+
+Kode keluar: 0 jika semua putaran selesai, 1 jika gagal (port, timeout, dll).
+"""
+import argparse
+import signal
+import sys
+import time
+
+from PyQt5 import QtCore
+
+from rnv3_protocol import (StreamWindow, AckTracker, STREAM_WINDOW_DEFAULT, ACK_TIMEOUT_DEFAULT,
+                           classify_line, MSG_OK, MSG_READY_CALIBRATION, MSG_HOMING_COMPLETE, MSG_ERROR,
+                           MSG_PROTOCOL)
+from rnv3_serial import SerialLink, start_io_thread
+from rnv3_program import parse_program_file, compile_plan, last_acked_step, CycleStats
+from rnv3_kinematics import check_plan, format_issue
+from rnv3_planner import plan_trajectory, format_report
+from rnv3_binary import PROTOCOL_QUERY, PROTOCOL_VERSION, protocol_version, encode_plan, format_summary
+from rnv3_baud import BAUD_DEFAULT, BaudNegotiator, format_throughput
+
+READY_TIMEOUT_MS = 5000  # Sama dengan start_ready_calibration_check di GUI
+DTR_RESET_MS = 100  # Lama DTR dimatikan untuk mereset Arduino
+HOMING_TIMEOUT_MS = 30000  # Sama dengan homing_timer di GUI
+
+
+# Keadaan ProgramRunner.state
+STATE_MENYAMBUNG = "menyambung"
+STATE_KALIBRASI = "kalibrasi"
+STATE_BERJALAN = "berjalan"
+STATE_SINKRON = "sinkron"  # Menunggu robot lain di baris SYNC
+STATE_BERHENTI = "berhenti"  # Ctrl+C, menunggu perintah terkirim selesai
+STATE_SELESAI = "selesai"
+STATE_GAGAL = "gagal"
+
+
+class ProgramRunner(QtCore.QObject):
+    """
+    Pengganti tombol Sambungkan, Kalibrasi dan Start untuk satu port. Selesai
+    dengan memancarkan finished(kode_keluar). Beberapa runner bisa berbagi satu
+    thread I/O (`io_thread`), lihat rnv3_cell.
+    """
+
+    finished = QtCore.pyqtSignal(int)
+
+    def __init__(self, port_name, plan, loops=1, window=STREAM_WINDOW_DEFAULT, home=True, verbose=False,
+                 io_thread=None, name=None, barriers=None, binary=False, max_baud=None, parent=None):
+        super().__init__(parent)
+        self.port_name = port_name
+        self.name = name  # Awalan pesan jika beberapa robot berjalan bersama
+        self.plan = plan
+        self.langkah_akhir_siklus = last_acked_step(plan)
+        self.loops = loops  # 0 = tanpa batas
+        self.home = home
+        self.verbose = verbose
+        self.binary = binary  # Tanya firmware dengan M260 dan kirim frame biner jika didukung
+        self.protocol_version = None  # Versi frame dari balasan M260
+        self.max_baud = max_baud  # Naikkan baud sampai batas ini dengan M261, None = tetap BAUD_DEFAULT
+        self.negotiator = None
+        self.serial = None
+        self.opened_at = None
+        self.io_thread = io_thread
+        self.state = STATE_MENYAMBUNG
+        self.stream_window = StreamWindow(window)
+        self.ack_tracker = AckTracker()
+        self.cycle_stats = CycleStats()
+        self.current_line_index = 0
+        self.sent_cycles = 0  # Putaran yang semua barisnya sudah terkirim
+        self.streaming = False
+        self.stop_sending = False
+        self.exit_code = None
+        # Titik sinkron bersama robot lain (rnv3_cell.SyncBarriers). Tanpa ini baris
+        # SYNC hanya menunggu perintah robot ini sendiri selesai.
+        self.barriers = barriers
+        self.waiting_sync = None  # Nama SYNC yang sedang ditunggu
+
+        self.timer_ack_timeout = QtCore.QTimer(self)
+        self.timer_ack_timeout.setSingleShot(True)
+        self.timer_ack_timeout.timeout.connect(self.check_ack_timeout)
+        self.ready_timer = QtCore.QTimer(self)
+        self.ready_timer.setSingleShot(True)
+        self.ready_timer.timeout.connect(lambda: self.finish(1, "Timeout: READY CALIBRATION tidak ditemukan"))
+
+    # ------------------------------------------------------------------------------------------
+    # Sambungan dan kalibrasi
+
+    def log(self, message):
+        print(f"[{self.name}] {message}" if self.name else message)
+
+    def start(self):
+        if self.io_thread is None:
+            self.io_thread = start_io_thread(self)
+        self.serial = SerialLink(self.port_name, self.io_thread, BAUD_DEFAULT, self)
+        self.serial.lines_ready.connect(self.read_serial)
+        if not self.serial.open(QtCore.QIODevice.ReadWrite):
+            self.finish(1, f"Gagal membuka port serial {self.port_name}")
+            return
+        self.log(f"Tersambung ke: {self.port_name}")
+        self.opened_at = time.monotonic()
+        # Reset Arduino lewat DTR, sama seperti fungsi_pushButton_sambungkan. Jeda 100 ms
+        # lewat timer, bukan sleep, agar robot lain di event loop yang sama tidak ikut tertahan.
+        self.serial.setDataTerminalReady(False)
+        QtCore.QTimer.singleShot(DTR_RESET_MS, self.release_reset)
+
+    def release_reset(self):
+        if self.serial is None:
+            return
+        self.serial.setDataTerminalReady(True)
+        self.ready_timer.start(READY_TIMEOUT_MS)
+
+    def ready_calibration(self):
+        self.ready_timer.stop()
+        if self.binary:
+            # Firmware lama membalas ERROR + "ok", program tetap dikirim sebagai ASCII
+            self.write_command(PROTOCOL_QUERY, on_ok=self.negotiate_baud,
+                               on_timeout=lambda: self.finish(1, f"Timeout: {PROTOCOL_QUERY} tidak dibalas"))
+            return
+        self.negotiate_baud()
+
+    def negotiate_baud(self):
+        if not self.max_baud:
+            self.calibrate()
+            return
+        self.negotiator = BaudNegotiator(self.serial, self.write_command, self.max_baud, self,
+                                         resync=self.ack_tracker.drop_expired)
+        self.negotiator.finished.connect(self.baud_negotiated)
+        self.negotiator.start()
+
+    def baud_negotiated(self, baud):
+        self.log(self.negotiator.report)
+        self.calibrate()
+
+    def calibrate(self):
+        if not self.home:
+            self.start_program()
+            return
+        self.state = STATE_KALIBRASI
+        self.log("Kalibrasi (G28)...")
+        self.write_command("G28", HOMING_TIMEOUT_MS, on_ok=self.start_program,
+                           on_timeout=lambda: self.finish(1, "Timeout: kalibrasi tidak selesai"))
+
+    # ------------------------------------------------------------------------------------------
+    # Serial
+
+    def write_command(self, command, timeout_ms=ACK_TIMEOUT_DEFAULT, on_ok=None, on_timeout=None):
+        """ Tulis satu perintah yang dibalas 'ok', sama seperti write_command di GUI. """
+        self.serial.write(f"{command}\r\n".encode())
+        self.serial.flush()
+        self.expect_ok(command, timeout_ms, on_ok, on_timeout)
+
+    def expect_ok(self, command, timeout_ms, on_ok=None, on_timeout=None):
+        self.ack_tracker.expect(command, timeout_ms, on_ok=on_ok, on_timeout=on_timeout)
+        if not self.timer_ack_timeout.isActive():
+            self.arm_ack_timeout()
+
+    def arm_ack_timeout(self):
+        remaining = self.ack_tracker.next_deadline_ms()
+        if remaining is None:
+            self.timer_ack_timeout.stop()
+        else:
+            self.timer_ack_timeout.start(remaining)
+
+    def check_ack_timeout(self):
+        for entry in self.ack_tracker.expire():
+            self.log(f"Timeout menunggu 'ok' untuk: {entry.command}")
+            if entry.on_timeout is not None:
+                entry.on_timeout()
+        self.arm_ack_timeout()
+
+    def handle_ok(self):
+        entry = self.ack_tracker.ack()
+        self.arm_ack_timeout()
+        if entry is not None and entry.on_ok is not None:
+            entry.on_ok()
+
+    def read_serial(self):
+        if self.serial is None:
+            return
+        for stamp, line in self.serial.take_lines():
+            kind = classify_line(line)
+            if self.verbose or kind == MSG_ERROR:
+                self.log(line)
+            if self.negotiator is not None:
+                self.negotiator.handle_line(line)
+            if kind == MSG_OK:
+                self.handle_ok()
+            elif kind == MSG_READY_CALIBRATION:
+                self.ready_calibration()
+            elif kind == MSG_PROTOCOL:
+                self.protocol_version = protocol_version(line)
+            elif kind == MSG_HOMING_COMPLETE and not self.verbose:
+                self.log(line)
+
+    # ------------------------------------------------------------------------------------------
+    # Program, semantik sama dengan fill_stream_window/send_next_line di GUI
+
+    def start_program(self):
+        if self.streaming:
+            return
+        self.log(f"Menjalankan program: {len(self.plan)} langkah, "
+                 f"{self.loops if self.loops else 'tanpa batas'} putaran")
+        if self.binary:
+            if self.protocol_version == PROTOCOL_VERSION:
+                biner = encode_plan(self.plan)
+                self.log(format_summary(self.plan, biner))
+                self.plan = biner
+            else:
+                self.log("Firmware tidak mendukung protokol biner, program dikirim sebagai ASCII")
+        self.state = STATE_BERJALAN
+        self.streaming = True
+        self.current_line_index = 0
+        self.stream_window.reset()
+        self.cycle_stats.start()
+        self.fill_stream_window()
+
+    def fill_stream_window(self):
+        while self.send_next_line():
+            pass
+
+    def send_next_line(self):
+        if self.stop_sending:
+            return False
+
+        # Setelah langkah terakhir, putaran berikutnya mulai lagi dari langkah pertama
+        if self.current_line_index >= len(self.plan):
+            self.current_line_index = 0
+            self.sent_cycles += 1
+            if self.loops and self.sent_cycles >= self.loops:
+                self.stop_sending = True  # Putaran terakhir sudah terkirim semua
+                return False
+
+        step = self.plan[self.current_line_index]
+        if step.sync is not None:
+            return self.reach_sync(step)
+        if not self.stream_window.can_send(len(step.data)):
+            return False  # Tunggu 'ok' sampai buffer firmware cukup
+
+        if self.verbose:
+            self.log(f"Mengirim: {step.command} (Baris {step.row + 1})")
+        self.serial.write(step.data)
+        if step.expects_ok:
+            self.expect_ok(step.command, step.timeout_ms, on_ok=self.program_line_done,
+                           on_timeout=lambda: self.finish(1, f"Timeout: baris {step.row + 1} ({step.command})"))
+        self.serial.flush()
+        # Baris yang tidak akan dibalas 'ok' tidak menempati jendela
+        if step.expects_ok:
+            self.stream_window.push(self.current_line_index, len(step.data))
+        self.current_line_index += 1
+        return True
+
+    def reach_sync(self, step):
+        """
+        Baris SYNC: robot dianggap sampai setelah semua perintah sebelumnya dibalas 'ok'
+        (firmware membalas setelah gerakan selesai). Dipanggil lagi dari program_line_done
+        sampai jendela kosong, tanpa polling.
+        """
+        if self.stream_window.in_flight or self.waiting_sync is not None:
+            return False
+        if self.barriers is not None and not self.barriers.arrive(step.sync, self):
+            self.waiting_sync = step.sync
+            self.state = STATE_SINKRON
+            if self.verbose:
+                self.log(f"Menunggu SYNC {step.sync}")
+            return False
+        self.current_line_index += 1
+        return True
+
+    def sync_released(self):
+        """ Dipanggil SyncBarriers saat semua robot sudah sampai di titik sinkron. """
+        self.waiting_sync = None
+        if self.state == STATE_SINKRON:
+            self.state = STATE_BERJALAN
+        self.current_line_index += 1
+        self.fill_stream_window()
+
+    def program_line_done(self):
+        selesai = self.stream_window.ack()
+        if selesai == self.langkah_akhir_siklus:
+            durasi = self.cycle_stats.complete()
+            self.log(f"Siklus {self.cycle_stats.cycles} selesai dalam {durasi:.2f} s")
+            if self.loops and self.cycle_stats.cycles >= self.loops:
+                self.finish(0)
+                return
+        if self.stop_sending and not self.stream_window.in_flight:
+            self.finish(0 if not self.loops or self.cycle_stats.cycles >= self.loops else 1)
+            return
+        self.fill_stream_window()
+
+    # ------------------------------------------------------------------------------------------
+
+    def interrupt(self):
+        """ Ctrl+C: berhenti mengirim, tunggu perintah terkirim selesai. Kedua kali: keluar. """
+        if self.stop_sending or not self.streaming:
+            self.finish(1, "Dihentikan")
+            return
+        self.log("Berhenti setelah perintah yang sudah terkirim selesai (Ctrl+C lagi untuk keluar)")
+        self.state = STATE_BERHENTI
+        self.stop_sending = True
+        if not self.stream_window.in_flight:
+            self.finish(1)
+
+    def finish(self, code, message=None):
+        if self.exit_code is not None:
+            return
+        self.exit_code = code
+        self.state = STATE_SELESAI if code == 0 else STATE_GAGAL
+        if message:
+            self.log(message)
+        if self.cycle_stats.cycles:
+            self.log(self.cycle_stats.summary())
+        if self.max_baud and self.serial is not None:
+            self.log(format_throughput(self.serial, time.monotonic() - self.opened_at))
+        self.timer_ack_timeout.stop()
+        self.ready_timer.stop()
+        self.ack_tracker.clear()
+        if self.serial is not None:
+            self.serial.close()
+            self.serial = None
+        self.finished.emit(code)
+
+
+def load_plan(path, planner=False):
+    """
+    Baca dan kompilasi file program. ValueError jika program tidak bisa dijalankan.
+    Dengan planner=True gerakan panjang dipecah oleh rnv3_planner dan ringkasannya dicetak.
+    """
+    with open(path, encoding="utf-8") as f:
+        plan = compile_plan(parse_program_file(f))
+    if not plan:
+        raise ValueError("Program tidak ada.")
+    if last_acked_step(plan) is None:
+        raise ValueError("Program tidak berisi perintah G/M yang dibalas 'ok', tidak bisa dijalankan.")
+    masalah = check_plan(plan)
+    if masalah:
+        raise ValueError("Program berisi posisi yang tidak bisa dicapai robot:\n  "
+                         + "\n  ".join(format_issue(issue) for issue in masalah))
+    if planner:
+        plan, laporan = plan_trajectory(plan)
+        print(f"{path}: {format_report(laporan)}")
+    return plan
+
+
+def run_event_loop(app, interrupt, terminate):
+    """ Jalankan event loop dengan Ctrl+C -> interrupt() dan SIGTERM -> terminate(). """
+    signal.signal(signal.SIGINT, lambda *_: interrupt())
+    signal.signal(signal.SIGTERM, lambda *_: terminate())
+    # Event loop Qt tidak memberi kesempatan Python menjalankan handler sinyal tanpa timer ini
+    wake = QtCore.QTimer()
+    wake.timeout.connect(lambda: None)
+    wake.start(200)
+    return app.exec_()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan program robot RNV3 tanpa GUI")
+    parser.add_argument("program", help="File program .h yang disimpan aplikasi")
+    parser.add_argument("--port", required=True, help="Port serial, misal COM3 atau /dev/ttyUSB0")
+    parser.add_argument("--loops", type=int, default=1, help="Jumlah putaran, 0 = tanpa batas (default 1)")
+    parser.add_argument("--window", type=int, default=STREAM_WINDOW_DEFAULT,
+                        help=f"Ukuran jendela streaming (default {STREAM_WINDOW_DEFAULT})")
+    parser.add_argument("--no-home", action="store_true", help="Lewati kalibrasi G28")
+    parser.add_argument("--plan", action="store_true", help="Pecah gerakan panjang dengan rnv3_planner")
+    parser.add_argument("--binary", action="store_true",
+                        help="Kirim program sebagai frame biner jika firmware mendukung (M260)")
+    parser.add_argument("--baud", type=int, metavar="MAKS",
+                        help="Naikkan baud sampai MAKS (250000, 500000 atau 1000000) jika firmware mendukung (M261)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Tampilkan semua pesan serial")
+    args = parser.parse_args(argv)
+
+    try:
+        plan = load_plan(args.program, planner=args.plan)
+    except ValueError as e:
+        print(e)
+        return 1
+
+    app = QtCore.QCoreApplication(sys.argv[:1])
+    runner = ProgramRunner(args.port, plan, loops=max(0, args.loops), window=args.window,
+                           home=not args.no_home, verbose=args.verbose, binary=args.binary,
+                           max_baud=args.baud)
+    runner.finished.connect(app.exit)
+    QtCore.QTimer.singleShot(0, runner.start)
+    code = run_event_loop(app, runner.interrupt, lambda: runner.finish(1, "Dihentikan"))
+    return runner.exit_code if runner.exit_code is not None else code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+import time
+from collections import deque
+
+from PyQt5 import QtCore
+from PyQt5.QtSerialPort import QSerialPort
+
+from rnv3_protocol import LineFramer
+
+# I/O serial di thread terpisah dari GUI.
+# SerialWorker hidup di thread I/O dan memiliki QSerialPort, SerialLink dipakai
+# oleh GUI dengan method yang sama seperti QSerialPort (write, flush, isOpen, close).
+
+BAUD_DRAIN_MS = 100  # Batas tunggu data lama terkirim sebelum baud diganti
+
+
+class SerialWorker(QtCore.QObject):
+    """
+    Pemilik QSerialPort di thread I/O. Memotong data masuk menjadi baris,
+    memberi cap waktu, lalu menaruhnya di deque yang dibaca oleh GUI.
+    """
+
+    lines_ready = QtCore.pyqtSignal()  # Ada baris baru di deque, dipancarkan sekali per batch
+    port_lost = QtCore.pyqtSignal()  # Perangkat hilang (kabel dicabut) saat port terbuka
+
+    def __init__(self, port_name, baud_rate=QSerialPort.Baud115200):
+        super().__init__()
+        self.port_name = port_name
+        self.baud_rate = baud_rate
+        self.port = None  # Dibuat di thread I/O oleh open_port
+        self.framer = LineFramer()  # Buffer terima, hanya memindai byte yang baru datang
+        # deque.append dan deque.popleft aman dipakai dua thread tanpa lock
+        self.lines = deque()
+        self.notify_pending = False  # True selama GUI belum mengambil batch terakhir
+        self.bytes_read = 0  # Hanya ditulis thread I/O
+
+    @QtCore.pyqtSlot(result=bool)
+    def open_port(self):
+        self.port = QSerialPort(self.port_name, self)
+        self.port.setBaudRate(self.baud_rate)
+        self.port.readyRead.connect(self.read_port)
+        self.port.errorOccurred.connect(self.port_error)
+        return self.port.open(QtCore.QIODevice.ReadWrite)
+
+    def port_error(self, error):
+        if error == QSerialPort.ResourceError:
+            self.port_lost.emit()
+
+    @QtCore.pyqtSlot()
+    def close_port(self):
+        if self.port is not None:
+            if self.port.isOpen():
+                self.port.flush()
+                self.port.close()
+            self.port.deleteLater()
+            self.port = None
+        self.framer.reset()
+
+    @QtCore.pyqtSlot(bytes)
+    def write_data(self, data):
+        if self.port is not None and self.port.isOpen():
+            self.port.write(data)
+
+    @QtCore.pyqtSlot()
+    def flush_port(self):
+        if self.port is not None and self.port.isOpen():
+            self.port.flush()
+
+    @QtCore.pyqtSlot(int)
+    def set_baud(self, baud_rate):
+        """ Ganti baud setelah semua data sebelumnya terkirim dengan baud lama. """
+        self.baud_rate = baud_rate
+        if self.port is not None and self.port.isOpen():
+            self.port.flush()
+            self.port.waitForBytesWritten(BAUD_DRAIN_MS)
+            self.port.setBaudRate(baud_rate)
+
+    @QtCore.pyqtSlot(bool)
+    def set_dtr(self, enabled):
+        if self.port is not None and self.port.isOpen():
+            self.port.setDataTerminalReady(enabled)
+
+    def read_port(self):
+        """ Dipanggil readyRead di thread I/O, hanya memotong baris tanpa menyentuh GUI. """
+        stamp = time.monotonic()
+        overflows = self.framer.overflows
+        data = self.port.readAll().data()
+        self.bytes_read += len(data)
+        lines = self.framer.feed(data)
+        if self.framer.overflows != overflows:
+            print(f"Data serial tanpa akhir baris lebih dari {self.framer.max_line} byte dibuang")
+        if not lines:
+            return
+        for line in lines:
+            self.lines.append((stamp, line))
+
+        if not self.notify_pending:
+            self.notify_pending = True
+            self.lines_ready.emit()
+
+
+class SerialLink(QtCore.QObject):
+    """
+    Pengganti QSerialPort untuk GUI. Semua perintah diteruskan ke SerialWorker
+    di thread I/O, baris yang diterima diambil per batch dengan take_lines().
+    """
+
+    lines_ready = QtCore.pyqtSignal()
+    port_lost = QtCore.pyqtSignal()
+    _write_requested = QtCore.pyqtSignal(bytes)
+    _flush_requested = QtCore.pyqtSignal()
+    _dtr_requested = QtCore.pyqtSignal(bool)
+    _baud_requested = QtCore.pyqtSignal(int)
+
+    def __init__(self, port_name, io_thread, baud_rate=QSerialPort.Baud115200, parent=None):
+        super().__init__(parent)
+        self.port_name = port_name
+        self.opened = False
+        self.baud_rate = baud_rate
+        self.bytes_written = 0
+        self.worker = SerialWorker(port_name, baud_rate)
+        self.worker.moveToThread(io_thread)
+        # Sinyal lintas thread otomatis menjadi QueuedConnection, urutan tulis tetap terjaga
+        self._write_requested.connect(self.worker.write_data)
+        self._flush_requested.connect(self.worker.flush_port)
+        self._dtr_requested.connect(self.worker.set_dtr)
+        self._baud_requested.connect(self.worker.set_baud)
+        self.worker.lines_ready.connect(self.lines_ready)
+        self.worker.port_lost.connect(self.port_lost)
+
+    def open(self, mode=QtCore.QIODevice.ReadWrite):
+        self.opened = QtCore.QMetaObject.invokeMethod(
+            self.worker, "open_port", QtCore.Qt.BlockingQueuedConnection,
+            QtCore.Q_RETURN_ARG(bool))
+        return self.opened
+
+    def isOpen(self):
+        return self.opened
+
+    def write(self, data):
+        self._write_requested.emit(bytes(data))
+        self.bytes_written += len(data)
+        return len(data)
+
+    def flush(self):
+        self._flush_requested.emit()
+        return True
+
+    def setDataTerminalReady(self, enabled):
+        self._dtr_requested.emit(enabled)
+        return True
+
+    def set_baud(self, baud_rate):
+        """ Ganti baud rate, berlaku setelah data yang sudah ditulis terkirim. """
+        self.baud_rate = baud_rate
+        self._baud_requested.emit(baud_rate)
+        return True
+
+    def bytes_read(self):
+        """ Jumlah byte yang diterima sejak port dibuka. """
+        return self.worker.bytes_read if self.worker is not None else 0
+
+    def close(self):
+        """ Tutup port dan tunggu sampai thread I/O selesai menulis sisa data. """
+        if self.worker is None:
+            return
+        if self.worker.thread().isRunning():
+            QtCore.QMetaObject.invokeMethod(
+                self.worker, "close_port", QtCore.Qt.BlockingQueuedConnection)
+        else:
+            self.worker.close_port()  # Thread I/O sudah berhenti (aplikasi ditutup)
+        self.opened = False
+        self.worker.deleteLater()
+        self.worker = None
+
+    def take_lines(self):
+        """ Ambil semua baris (cap_waktu, teks) yang sudah diterima sejak pemanggilan terakhir. """
+        if self.worker is None:
+            return []
+        worker = self.worker
+        # Reset flag dulu sebelum mengosongkan deque agar tidak ada baris yang terlewat
+        worker.notify_pending = False
+        batch = []
+        while worker.lines:
+            batch.append(worker.lines.popleft())
+        return batch
+
+
+def start_io_thread(parent=None):
+    """ Buat thread I/O serial yang berhenti otomatis saat aplikasi ditutup. """
+    thread = QtCore.QThread(parent)
+    thread.setObjectName("rnv3-serial-io")
+    thread.start()
+    app = QtCore.QCoreApplication.instance()
+    if app is not None:
+        app.aboutToQuit.connect(thread.quit)
+        app.aboutToQuit.connect(thread.wait)
+    return thread
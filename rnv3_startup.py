@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+# Pengukur waktu startup aplikasi. Modul ini diimpor paling awal di
+# Ruskomponen_BOT_BLK.py sehingga waktu import PyQt5 ikut terukur.
+#
+# Laporan dicetak jika aplikasi dijalankan dengan --startup-profile atau
+# environment RNV3_STARTUP_PROFILE=1:
+#
+#     python Ruskomponen_BOT_BLK.py --startup-profile
+
+ENV_STARTUP_PROFILE = "RNV3_STARTUP_PROFILE"
+ARG_STARTUP_PROFILE = "--startup-profile"
+
+
+class StartupProfile:
+    """ Mencatat tahap-tahap startup, masing-masing dengan lama sejak tahap sebelumnya. """
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.start = clock()
+        self.last = self.start
+        self.stages = []  # (nama, ms)
+
+    def mark(self, name):
+        now = self.clock()
+        self.stages.append((name, 1000.0 * (now - self.last)))
+        self.last = now
+
+    def total_ms(self):
+        return 1000.0 * (self.last - self.start)
+
+    def report(self):
+        lebar = max((len(name) for name, _ in self.stages), default=0)
+        total = self.total_ms()
+        lines = ["Waktu startup:"]
+        for name, ms in self.stages:
+            persen = 100.0 * ms / total if total > 0 else 0.0
+            lines.append(f"  {name:<{lebar}}  {ms:7.1f} ms  {persen:5.1f}%")
+        lines.append(f"  {'total':<{lebar}}  {total:7.1f} ms")
+        return "\n".join(lines)
+
+
+def enabled(argv=None):
+    argv = sys.argv if argv is None else argv
+    return os.environ.get(ENV_STARTUP_PROFILE) == "1" or ARG_STARTUP_PROFILE in argv
+
+
+startup_profile = StartupProfile()
@@ -0,0 +1,270 @@
+# Stylesheet bersama untuk jendela utama.
+#
+# Sebelumnya setiap widget di setupUi membawa salinan stylesheet sendiri (70 string),
+# dan Qt mem-parse setiap salinan itu terpisah. Widget yang tampilannya sama sekarang
+# hanya diberi properti "gaya", dan semua aturannya ada di satu stylesheet yang
+# dipasang sekali di centralwidget sehingga di-parse sekali saja.
+#
+# Tombol yang berkedip atau berganti warna (Sambungkan, Kalibrasi, Pause, sensor
+# S1-S3, ...) juga tidak lagi memasang stylesheet baru setiap kedipan. Warnanya
+# ditentukan properti "warna", dan set_warna hanya mengganti properti itu lalu
+# mem-polish ulang widget tanpa mem-parse CSS.
+
+PROPERTI_GAYA = "gaya"
+PROPERTI_WARNA = "warna"
+
+GAYA_TOMBOL_BESAR = "tombol_besar"    # Tombol utama, font 18px (Sambungkan bisa checked)
+GAYA_TOMBOL = "tombol"                # Tombol program/daftar, font 14px
+GAYA_TOMBOL_SIMPAN = "tombol_simpan"  # Tombol simpan, border kuning
+GAYA_TOMBOL_TOGGLE = "tombol_toggle"  # Tombol checkable (gripper, LG, motor, kipas)
+GAYA_TOMBOL_SENSOR = "tombol_sensor"  # Indikator sensor S1-S3
+GAYA_SLIDER = "slider"
+GAYA_SPINBOX = "spinbox"
+GAYA_LABEL = "label"
+
+WARNA_NORMAL = ""  # Warna border bawaan gaya (hijau, ungu untuk sensor)
+WARNA_KUNING = "kuning"
+WARNA_MERAH = "merah"
+WARNA_UNGU = "ungu"
+
+_BORDER_WARNA = {
+    WARNA_KUNING: "#FFC107",
+    WARNA_MERAH: "#BF616A",
+    WARNA_UNGU: "#9575CD",
+}
+
+
+def _selector(widget_class, gaya):
+    return f'{widget_class}[{PROPERTI_GAYA}="{gaya}"]'
+
+
+def _tombol(gaya, border, font_size, checkable=False):
+    s = _selector("QPushButton", gaya)
+    sheet = f"""
+{s} {{
+    background-color: #2E3440; /* Warna latar belakang tombol */
+    color: #ECEFF4; /* Warna teks */
+    border: 2px solid {border}; /* Warna border */
+    border-radius: 5px; /* Sudut tombol yang melengkung */
+    padding: 5px; /* Padding di dalam tombol */
+    font-size: {font_size}; /* Ukuran font */
+    font-weight: bold; /* Ketebalan font */
+}}
+"""
+    if gaya != GAYA_TOMBOL_SENSOR:
+        # Sebelum hover/ditekan/disabled supaya keadaan itu tetap menimpa warna border
+        for warna, border_warna in _BORDER_WARNA.items():
+            sheet += f"""
+{s}[{PROPERTI_WARNA}="{warna}"] {{
+    border: 2px solid {border_warna}; /* Warna border */
+}}
+"""
+        # Indikator sensor tidak punya efek hover/ditekan
+        sheet += f"""
+{s}:hover {{
+    background-color: #4C566A; /* Warna latar belakang saat hover */
+    border: 2px solid #81A1C1; /* Warna border saat hover */
+}}
+
+{s}:pressed {{
+    background-color: #81A1C1; /* Warna latar belakang saat ditekan */
+    border: 2px solid #81A1C1; /* Warna border saat ditekan */
+    color: #2E3440; /* Warna teks saat ditekan */
+}}
+"""
+    if checkable:
+        sheet += f"""
+{s}:checked {{
+    background-color: #81A1C1; /* Warna latar belakang saat tombol dalam keadaan aktif (checked) */
+    border: 2px solid #88C0D0; /* Warna border saat tombol dalam keadaan aktif */
+    color: #2E3440; /* Warna teks saat tombol dalam keadaan aktif */
+}}
+
+{s}:checked:hover {{
+    background-color: #4C566A; /* Warna latar belakang saat tombol checked dan hover */
+    border: 2px solid #81A1C1; /* Warna border saat tombol checked dan hover */
+    color: #2E3440; /* Warna teks saat tombol checked dan hover */
+}}
+"""
+    sheet += f"""
+{s}:disabled {{
+    background-color: #3B4252; /* Warna latar belakang saat tombol dinonaktifkan */
+    color: #7F8C9A; /* Warna teks saat tombol dinonaktifkan */
+    border: 2px solid #3B4252; /* Warna border saat tombol dinonaktifkan */
+}}
+"""
+    if gaya == GAYA_TOMBOL_SENSOR:
+        # Indikator sensor selalu disabled, setelah ada status ON/OFF dari robot
+        # warnanya ditampilkan penuh, tidak abu-abu
+        for warna, border_warna in _BORDER_WARNA.items():
+            sheet += f"""
+{s}[{PROPERTI_WARNA}="{warna}"] {{
+    background-color: #2E3440; /* Warna latar belakang tombol */
+    color: #ECEFF4; /* Warna teks */
+    border: 2px solid {border_warna}; /* Warna border */
+}}
+"""
+    return sheet
+
+
+def _slider():
+    s = _selector("QSlider", GAYA_SLIDER)
+    return f"""
+{s} {{
+    background-color: #2E2E2E; /* Latar belakang slider */
+    border-radius: 12px; /* Membuat sudut melengkung pada slider */
+    height: 30px; /* Menambah tinggi keseluruhan slider untuk membuatnya lebih tebal */
+}}
+
+{s}::groove:horizontal {{
+    border: 1px solid #666; /* Border untuk jalur slider */
+    background: #3A3A3A; /* Latar belakang jalur slider */
+    height: 15px; /* Membuat jalur slider lebih tebal */
+    border-radius: 8px; /* Sudut melengkung pada jalur */
+}}
+
+{s}::handle:horizontal {{
+    background: #4CAF50; /* Warna handle (knob) */
+    border: 2px solid #388E3C; /* Border di sekitar handle */
+    width: 25px; /* Lebar handle lebih besar */
+    height: 15px; /* Tinggi handle lebih besar */
+    border-radius: 12.5px; /* Sudut melengkung pada handle untuk membuatnya bulat */
+    margin: -6px 0; /* Membuat handle lebih besar dari jalur */
+}}
+
+{s}::sub-page:horizontal {{
+    background: #1B5E20; /* Warna bagian yang sudah terisi */
+    border-radius: 8px; /* Sudut melengkung */
+}}
+
+{s}::add-page:horizontal {{
+    background: #757575; /* Warna bagian yang belum terisi */
+    border-radius: 8px; /* Sudut melengkung */
+}}
+
+/* Warna saat dinonaktifkan (disabled) */
+{s}:disabled {{
+    background-color: #4A4A4A; /* Latar belakang slider yang lebih gelap */
+}}
+
+{s}::groove:horizontal:disabled {{
+    background: #6D6D6D; /* Warna groove abu-abu saat dinonaktifkan */
+    border: 1px solid #808080; /* Border groove lebih cerah */
+}}
+
+{s}::handle:horizontal:disabled {{
+    background: #A0A0A0; /* Warna handle abu-abu */
+    border: 2px solid #888888; /* Border handle abu-abu */
+}}
+
+{s}::sub-page:horizontal:disabled {{
+    background: #808080; /* Warna bagian yang sudah terisi saat dinonaktifkan */
+}}
+
+{s}::add-page:horizontal:disabled {{
+    background: #C0C0C0; /* Warna bagian yang belum terisi saat dinonaktifkan */
+}}
+"""
+
+
+def _spinbox():
+    s = _selector("QDoubleSpinBox", GAYA_SPINBOX)
+    return f"""
+{s} {{
+    background-color: #3B4252; /* Warna latar belakang */
+    color: #D8DEE9; /* Warna teks */
+    border: 2px solid #1B5E20; /* Warna border */
+    border-radius: 4px; /* Sudut melengkung dikurangi */
+    font-size: 18px; /* Ukuran font lebih kecil */
+    font-weight: bold;
+    padding: 2px 4px; /* Padding dalam dikurangi */
+    selection-background-color: #81A1C1;
+    selection-color: #2E3440;
+    min-height: 25px; /* Tinggi minimal */
+    min-width: 60px;  /* Lebar minimal */
+}}
+
+/* Efek hover */
+{s}:hover {{
+    border: 2px solid #81A1C1;
+}}
+
+/* Efek saat aktif (focus) */
+{s}:focus {{
+    border: 2px solid #88C0D0;
+    background-color: #434C5E;
+}}
+
+/* Nilai di luar jangkauan robot (set_warna) */
+{s}[{PROPERTI_WARNA}="{WARNA_MERAH}"] {{
+    border: 2px solid {_BORDER_WARNA[WARNA_MERAH]};
+}}
+
+/* Saat dinonaktifkan */
+{s}:disabled {{
+    background-color: #3B4252;
+    color: #7F8C9A;
+    border: 2px solid #3B4252;
+}}
+
+/* Gaya tombol panah saat ditekan */
+{s}::up-button:pressed, {s}::down-button:pressed {{
+    background-color: #4C566A;
+}}
+
+/* Menyesuaikan ukuran tombol panah */
+{s}::up-button, {s}::down-button {{
+    width: 30px;  /* Lebar tombol panah */
+    height: 14px; /* Tinggi tombol panah */
+}}
+"""
+
+
+def _label():
+    s = _selector("QLabel", GAYA_LABEL)
+    return f"""
+{s} {{
+    color: #00FF00; /* Warna teks hijau */
+}}
+{s}:disabled {{
+    color: #5C677D; /* Warna teks item saat dinonaktifkan */
+}}
+"""
+
+
+# Dibangun sekali saat modul diimpor
+STYLESHEET_UTAMA = "".join((
+    """
+QWidget#centralwidget {
+    background-color: #2B2B2B; /* Latar belakang hitam keabu-abuan */
+}
+""",
+    _tombol(GAYA_TOMBOL_BESAR, "#1B5E20", "18px", checkable=True),
+    _tombol(GAYA_TOMBOL, "#1B5E20", "14px"),
+    _tombol(GAYA_TOMBOL_SIMPAN, "#FFC107", "14px"),
+    _tombol(GAYA_TOMBOL_TOGGLE, "#1B5E20", "14px", checkable=True),
+    _tombol(GAYA_TOMBOL_SENSOR, "#9575CD", "14px"),
+    _slider(),
+    _spinbox(),
+    _label(),
+))
+
+
+def set_gaya(widget, gaya):
+    """ Pakai aturan STYLESHEET_UTAMA untuk widget ini. """
+    widget.setProperty(PROPERTI_GAYA, gaya)
+
+
+def set_warna(widget, warna):
+    """
+    Ganti warna border tombol atau spinbox (WARNA_NORMAL, WARNA_KUNING, ...). Qt tidak
+    menghitung ulang gaya saat properti dinamis berubah, jadi widget di-polish
+    ulang di sini. Tidak melakukan apa-apa jika warnanya sudah sama.
+    """
+    if (widget.property(PROPERTI_WARNA) or WARNA_NORMAL) == warna:
+        return
+    widget.setProperty(PROPERTI_WARNA, warna)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    widget.update()
@@ -11,16 +11,18 @@ Command::Command() {
   new_command.valueE = NAN;
   new_command.valueS = 0;
   message = "";
+  frameIndex = -1;
   isRelativeCoord = false;
 }
 
 bool Command::handleGcode() {
-  if (Serial.available()) {
+  if (frameIndex < 0 && Serial.available()) {
     char c = Serial.read();
-    if (c == '\n') {
+    if ((uint8_t)c == FRAME_START) {
+      frameIndex = 0;  // Byte 0xA5 tidak pernah ada di teks G-code
+    } else if (c == '\n') {
        return false; 
-    }
-    if (c == '\r') {
+    } else if (c == '\r') {
        bool success = processMessage(message);
        message = "";
        return success;  // Hanya kembalikan status, tidak kirim "ok" di sini
@@ -28,9 +30,77 @@ bool Command::handleGcode() {
        message += c; 
     }
   }
+
+  // Frame biner: semua byte yang sudah ada di buffer dibaca sekaligus,
+  // tidak satu karakter per loop seperti baris teks
+  while (frameIndex >= 0 && Serial.available()) {
+    frame[frameIndex++] = Serial.read();
+    if (frameIndex == 1 && (frame[0] < FRAME_MIN_PAYLOAD || frame[0] > FRAME_MAX_PAYLOAD)) {
+      frameIndex = -1;
+      Logger::logERROR("FRAME LENGTH");
+      return false;
+    }
+    if (frameIndex == frame[0] + 2) {
+      frameIndex = -1;
+      return processFrame();
+    }
+  }
   return false;
 }
 
+// Dipanggil setelah pindah baud: sisa baris atau frame dari baud lama dibuang
+void Command::clearMessage() {
+  message = "";
+  frameIndex = -1;
+}
+
+bool Command::processFrame() {
+  int length = frame[0];
+  if (crc8(frame, length + 1) != frame[length + 1]) {
+    Logger::logERROR("FRAME CRC");
+    return false;
+  }
+  uint16_t code = frame[1] | ((uint16_t)frame[2] << 8);
+  uint8_t mask = frame[3];
+  int fields = 0;
+  for (int i = 0; i < FRAME_FIELDS; i++) {
+    if (mask & (1 << i)) fields++;
+  }
+  if (length != FRAME_MIN_PAYLOAD + 3 * fields) {
+    Logger::logERROR("FRAME LENGTH");
+    return false;
+  }
+
+  // Sama dengan processMessage: sumbu yang tidak dikirim NAN, F dan S 0, A dan B tetap
+  new_command.id = (code & 0x8000) ? 'M' : 'G';
+  new_command.num = code & 0x7FFF;
+  new_command.valueX = NAN; 
+  new_command.valueY = NAN;
+  new_command.valueZ = NAN;
+  new_command.valueE = NAN;
+  new_command.valueF = 0;
+  new_command.valueS = 0;
+
+  int index = 4;
+  for (int i = 0; i < FRAME_FIELDS; i++) {
+    if (!(mask & (1 << i))) continue;
+    int32_t raw = (int32_t)frame[index] | ((int32_t)frame[index + 1] << 8) | ((int32_t)frame[index + 2] << 16);
+    if (raw & 0x800000L) raw |= 0xFF000000L;  // int24 bertanda
+    index += 3;
+    switch (i) {
+      case 0: new_command.valueX = raw / 100.0; break;
+      case 1: new_command.valueY = raw / 100.0; break;
+      case 2: new_command.valueZ = raw / 100.0; break;
+      case 3: new_command.valueE = raw / 100.0; break;
+      case 4: new_command.valueF = raw / 100.0; break;
+      case 5: new_command.valueS = raw / 1000.0; break;
+      case 6: new_command.valueA = raw / 100.0; break;
+      case 7: new_command.valueB = raw / 100.0; break;
+    }
+  }
+  return true;
+}
+
 
 bool Command::processMessage(String msg){
 
@@ -151,3 +221,15 @@ void cmdDwell(Cmd(&cmd)){
 void printErr() {
   Logger::logERROR("COMMAND NOT RECOGNIZED");
 }
+
+// CRC-8 polinomial 0x07, nilai awal 0
+uint8_t crc8(const uint8_t *data, int length) {
+  uint8_t crc = 0;
+  for (int i = 0; i < length; i++) {
+    crc ^= data[i];
+    for (int bit = 0; bit < 8; bit++) {
+      crc = (crc & 0x80) ? (crc << 1) ^ 0x07 : crc << 1;
+    }
+  }
+  return crc;
+}
@@ -4,6 +4,14 @@
 #include <Arduino.h>
 #include "interpolation.h"
 
+//FRAME BINER RINGKAS (LIHAT rnv3_binary.py DI APLIKASI)
+//  A5 | PANJANG | KODE (2 BYTE) | MASK | NILAI (3 BYTE PER BIT MASK) | CRC-8
+#define FRAME_START 0xA5
+#define FRAME_VERSION 1 // DILAPORKAN OLEH M260
+#define FRAME_FIELDS 8 // X Y Z E F S A B
+#define FRAME_MIN_PAYLOAD 3 // KODE + MASK
+#define FRAME_MAX_PAYLOAD (FRAME_MIN_PAYLOAD + 3 * FRAME_FIELDS)
+
 struct Cmd {
   char id;
   int num;
@@ -22,6 +30,8 @@ class Command {
     Command();
     bool handleGcode();
     bool processMessage(String msg);
+    bool processFrame();
+    void clearMessage();
     void value_segment(String msg_segment);
     Cmd getCmd() const;
     void cmdGetPosition(Point pos, Point pos_offset, float highRad, float lowRad, float rotRad);
@@ -32,10 +42,13 @@ class Command {
 
   private: 
     String message;
+    uint8_t frame[FRAME_MAX_PAYLOAD + 2]; // PANJANG, PAYLOAD, CRC
+    int frameIndex; // -1 JIKA TIDAK SEDANG MEMBACA FRAME
 };
 
 void cmdMove(Cmd(&cmd), Point pos, Point pos_offset, bool isRelativeCoord);
 void cmdDwell(Cmd(&cmd));
 void printErr();
+uint8_t crc8(const uint8_t *data, int length);
 
 #endif
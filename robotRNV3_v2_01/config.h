@@ -2,7 +2,9 @@
 #define CONFIG_H_
 
 //PENGATURAN SERIAL
-#define BAUD 115200
+#define BAUD 115200 // BAUD SETELAH RESET, BISA DINAIKKAN APLIKASI DENGAN M261 S<BAUD>
+#define BAUD_MAX 1000000 // BAUD TERTINGGI YANG DITERIMA M261 (250000, 500000 ATAU 1000000)
+#define BAUD_CONFIRM_MS 1000 // KEMBALI KE BAUD JIKA BAUD BARU TIDAK DIKONFIRMASI DENGAN M261
 
 //PILIHAN BOARD MCU UNTUK ROBOT
 #define BOARD_CHOICE MEGA2560
@@ -61,6 +61,12 @@ Servo servoB;
 
 static bool waitingForMotion = false;
 
+// Pindah baud (M261): baud baru dipasang setelah "ok", lalu harus dikonfirmasi
+long currentBaud = BAUD;
+long pendingBaud = 0;
+bool baudUnconfirmed = false;
+unsigned long baudSwitchTime = 0;
+
 void setup() {
   Serial.begin(BAUD);
   stepperHigher.setPositionRad(PI / 2.0); // 90°
@@ -155,9 +161,18 @@ if (waitingForMotion && interpolator.isFinished()) {
           Serial.println(PRINT_REPLY_MSG);
         }
         waitingForMotion = false;  // Reset flag setelah stepper selesai
+        if (pendingBaud) {  // "ok" M261 S<baud> sudah dikirim di baud lama
+          switchBaud(pendingBaud);
+          pendingBaud = 0;
+        }
     }
 }
 
+// Kembali ke BAUD jika aplikasi tidak bisa mengirim konfirmasi di baud baru
+if (baudUnconfirmed && millis() - baudSwitchTime >= BAUD_CONFIRM_MS) {
+    switchBaud(BAUD);
+}
+
 // Kirim "ok" setelah servo selesai bergerak
 if (waitingForServo && (millis() - servoMoveStartTime >= servoMoveDuration)) {
     waitingForServo = false;  // Reset flag setelah servo selesai
@@ -324,6 +339,22 @@ void executeCommand(Cmd cmd) {
                 lg2.cmdOff();
                 break;
     }
+
+    case 260: Logger::logINFO("PROTOCOL: [BINARY " + String(FRAME_VERSION) + "]"); break; // Versi frame biner yang diterima
+
+    case 261: {  // M261 S<baud> pindah baud setelah "ok", M261 tanpa S konfirmasi baud sekarang
+                long baud = (long)cmd.valueS;
+                if (baud == 0) {
+                  baudUnconfirmed = false;
+                  Logger::logINFO("BAUD: [" + String(currentBaud) + "]");
+                } else if (isSupportedBaud(baud)) {
+                  pendingBaud = baud;
+                  Logger::logINFO("BAUD: [" + String(baud) + "]");
+                } else {
+                  Logger::logERROR("BAUD NOT SUPPORTED");
+                }
+                break;
+    }
     
     default: printErr();
     }
@@ -333,6 +364,21 @@ void executeCommand(Cmd cmd) {
   }
 }
 
+bool isSupportedBaud(long baud) {
+  // Baud tanpa galat pembagi di ATmega2560 16 MHz (U2X), selain BAUD
+  return baud == BAUD || ((baud == 250000 || baud == 500000 || baud == 1000000) && baud <= BAUD_MAX);
+}
+
+void switchBaud(long baud) {
+  Serial.flush();  // Tunggu "ok" selesai terkirim di baud lama
+  Serial.end();
+  Serial.begin(baud);
+  command.clearMessage();
+  currentBaud = baud;
+  baudUnconfirmed = (baud != BAUD);
+  baudSwitchTime = millis();
+}
+
 void setStepperEnable(bool enable){
   stepperRotate.enable(enable);
   stepperLower.enable(enable);
@@ -0,0 +1,18 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rnv3_program import ProgramLine, compile_plan  # noqa: E402
+from rnv3_estimator import estimate_plan  # noqa: E402
+
+
+def _estimate(lines):
+    return estimate_plan(compile_plan([ProgramLine(text) for text in lines]))
+
+
+def test_gerakan_g_tanpa_nomor_sama_dengan_g0():
+    tanpa_nomor = _estimate(["G0 X0 Y217 Z138", "G X10 Y200 Z50"])
+    g0 = _estimate(["G0 X0 Y217 Z138", "G0 X10 Y200 Z50"])
+    assert tanpa_nomor.rows == g0.rows
+    assert tanpa_nomor.rows[1] > 0
@@ -0,0 +1,13 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rnv3_program import ProgramLine, compile_plan  # noqa: E402
+from rnv3_kinematics import check_plan  # noqa: E402
+
+
+def test_gerakan_g_tanpa_nomor_ikut_dicek():
+    # processMessage membaca "G X.." tanpa nomor sebagai G0
+    plan = compile_plan([ProgramLine(text) for text in ["G0 X0 Y217 Z138", "G X0 Y400 Z50"]])
+    assert 1 in [issue.row for issue in check_plan(plan, loop=False)]
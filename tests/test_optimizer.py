@@ -0,0 +1,26 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rnv3_program import ProgramLine  # noqa: E402
+from rnv3_optimizer import optimize_program  # noqa: E402
+
+
+def _optimize(lines):
+    baru, changes = optimize_program([ProgramLine(text) for text in lines])
+    return [line.text for line in baru], changes
+
+
+def test_gerakan_pertama_ke_home_dipertahankan():
+    # Posisi lengan saat Start tidak diketahui (digeser manual, atau Stop di tengah program)
+    program = ["G0 X0 Y217 Z138", "G0 X100 Y150 Z50", "VACUM ON", "G0 X0 Y217 Z138"]
+    baru, changes = _optimize(program)
+    assert baru == program
+    assert changes == []
+
+
+def test_gerakan_ke_posisi_yang_sama_di_dalam_program_dibuang():
+    baru, changes = _optimize(["G0 X0 Y217 Z57", "G0 X0 Y217 Z57", "G0 X120 Y180 Z57"])
+    assert baru == ["G0 X0 Y217 Z57", "G0 X120 Y180 Z57"]
+    assert [change.row for change in changes] == [1]
@@ -0,0 +1,23 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rnv3_program import ProgramLine, compile_plan  # noqa: E402
+from rnv3_planner import plan_trajectory  # noqa: E402
+from rnv3_estimator import estimate_plan  # noqa: E402
+
+
+def _plan(lines):
+    return compile_plan([ProgramLine(text) for text in lines])
+
+
+def test_gerakan_dengan_dwell_tidak_dipecah():
+    # G0/G1 dengan S ikut menjalankan cmdDwell di firmware, dwell-nya harus tetap ada
+    plan = _plan(["G0 X0 Y217 Z138", "G0 X-150 Y150 Z20 S2", "G0 X150 Y150 Z20", "G0 X0 Y217 Z138"])
+    baru, laporan = plan_trajectory(plan)
+
+    dwell = [step for step in baru if step.row == 1]
+    assert [step.command for step in dwell] == ["G0 X-150 Y150 Z20 S2"]
+    assert laporan.split >= 1  # Gerakan panjang lain tetap dipecah
+    assert estimate_plan(baru).rows[1] >= 2.0
@@ -0,0 +1,51 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from rnv3_protocol import ACK_TIMEOUT_DEFAULT, AckTracker, ack_timeout_ms  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_dwell_gerakan_ikut_batas_waktu():
+    # G0/G1 berlanjut ke cmdDwell di firmware, sama seperti G4
+    assert ack_timeout_ms("G1 X10 Y200 Z50 S40") == ACK_TIMEOUT_DEFAULT + 40000
+    assert ack_timeout_ms("G4 S2") == ACK_TIMEOUT_DEFAULT + 2000
+    assert ack_timeout_ms("G28 S5") == ACK_TIMEOUT_DEFAULT
+
+
+def test_ok_terlambat_tidak_menggeser_pencocokan():
+    clock = _Clock()
+    tracker = AckTracker(clock=clock)
+    hasil = []
+    tracker.expect("G0 X1", 1000, on_ok=lambda: hasil.append("ok 1"), on_late=lambda: hasil.append("late 1"))
+    tracker.expect("G0 X2", 1000, on_ok=lambda: hasil.append("ok 2"))
+
+    clock.now = 1.5
+    assert [entry.command for entry in tracker.expire()] == ["G0 X1"]
+    assert tracker.next_deadline_ms() == 1000  # Baris berikutnya mulai dihitung
+
+    for _ in range(2):
+        entry = tracker.ack()
+        entry.on_ok()
+    assert hasil == ["late 1", "ok 2"]
+    assert tracker.ack() is None
+
+
+def test_perintah_timeout_dibuang_saat_resync():
+    # Balasan di baud yang gagal tidak akan terbaca, "ok" berikutnya milik perintah baru
+    clock = _Clock()
+    tracker = AckTracker(clock=clock)
+    tracker.expect("M261", 300)
+    clock.now = 0.5
+    tracker.expire()
+    tracker.drop_expired()
+    tracker.expect("M261 S500000", 3000, on_ok="switch")
+    assert tracker.ack().on_ok == "switch"